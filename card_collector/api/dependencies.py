@@ -0,0 +1,66 @@
+"""A module providing shared dependencies for the routers."""
+
+from typing import Any, AsyncIterator, Callable
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends, Request
+
+from card_collector.container import Container
+from card_collector.infrastructure.repositories.unit_of_work import UnitOfWork
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def non_atomic(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Function marking a writing endpoint whose services commit in transactions of their own.
+
+    The request still holds one connection, but no transaction of its own, so each transaction
+    opened by the services commits and releases its locks on its own.
+
+    Args:
+        endpoint (Callable[..., Any]): The endpoint.
+
+    Returns:
+        Callable[..., Any]: The marked endpoint.
+    """
+    endpoint.non_atomic = True
+
+    return endpoint
+
+
+@inject
+def request_unit_of_work(
+        request: Request,
+        unit_of_work_factory: Callable[..., UnitOfWork] = Depends(Provide[Container.unit_of_work.provider]),
+) -> UnitOfWork:
+    """Function building the unit of work of a request.
+
+    Requests that may write run in one transaction, rolled back by any exception,
+    HTTP errors included, so a request failing after a write leaves no trace.
+    Endpoints marked non_atomic are the exception.
+
+    Args:
+        request (Request): The request.
+        unit_of_work_factory (Callable[..., UnitOfWork]): The injected unit of work factory.
+
+    Returns:
+        UnitOfWork: The unit of work of the request.
+    """
+    atomic = request.method not in SAFE_METHODS and not getattr(request.scope.get("endpoint"), "non_atomic", False)
+
+    return unit_of_work_factory(atomic=atomic)
+
+
+async def unit_of_work(
+        work: UnitOfWork = Depends(request_unit_of_work),
+) -> AsyncIterator[UnitOfWork]:
+    """Function holding one connection and transaction for the whole request.
+
+    Args:
+        work (UnitOfWork): The unit of work of the request.
+
+    Yields:
+        UnitOfWork: The open unit of work.
+    """
+    async with work:
+        yield work
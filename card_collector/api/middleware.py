@@ -0,0 +1,157 @@
+"""A module providing the ASGI middleware of the app."""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, MutableMapping
+
+from starlette.datastructures import MutableHeaders
+
+from card_collector.config import config
+from card_collector.metrics import (
+    HTTP_REQUEST_DB_DURATION,
+    HTTP_REQUEST_DB_STATEMENTS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUEST_REPOSITORY_CALLS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    N_PLUS_ONE_REQUESTS,
+)
+from card_collector.call_tracking import notify, track
+
+logger = logging.getLogger(__name__)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# The route label of requests no route matched, so unknown paths do not each make a series.
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_labels(scope: Scope) -> Dict[str, str]:
+    """Function labelling a request with the path template of its matched route and its router.
+
+    Args:
+        scope (Scope): The connection scope, filled with the route by the router.
+
+    Returns:
+        Dict[str, str]: The router, the first segment of the template, and the route.
+    """
+    route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+    router = route.strip("/").split("/")[0] if route != UNMATCHED_ROUTE else UNMATCHED_ROUTE
+
+    return {"router": router, "route": route}
+
+
+class MetricsMiddleware:
+    """An ASGI middleware recording the latency of HTTP requests and the requests in flight.
+
+    Requests are labelled with the path template of the matched route, e.g. /card/{card_id},
+    and its router, the first segment of the template. The router fills the route in the
+    scope shared with this middleware while it handles the request.
+    """
+
+    app: ASGIApp
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped app.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method timing an HTTP request until its response is sent.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.inc(-1)
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                **route_labels(scope),
+                method=scope["method"],
+                status=str(status),
+            )
+
+
+class CallTrackingMiddleware:
+    """An ASGI middleware counting the repository calls and SQL statements of each HTTP request.
+
+    The count and the time of the calls and statements made before the response starts are
+    sent in Server-Timing headers, e.g. repository;dur=4.2;desc="3 repository calls" and
+    db;dur=3.1;desc="4 statements". Once the response is sent, both are recorded in the
+    metrics, and a call shape repeated N_PLUS_ONE_THRESHOLD times or more is logged as a
+    warning of an N+1 pattern.
+    """
+
+    app: ASGIApp
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped app.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method tracking the repository calls and statements of an HTTP request.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track() as calls:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start" and config.SERVER_TIMING:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f"repository;dur={calls.seconds * 1000:.1f};desc=\"{calls.count} repository calls\"",
+                    )
+                    headers.append(
+                        "Server-Timing",
+                        f"db;dur={calls.statement_seconds * 1000:.1f};desc=\"{calls.statements} statements\"",
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                labels = route_labels(scope)
+                HTTP_REQUEST_REPOSITORY_CALLS.observe(calls.count, **labels)
+                HTTP_REQUEST_DB_STATEMENTS.observe(calls.statements, **labels)
+                HTTP_REQUEST_DB_DURATION.observe(calls.statement_seconds, **labels)
+                route = f"{scope['method']} {labels['route']}"
+                if repeated := calls.repeated(config.N_PLUS_ONE_THRESHOLD):
+                    for shape in repeated:
+                        N_PLUS_ONE_REQUESTS.inc(route=labels["route"], shape=shape)
+                    logger.warning("N+1 repository calls in %s: %s", route, calls.summary())
+                notify(route, calls)
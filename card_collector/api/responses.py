@@ -0,0 +1,156 @@
+"""A module providing shared response helpers for the routers."""
+
+from functools import lru_cache
+from typing import Any, AsyncIterator, List, Mapping, Type
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from card_collector.config import config
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, pydantic-core encodes without it.
+    orjson = None
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_CHUNK_SIZE = 500
+JSON_MEDIA_TYPE = "application/json"
+
+
+async def _ndjson_lines(models: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """Function encoding models as newline delimited JSON, a chunk of lines at a time.
+
+    Args:
+        models (AsyncIterator[BaseModel]): The models to encode.
+
+    Yields:
+        bytes: Chunks of encoded lines.
+    """
+    lines = []
+    async for model in models:
+        lines.append(model.model_dump_json())
+        if len(lines) >= NDJSON_CHUNK_SIZE:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def ndjson_response(models: AsyncIterator[BaseModel]) -> StreamingResponse:
+    """Function streaming models as newline delimited JSON, so memory stays constant.
+
+    Args:
+        models (AsyncIterator[BaseModel]): The models to stream.
+
+    Returns:
+        StreamingResponse: The streaming response.
+    """
+    return StreamingResponse(_ndjson_lines(models), media_type=NDJSON_MEDIA_TYPE)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Function building the serializer of lists of a model, once per model.
+
+    Args:
+        model (Type[BaseModel]): The model.
+
+    Returns:
+        TypeAdapter: The adapter of lists of the model.
+    """
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def _encode_default(value: Any) -> Any:
+    """Function converting the values the JSON encoders do not know to plain data.
+
+    Args:
+        value (Any): The value, a model or a DB record.
+
+    Returns:
+        Any: The plain data.
+
+    Raises:
+        TypeError: If the value cannot be converted.
+    """
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    if isinstance(value, Mapping):
+        return dict(value)
+
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def encode_json(content: Any) -> bytes:
+    """Function encoding models, DB records and plain data straight to JSON bytes.
+
+    The domain models are flat and without aliases or custom serializers, so the
+    fields in their __dict__ are exactly their JSON, which orjson encodes without
+    going through model_dump. orjson hands models to _encode_default itself, so
+    no item of a list is type-checked in Python.
+
+    Args:
+        content (Any): The content.
+
+    Returns:
+        bytes: The JSON bytes.
+    """
+    if orjson is None:
+        return to_json(content, fallback=_encode_default)
+
+    return orjson.dumps(content, default=_encode_default)
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSON response encoded with orjson when it is installed, and with pydantic-core otherwise."""
+
+    def render(self, content: Any) -> bytes:
+        """Function encoding the content of the response.
+
+        Args:
+            content (Any): The content.
+
+        Returns:
+            bytes: The body.
+        """
+        return encode_json(content)
+
+
+def json_list_response(model: Type[BaseModel], models: List[BaseModel]) -> Response:
+    """Function serializing a list of models from trusted repository code to JSON bytes in one pass.
+
+    Returning a response skips the validation of the returned list against the
+    response_model, which only re-checks models hydrated from the database. With
+    orjson every item is known to be a model, so the fields are taken from the
+    __dict__ of each without checking its type.
+
+    Args:
+        model (Type[BaseModel]): The model of the list.
+        models (List[BaseModel]): The models to serialize.
+
+    Returns:
+        Response: The JSON response.
+    """
+    if orjson is None or not config.FAST_JSON_RESPONSES:
+        return Response(content=_list_adapter(model).dump_json(models), media_type=JSON_MEDIA_TYPE)
+
+    return Response(
+        content=orjson.dumps([item.__dict__ for item in models], default=_encode_default),
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+def set_next_cursor(response: Response, page: list, limit: int | None) -> None:
+    """Function exposing the cursor of the next page in the X-Next-After header.
+
+    Args:
+        response (Response): The response of the endpoint.
+        page (list): The models of the current page.
+        limit (int | None): The requested page size.
+    """
+    if limit is not None and page and len(page) >= limit:
+        response.headers["X-Next-After"] = str(page[-1].id)
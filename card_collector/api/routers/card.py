@@ -1,16 +1,16 @@
 from typing import List
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
+from card_collector.api.dependencies import unit_of_work
+from card_collector.api.responses import json_list_response, ndjson_response, set_next_cursor
 from card_collector.container import Container
 from card_collector.core.domains.card import Card, CardIn
 from card_collector.core.services.i_card_service import ICardService
-from card_collector.core.services.i_quest_service import IQuestService
-from card_collector.core.services.i_trade_offer_service import ITradeOfferService
-from card_collector.core.services.i_profile_collection_service import IProfileCollectionService
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(unit_of_work)])
 
 @router.post("/create", response_model=Card, status_code=201)
 @inject
@@ -38,31 +38,86 @@ async def create_card(
     raise HTTPException(status_code=409, detail="Card with this name already exists")
 
 
+@router.post("/bulk", response_model=List[Card], status_code=201)
+@inject
+async def create_cards(
+        cards: List[CardIn],
+        service: ICardService = Depends(Provide[Container.card_service]),
+) -> List:
+    """
+    An endpoint for adding many cards at once, e.g. by import jobs.
+
+    Args:
+        cards (List[CardIn]): The cards data.
+        service (ICardService): The injected service dependency.
+
+    Returns:
+        List: The new cards attributes.
+
+    Raises:
+        HTTPException: 409 if any card already exists or a name is repeated.
+    """
+    names = [card.name for card in cards]
+    if len(set(names)) != len(names):
+        raise HTTPException(status_code=409, detail="Cards with the same name in the request")
+    if existing := await service.get_by_names(names):
+        raise HTTPException(status_code=409, detail=f"Card with name {existing[0].name} already exists")
+
+    return await service.add_many(cards)
+
+
 @router.get("/all", response_model=List[Card], status_code=200)
 @inject
 async def get_all_cards(
+        limit: int | None = Query(default=None, gt=0),
+        after: int | None = None,
         service: ICardService = Depends(Provide[Container.card_service]),
-) -> List:
+) -> Response:
     """
-    An endpoint for getting all cards.
+    An endpoint for getting all cards, or a page of them when a limit is given.
+        Pages are ordered by id and the next one starts after the id in the X-Next-After header.
 
     Args:
+        limit (int | None): The maximal number of cards. Defaults to None (all).
+        after (int | None): The id after which the page starts. Defaults to None.
         service (ICardService): The injected service dependency.
 
     Returns:
-        List: The card attributes collection.
+        Response: The card attributes collection as JSON.
     """
 
-    cards = await service.get_all()
+    if limit is None:
+        return json_list_response(Card, await service.get_all())
+
+    cards = await service.get_page(limit, after)
+    response = json_list_response(Card, cards)
+    set_next_cursor(response, cards, limit)
 
-    return cards
+    return response
+
+@router.get("/all/stream", status_code=200)
+@inject
+async def stream_all_cards(
+        service: ICardService = Depends(Provide[Container.card_service]),
+) -> StreamingResponse:
+    """
+    An endpoint for streaming all cards as newline delimited JSON.
+
+    Args:
+        service (ICardService): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The card attributes, one per line.
+    """
+
+    return ndjson_response(service.iterate())
 
 @router.get("/all/{rarity_id}", response_model=List[Card], status_code=200)
 @inject
 async def get_all_by_rarity(
         rarity_id: int,
         service: ICardService = Depends(Provide[Container.card_service]),
-) -> List:
+) -> Response:
     """
     An endpoint for getting all cards by rarity.
 
@@ -71,7 +126,7 @@ async def get_all_by_rarity(
         service (ICardService): The injected service dependency.
 
     Returns:
-        List: The cards attributes collection.
+        Response: The cards attributes collection as JSON.
 
     Raises:
         HTTPException: 404 if card does not exist.
@@ -79,7 +134,7 @@ async def get_all_by_rarity(
 
     cards = await service.get_all_by_rarity(rarity_id)
     if cards:
-        return cards
+        return json_list_response(Card, cards)
     raise HTTPException(status_code=404, detail="No cards found with given rarity")
 
 
@@ -142,9 +197,6 @@ async def update_card(
 async def delete_card(
         card_id: int,
         service: ICardService = Depends(Provide[Container.card_service]),
-        quest_service: IQuestService = Depends(Provide[Container.quest_service]),
-        trade_offer_service: ITradeOfferService = Depends(Provide[Container.trade_offer_service]),
-        profile_collection_service: IProfileCollectionService = Depends(Provide[Container.profile_collection_service])
 ) -> None:
     """
     An endpoint for deleting card.
@@ -152,9 +204,6 @@ async def delete_card(
     Args:
         card_id (int): The id of the card.
         service (ICardService): The injected service dependency.
-        quest_service (IQuestService): The Injected quest service dependency.
-        trade_offer_service (ITradeOfferService): The injected trade offer dependency.
-        profile_collection_service (IProfileCollectionService): The injected profile collection service.
 
     Raises:
         HTTPException: 404 if card does not exist.
@@ -162,9 +211,10 @@ async def delete_card(
     """
 
     if await service.get_by_id(card_id=card_id):
-        if not await profile_collection_service.get_all_by_card_id(card_id):
-            if not await trade_offer_service.get_all_by_card_wanted(card_id):
-                if not await quest_service.get_all_by_reward(card_id):
+        references = await service.has_references(card_id)
+        if not references.profile_collection:
+            if not references.trade_offer:
+                if not references.quest:
                     await service.delete_card(card_id)
                     return
                 raise HTTPException(status_code=409, detail="Can't delete card that's a current quest's reward")
@@ -178,7 +228,7 @@ async def get_random_cards_by_rarity(
         amount: int,
         rarity_id: int,
         service: ICardService = Depends(Provide[Container.card_service]),
-) -> List | None:
+) -> Response:
     """
     An endpoint for getting random card by rarity id.
 
@@ -188,13 +238,13 @@ async def get_random_cards_by_rarity(
         service (ICardService): The injected service dependency.
 
     Returns:
-        dict | None: The card details.
+        Response: The random cards as JSON.
 
     Raises:
         HTTPException: 404 if rarity does not exist.
     """
-    if await get_all_by_rarity(rarity_id):
-        return await service.get_random_cards_by_rarity(amount, rarity_id)
+    if await service.get_all_by_rarity(rarity_id):
+        return json_list_response(Card, await service.get_random_cards_by_rarity(amount, rarity_id))
 
     raise HTTPException(status_code=404, detail="Rarity not found")
 
@@ -203,7 +253,7 @@ async def get_random_cards_by_rarity(
 async def get_random_cards(
         amount: int,
         service: ICardService = Depends(Provide[Container.card_service]),
-) -> List | None:
+) -> Response:
     """
     An endpoint for getting random cards.
 
@@ -212,6 +262,6 @@ async def get_random_cards(
         service (ICardService): The injected service dependency.
 
     Returns:
-        List: The cards attributes collection.
+        Response: The cards attributes collection as JSON.
     """
-    return await service.get_random_cards(amount)
+    return json_list_response(Card, await service.get_random_cards(amount))
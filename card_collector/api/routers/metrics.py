@@ -0,0 +1,46 @@
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Response
+
+from card_collector.container import Container
+from card_collector.db import pool_connections
+from card_collector.infrastructure.repositories.cached_card_repository import CachedCardRepository
+from card_collector.infrastructure.repositories.statement_registry import statements
+from card_collector.metrics import (
+    CARD_CACHE_HIT_RATIO,
+    CARD_CACHE_READS,
+    DB_POOL_CONNECTIONS,
+    DB_STATEMENT_CALLS,
+    DB_STATEMENT_SECONDS,
+    PROMETHEUS_MEDIA_TYPE,
+    metrics,
+)
+
+# No unit of work: a scrape must not wait for a pool connection it does not need.
+router = APIRouter()
+
+@router.get("/metrics", include_in_schema=False)
+@inject
+async def get_metrics(
+        card_repository: CachedCardRepository = Depends(Provide[Container.card_repository]),
+) -> Response:
+    """
+    An endpoint for scraping the metrics of the worker in the Prometheus text format.
+        Totals counted elsewhere (card cache, registered statements, pool) are copied at scrape time.
+
+    Args:
+        card_repository (CachedCardRepository): The injected card repository dependency.
+
+    Returns:
+        Response: The metrics exposition.
+    """
+
+    CARD_CACHE_READS.set_total(card_repository.hits, result="hit")
+    CARD_CACHE_READS.set_total(card_repository.misses, result="miss")
+    CARD_CACHE_HIT_RATIO.set(card_repository.hit_ratio)
+    for stats in statements.stats():
+        DB_STATEMENT_CALLS.set_total(stats["calls"], statement=stats["name"])
+        DB_STATEMENT_SECONDS.set_total(stats["total_ms"] / 1000, statement=stats["name"])
+    for state, count in pool_connections().items():
+        DB_POOL_CONNECTIONS.set(count, state=state)
+
+    return Response(metrics.render(), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -1,14 +1,20 @@
+import logging
 from typing import List
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
+from card_collector.api.dependencies import unit_of_work
+from card_collector.api.responses import json_list_response, ndjson_response, set_next_cursor
 from card_collector.container import Container
 from card_collector.core.domains.card import Card
 from card_collector.core.domains.profile import Profile, ProfileIn
 from card_collector.core.services.i_profile_service import IProfileService
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(dependencies=[Depends(unit_of_work)])
 
 @router.post("/create", response_model=Profile, status_code=201)
 @inject
@@ -34,21 +40,48 @@ async def create_profile(
 @router.get("/all", response_model=List[Profile], status_code=200)
 @inject
 async def get_all_profiles(
+        limit: int | None = Query(default=None, gt=0),
+        after: int | None = None,
         service: IProfileService = Depends(Provide[Container.profile_service]),
-) -> List:
+) -> Response:
     """
-    An endpoint for getting all profiles.
+    An endpoint for getting all profiles, or a page of them when a limit is given.
+        Pages are ordered by id and the next one starts after the id in the X-Next-After header.
 
     Args:
+        limit (int | None): The maximal number of profiles. Defaults to None (all).
+        after (int | None): The id after which the page starts. Defaults to None.
         service (IProfileService): The injected service dependency.
 
     Returns:
-        List: The profile attributes collection.
+        Response: The profile attributes collection as JSON.
     """
 
-    profiles = await service.get_all()
+    if limit is None:
+        return json_list_response(Profile, await service.get_all())
+
+    profiles = await service.get_page(limit, after)
+    response = json_list_response(Profile, profiles)
+    set_next_cursor(response, profiles, limit)
 
-    return profiles
+    return response
+
+@router.get("/all/stream", status_code=200)
+@inject
+async def stream_all_profiles(
+        service: IProfileService = Depends(Provide[Container.profile_service]),
+) -> StreamingResponse:
+    """
+    An endpoint for streaming all profiles as newline delimited JSON.
+
+    Args:
+        service (IProfileService): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The profile attributes, one per line.
+    """
+
+    return ndjson_response(service.iterate())
 
 @router.get("/{profile_id}",response_model=Profile,status_code=200,)
 @inject
@@ -112,7 +145,8 @@ async def delete_profile(
         service: IProfileService = Depends(Provide[Container.profile_service]),
 ) -> None:
     """
-    An endpoint for deleting profiles.
+    An endpoint for deleting profiles together with their collections, trade offers and quests.
+        The number of removed rows per table is logged at INFO.
 
     Args:
         profile_id (int): The id of the profile.
@@ -122,9 +156,11 @@ async def delete_profile(
         HTTPException: 404 if profile does not exist.
     """
 
-    if await service.get_by_id(profile_id=profile_id):
-        await service.delete_profile(profile_id)
-
+    if deletion := await service.delete_profile(profile_id):
+        logger.info(
+            "Deleted profile %s with %s profile collections, %s trade offers and %s quests",
+            profile_id, deletion.profile_collection, deletion.trade_offer, deletion.quest,
+        )
         return
 
     raise HTTPException(status_code=404, detail="Profile not found")
@@ -1,23 +1,36 @@
 from typing import List
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
+from card_collector.api.dependencies import unit_of_work
+from card_collector.api.responses import json_list_response, ndjson_response, set_next_cursor
 from card_collector.container import Container
-from card_collector.core.domains.profile_collection import ProfileCollection, ProfileCollectionIn
+from card_collector.core.domains.profile_collection import (
+    NotLastCopyError,
+    ProfileCardCount,
+    ProfileCollection,
+    ProfileCollectionIn,
+)
+from card_collector.core.domains.reference import Reference, ReferenceKind
 from card_collector.core.services.i_profile_collection_service import IProfileCollectionService
-from card_collector.core.services.i_card_service import ICardService
 from card_collector.core.services.i_profile_service import IProfileService
+from card_collector.core.services.i_validation_service import IValidationService
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(unit_of_work)])
+
+MISSING_DETAILS = {
+    ReferenceKind.CARD: "Card not found",
+    ReferenceKind.PROFILE: "Profile not found",
+}
 
 @router.post("/create", response_model=ProfileCollection, status_code=201)
 @inject
 async def add_card_to_profile(
         profile_collection: ProfileCollectionIn,
         service: IProfileCollectionService = Depends(Provide[Container.profile_collection_service]),
-        card_service: ICardService = Depends(Provide[Container.card_service]),
-        profile_service: IProfileService = Depends(Provide[Container.profile_service]),
+        validation_service: IValidationService = Depends(Provide[Container.validation_service]),
 ) -> dict:
     """
     An endpoint for adding cards to profile, therefore making a profile collection.
@@ -25,8 +38,7 @@ async def add_card_to_profile(
     Args:
         profile_collection (ProfileCollectionIn): The profile_collection details.
         service (IProfileCollectionService): The injected service dependency.
-        card_service (ICardService): The injected card service dependency.
-        profile_service (IProfileService): The injected profile service dependency.
+        validation_service (IValidationService): The injected validation service dependency.
 
     Returns:
         dict: The profile_collection details.
@@ -35,33 +47,96 @@ async def add_card_to_profile(
         HTTPException: 404 if data does not exist.
     """
 
-    if await card_service.get_by_id(profile_collection.card_id):
-        if await profile_service.get_by_id(profile_collection.profile_id):
-            new_profile_collection = await service.add_profile_collection(profile_collection)
+    missing = await validation_service.first_missing([
+        Reference.card(profile_collection.card_id),
+        Reference.profile(profile_collection.profile_id),
+    ])
+    if missing is None:
+        new_profile_collection = await service.add_profile_collection(profile_collection)
+
+        return new_profile_collection.model_dump() if new_profile_collection else {}
+
+    raise HTTPException(status_code=404, detail=MISSING_DETAILS[missing.kind])
 
-            return new_profile_collection.model_dump() if new_profile_collection else {}
 
-        raise HTTPException(status_code=404, detail="Profile not found")
-    raise HTTPException(status_code=404, detail="Card not found")
+@router.post("/bulk", response_model=List[ProfileCollection], status_code=201)
+@inject
+async def add_cards_to_profiles(
+        profile_collections: List[ProfileCollectionIn],
+        service: IProfileCollectionService = Depends(Provide[Container.profile_collection_service]),
+        validation_service: IValidationService = Depends(Provide[Container.validation_service]),
+) -> List:
+    """
+    An endpoint for adding many cards to profiles at once, e.g. by import jobs.
+        The cards, then the profiles, are checked with one query each whatever the size of the request.
+
+    Args:
+        profile_collections (List[ProfileCollectionIn]): The profile_collections details.
+        service (IProfileCollectionService): The injected service dependency.
+        validation_service (IValidationService): The injected validation service dependency.
+
+    Returns:
+        List: The profile_collections details.
+
+    Raises:
+        HTTPException: 404 if data does not exist.
+    """
+
+    missing = await validation_service.first_missing_of({
+        ReferenceKind.CARD: [profile_collection.card_id for profile_collection in profile_collections],
+        ReferenceKind.PROFILE: [profile_collection.profile_id for profile_collection in profile_collections],
+    })
+    if missing is not None:
+        raise HTTPException(status_code=404, detail=f"{missing.kind.value.capitalize()} {missing.id} not found")
+
+    return await service.add_many(profile_collections)
 
 
 @router.get("/all", response_model=List[ProfileCollection], status_code=200)
 @inject
 async def get_all_profile_collections(
+        limit: int | None = Query(default=None, gt=0),
+        after: int | None = None,
         service: IProfileCollectionService = Depends(Provide[Container.profile_collection_service]),
-) -> List:
+) -> Response:
+    """
+    An endpoint for getting all profile collections, or a page of them when a limit is given.
+        Pages are ordered by id and the next one starts after the id in the X-Next-After header.
+
+    Args:
+        limit (int | None): The maximal number of profile collections. Defaults to None (all).
+        after (int | None): The id after which the page starts. Defaults to None.
+        service (IProfileCollectionService): The injected service dependency.
+
+    Returns:
+        Response: The profile_collection attributes collection as JSON.
+    """
+
+    if limit is None:
+        return json_list_response(ProfileCollection, await service.get_all())
+
+    profile_collections = await service.get_page(limit, after)
+    response = json_list_response(ProfileCollection, profile_collections)
+    set_next_cursor(response, profile_collections, limit)
+
+    return response
+
+@router.get("/all/stream", status_code=200)
+@inject
+async def stream_all_profile_collections(
+        service: IProfileCollectionService = Depends(Provide[Container.profile_collection_service]),
+) -> StreamingResponse:
     """
-    An endpoint for getting all profile collections.
+    An endpoint for streaming all profile collections as newline delimited JSON.
 
     Args:
         service (IProfileCollectionService): The injected service dependency.
 
     Returns:
-        List: The profile_collection details.
+        StreamingResponse: The profile_collection attributes, one per line.
     """
-    profile_collections = await service.get_all()
 
-    return profile_collections
+    return ndjson_response(service.iterate())
 
 @router.get("/all_by_profile_id", response_model=List[ProfileCollection], status_code=200)
 @inject
@@ -69,7 +144,7 @@ async def get_all_profile_collections_by_profile_id(
         profile_id: int,
         service: IProfileCollectionService = Depends(Provide[Container.profile_collection_service]),
         profile_service: IProfileService = Depends(Provide[Container.profile_service])
-) -> List:
+) -> Response:
     """
     An endpoint for getting profile collections by profile id.
 
@@ -79,7 +154,7 @@ async def get_all_profile_collections_by_profile_id(
         profile_service (IProfileService): The injected profile service dependency.
 
     Returns:
-        List: The profile details.
+        Response: The profile details as JSON.
 
     Raises:
         HTTPException: 404 if profile does not exist.
@@ -89,7 +164,34 @@ async def get_all_profile_collections_by_profile_id(
     profile_collections = await service.get_all_profile_collections_by_profile_id(profile_id)
 
     if profile:
-        return profile_collections
+        return json_list_response(ProfileCollection, profile_collections)
+
+    raise HTTPException(status_code=404, detail="Profile not found")
+
+@router.get("/counts_by_profile_id", response_model=List[ProfileCardCount], status_code=200)
+@inject
+async def get_counts_by_profile_id(
+        profile_id: int,
+        service: IProfileCollectionService = Depends(Provide[Container.profile_collection_service]),
+        profile_service: IProfileService = Depends(Provide[Container.profile_service])
+) -> Response:
+    """
+    An endpoint for getting the number of copies of each card owned by a profile.
+
+    Args:
+        profile_id (int): The id of the profile.
+        service (IProfileCollectionService): The injected service dependency.
+        profile_service (IProfileService): The injected profile service dependency.
+
+    Returns:
+        Response: The card counts of the profile as JSON.
+
+    Raises:
+        HTTPException: 404 if profile does not exist.
+    """
+
+    if await profile_service.get_by_id(profile_id):
+        return json_list_response(ProfileCardCount, await service.get_counts_by_profile_id(profile_id))
 
     raise HTTPException(status_code=404, detail="Profile not found")
 
@@ -133,10 +235,14 @@ async def delete_profile_collection(
 
     Raises:
         HTTPException: 404 if profile_collection does not exist.
+        HTTPException: 409 if profile_collection is not the last copy of its card.
     """
 
     if await service.get_by_id(profile_collection_id=profile_collection_id):
-        await service.delete_profile_collection(profile_collection_id)
+        try:
+            await service.delete_profile_collection(profile_collection_id)
+        except NotLastCopyError:
+            raise HTTPException(status_code=409, detail="Only the last copy of a card can be removed")
 
         return
 
@@ -1,23 +1,31 @@
 from typing import List
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from card_collector.core.domains.quest import Quest, QuestIn
+from card_collector.core.domains.reference import Reference, ReferenceKind
 from card_collector.core.services.i_quest_service import IQuestService
+from card_collector.api.dependencies import unit_of_work
+from card_collector.api.responses import json_list_response, ndjson_response, set_next_cursor
 from card_collector.container import Container
-from card_collector.core.services.i_profile_service import IProfileService
-from card_collector.core.services.i_card_service import ICardService
+from card_collector.core.services.i_validation_service import IValidationService
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(unit_of_work)])
+
+MISSING_DETAILS = {
+    ReferenceKind.QUEST: "Quest not found",
+    ReferenceKind.PROFILE: "Profile not found",
+    ReferenceKind.CARD: "Reward id not found",
+}
 
 @router.post("/create", response_model=Quest, status_code=201)
 @inject
 async def create_quest(
         quest: QuestIn,
         service: IQuestService = Depends(Provide[Container.quest_service]),
-        profile_service: IProfileService = Depends(Provide[Container.profile_service]),
-        card_service: ICardService = Depends(Provide[Container.card_service]),
+        validation_service: IValidationService = Depends(Provide[Container.validation_service]),
 ) -> dict:
     """
     An endpoint for adding new quest.
@@ -25,8 +33,7 @@ async def create_quest(
     Args:
         quest (QuestIn): The quest data.
         service (IQuestService): The injected service dependency.
-        profile_service (IProfileService): The injected profile service dependency.
-        card_service (IProfileService): The injected card service dependency.
+        validation_service (IValidationService): The injected validation service dependency.
 
     Returns:
         dict: The new quest attributes.
@@ -36,40 +43,69 @@ async def create_quest(
         HTTPException: 404 if data does not exist.
     """
 
-    if await profile_service.get_by_id(quest.profile_id):
-        if await card_service.get_by_id(quest.reward):
-            if quest.cards_needed > 0:
-                new_quest = await service.add_quest(quest)
-                return new_quest.model_dump() if new_quest else {}
-            raise HTTPException(status_code=400, detail="Cards needed need to be higher than 0")
-        raise HTTPException(status_code=404, detail="Reward id not found")
-    raise HTTPException(status_code=404, detail="Profile not found")
+    missing = await validation_service.first_missing([
+        Reference.profile(quest.profile_id),
+        Reference.card(quest.reward),
+    ])
+    if missing is None:
+        if quest.cards_needed > 0:
+            new_quest = await service.add_quest(quest)
+            return new_quest.model_dump() if new_quest else {}
+        raise HTTPException(status_code=400, detail="Cards needed need to be higher than 0")
+    raise HTTPException(status_code=404, detail=MISSING_DETAILS[missing.kind])
 
 @router.get("/all", response_model=List[Quest], status_code=200)
 @inject
 async def get_all_quests(
+        limit: int | None = Query(default=None, gt=0),
+        after: int | None = None,
         service: IQuestService = Depends(Provide[Container.quest_service]),
-) -> List:
+) -> Response:
     """
-    An endpoint for getting all quests.
+    An endpoint for getting all quests, or a page of them when a limit is given.
+        Pages are ordered by id and the next one starts after the id in the X-Next-After header.
 
     Args:
-        service (IQuestService, optional): The injected service dependency.
+        limit (int | None): The maximal number of quests. Defaults to None (all).
+        after (int | None): The id after which the page starts. Defaults to None.
+        service (IQuestService): The injected service dependency.
 
     Returns:
-        List: The quest attributes collection.
+        Response: The quest attributes collection as JSON.
     """
 
-    quests = await service.get_all()
+    if limit is None:
+        return json_list_response(Quest, await service.get_all())
 
-    return quests
+    quests = await service.get_page(limit, after)
+    response = json_list_response(Quest, quests)
+    set_next_cursor(response, quests, limit)
+
+    return response
+
+@router.get("/all/stream", status_code=200)
+@inject
+async def stream_all_quests(
+        service: IQuestService = Depends(Provide[Container.quest_service]),
+) -> StreamingResponse:
+    """
+    An endpoint for streaming all quests as newline delimited JSON.
+
+    Args:
+        service (IQuestService): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The quest attributes, one per line.
+    """
+
+    return ndjson_response(service.iterate())
 
 @router.get("/all/{profile_id}", response_model=List[Quest], status_code=200)
 @inject
 async def get_all_by_profile(
         profile_id: int,
         service: IQuestService = Depends(Provide[Container.quest_service]),
-) -> List:
+) -> Response:
     """
     An endpoint for getting all quests by profile id.
 
@@ -78,7 +114,7 @@ async def get_all_by_profile(
         service (ICardService): The injected service dependency.
 
     Returns:
-        List: The card attributes collection.
+        Response: The card attributes collection as JSON.
 
     Raises:
         HTTPException: 404 if quests do not exist.
@@ -86,7 +122,7 @@ async def get_all_by_profile(
 
     quests = await service.get_all_by_profile(profile_id)
     if quests:
-        return quests
+        return json_list_response(Quest, quests)
     raise HTTPException(status_code=404, detail="No quests found")
 
 @router.get("/{quest_id}",response_model=Quest,status_code=200,)
@@ -117,8 +153,7 @@ async def update_quest(
         quest_id: int,
         updated_quest: QuestIn,
         service: IQuestService = Depends(Provide[Container.quest_service]),
-        profile_service: IProfileService = Depends(Provide[Container.profile_service]),
-        card_service: ICardService = Depends(Provide[Container.card_service]),
+        validation_service: IValidationService = Depends(Provide[Container.validation_service]),
 ) -> dict:
     """
     An endpoint for updating quest data.
@@ -127,8 +162,7 @@ async def update_quest(
         quest_id (int): The id of the quest.
         updated_quest (QuestIn): The updated quest details.
         service (IQuestService): The injected service dependency.
-        profile_service (IProfileService): The injected profile service dependency.
-        card_service (ICardService): The injected card service dependency.
+        validation_service (IValidationService): The injected validation service dependency.
 
     Returns:
         dict: The updated quest details.
@@ -138,19 +172,20 @@ async def update_quest(
         HTTPException: 404 if quest does not exist.
     """
 
-    if await service.get_by_id(quest_id=quest_id):
-        if await profile_service.get_by_id(updated_quest.profile_id):
-            if await card_service.get_by_id(updated_quest.reward):
-                if updated_quest.cards_needed > 0:
-                    await service.update_quest(
-                        quest_id=quest_id,
-                        data=updated_quest,
-                    )
-                    return {**updated_quest.model_dump(), "id": quest_id}
-                raise HTTPException(status_code=400, detail="Cards needed need to be higher than 0")
-            raise HTTPException(status_code=404, detail="Reward id not found")
-        raise HTTPException(status_code=404, detail="Profile not found")
-    raise HTTPException(status_code=404, detail="Quest not found")
+    missing = await validation_service.first_missing([
+        Reference.quest(quest_id),
+        Reference.profile(updated_quest.profile_id),
+        Reference.card(updated_quest.reward),
+    ])
+    if missing is None:
+        if updated_quest.cards_needed > 0:
+            await service.update_quest(
+                quest_id=quest_id,
+                data=updated_quest,
+            )
+            return {**updated_quest.model_dump(), "id": quest_id}
+        raise HTTPException(status_code=400, detail="Cards needed need to be higher than 0")
+    raise HTTPException(status_code=404, detail=MISSING_DETAILS[missing.kind])
 
 
 @router.delete("/{quest_id}", status_code=204)
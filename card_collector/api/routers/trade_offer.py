@@ -1,25 +1,33 @@
 from typing import List
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
+from card_collector.api.dependencies import non_atomic, unit_of_work
+from card_collector.api.responses import json_list_response, ndjson_response, set_next_cursor
 from card_collector.container import Container
-from card_collector.core.domains.trade_offer import TradeOffer, TradeOfferIn
+from card_collector.core.domains.reference import Reference, ReferenceKind
+from card_collector.core.domains.trade_offer import TradeClearing, TradeOffer, TradeOfferDepth, TradeOfferIn
 from card_collector.core.services.i_trade_offer_service import ITradeOfferService
-from card_collector.core.services.i_profile_service import IProfileService
-from card_collector.core.services.i_card_service import ICardService
-from card_collector.core.services.i_profile_collection_service import IProfileCollectionService
+from card_collector.core.services.i_validation_service import IValidationService
 from card_collector.core.services.i_collection_integration_service import ICollectionIntegrationService
+from card_collector.core.services.i_trade_cycle_service import ITradeCycleService
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(unit_of_work)])
+
+MISSING_DETAILS = {
+    ReferenceKind.TRADE_OFFER: "Trade Offer not found",
+    ReferenceKind.PROFILE: "Profile not found",
+    ReferenceKind.CARD: "Card wanted not found",
+    ReferenceKind.OWNED_CARD: "Card offered not found",
+}
 
 @router.post("/create", response_model=TradeOffer, status_code=201)
 @inject
 async def create_trade_offer(
         trade_offer: TradeOfferIn,
-        profile_service: IProfileService = Depends(Provide[Container.profile_service]),
-        card_service: ICardService = Depends(Provide[Container.card_service]),
-        profile_collection_service: IProfileCollectionService = Depends(Provide[Container.profile_collection_service]),
+        validation_service: IValidationService = Depends(Provide[Container.validation_service]),
         collection_integration_service: ICollectionIntegrationService = Depends(Provide[Container.collection_integration_service])
 ) -> dict:
     """
@@ -27,9 +35,7 @@ async def create_trade_offer(
 
     Args:
         trade_offer (TradeOfferIn): The trade_offer data.
-        profile_service: The injected profile service dependency.
-        card_service: The Injected card service dependency.
-        profile_collection_service: The injected profile collection dependency.
+        validation_service (IValidationService): The injected validation service dependency.
         collection_integration_service (ICollectionIntegrationService): The injected collection integration service.
 
     Returns:
@@ -39,39 +45,111 @@ async def create_trade_offer(
         HTTPException: 404 if data does not exist.
     """
 
-    if await profile_service.get_by_id(trade_offer.profile_posted):
-        if await card_service.get_by_id(trade_offer.card_wanted):
-            if await profile_collection_service.get_all_profile_collections_by_profile_id_and_card_id(
-                    trade_offer.card_offered,
-                    trade_offer.profile_posted):
+    missing = await validation_service.first_missing([
+        Reference.profile(trade_offer.profile_posted),
+        Reference.card(trade_offer.card_wanted),
+        Reference.owned_card(trade_offer.profile_posted, trade_offer.card_offered),
+    ])
+    if missing is None:
+        new_trade_offer = await collection_integration_service.add_trade_offer(trade_offer)
+        return new_trade_offer.model_dump() if new_trade_offer else {}
+
+    raise HTTPException(status_code=404, detail=MISSING_DETAILS[missing.kind])
+
 
-                new_trade_offer = await collection_integration_service.add_trade_offer(trade_offer)
-                return new_trade_offer.model_dump() if new_trade_offer else {}
 
-            raise HTTPException(status_code=404, detail="Card offered not found")
-        raise HTTPException(status_code=404, detail="Card wanted not found")
-    raise HTTPException(status_code=404, detail="Profile not found")
+@router.post("/clear", response_model=TradeClearing, status_code=200)
+@non_atomic
+@inject
+async def clear_trade_cycles(
+        service: ITradeCycleService = Depends(Provide[Container.trade_cycle_service]),
+) -> dict:
+    """
+    An endpoint for executing all trade cycles found among open trade offers.
+        Each cycle commits in its own transaction, so a failing cycle does not undo the others.
+
+    Args:
+        service (ITradeCycleService): The injected service dependency.
 
+    Returns:
+        dict: The number of executed cycles and completed trade offers.
+    """
+
+    clearing = await service.clear_all()
+
+    return clearing.model_dump()
 
 
 @router.get("/all", response_model=List[TradeOffer], status_code=200)
 @inject
 async def get_all_trade_offers(
+        limit: int | None = Query(default=None, gt=0),
+        after: int | None = None,
+        service: ITradeOfferService = Depends(Provide[Container.trade_offer_service]),
+) -> Response:
+    """
+    An endpoint for getting all trade offers, or a page of them when a limit is given.
+        Pages are ordered by id and the next one starts after the id in the X-Next-After header.
+
+    Args:
+        limit (int | None): The maximal number of trade offers. Defaults to None (all).
+        after (int | None): The id after which the page starts. Defaults to None.
+        service (ITradeOfferService): The injected service dependency.
+
+    Returns:
+        Response: The trade_offer attributes collection as JSON.
+    """
+
+    if limit is None:
+        return json_list_response(TradeOffer, await service.get_all())
+
+    trade_offers = await service.get_page(limit, after)
+    response = json_list_response(TradeOffer, trade_offers)
+    set_next_cursor(response, trade_offers, limit)
+
+    return response
+
+@router.get("/all/stream", status_code=200)
+@inject
+async def stream_all_trade_offers(
         service: ITradeOfferService = Depends(Provide[Container.trade_offer_service]),
-) -> List:
+) -> StreamingResponse:
     """
-    An endpoint for getting all trade offers.
+    An endpoint for streaming all trade offers as newline delimited JSON.
 
     Args:
         service (ITradeOfferService): The injected service dependency.
 
     Returns:
-        List: The trade_offer attributes collection.
+        StreamingResponse: The trade_offer attributes, one per line.
     """
 
-    trade_offers = await service.get_all()
+    return ndjson_response(service.iterate())
 
-    return trade_offers
+@router.get("/depth", response_model=TradeOfferDepth, status_code=200)
+@inject
+async def get_trade_offer_depth(
+        card_offered: int,
+        card_wanted: int,
+        service: ITradeOfferService = Depends(Provide[Container.trade_offer_service]),
+) -> dict:
+    """
+    An endpoint for getting the number of open trade offers with a given offer.
+
+    Args:
+        card_offered (int): The id of the card offered.
+        card_wanted (int): The id of the card wanted.
+        service (ITradeOfferService): The injected service dependency.
+
+    Returns:
+        dict: The offer and the number of open trade offers.
+    """
+
+    return {
+        "card_offered": card_offered,
+        "card_wanted": card_wanted,
+        "depth": await service.get_depth(card_offered, card_wanted),
+    }
 
 @router.get("/{trade_offer_id}",response_model=TradeOffer,status_code=200,)
 @inject
@@ -104,9 +182,7 @@ async def update_trade_offer(
         trade_offer_id: int,
         updated_trade_offer: TradeOfferIn,
         service: ITradeOfferService = Depends(Provide[Container.trade_offer_service]),
-        profile_service: IProfileService = Depends(Provide[Container.profile_service]),
-        card_service: ICardService = Depends(Provide[Container.card_service]),
-        profile_collection_service: IProfileCollectionService = Depends(Provide[Container.profile_collection_service]),
+        validation_service: IValidationService = Depends(Provide[Container.validation_service]),
 ) -> dict:
     """
     An endpoint for updating trade offer.
@@ -115,9 +191,7 @@ async def update_trade_offer(
         trade_offer_id (int): The id of the trade_offer.
         updated_trade_offer (TradeOfferIn): The updated trade offer details.
         service (ITradeOfferService): The injected service dependency.
-        profile_service (IProfileService): The injected profile service dependency.
-        card_service (ICardService): The injected card service dependency.
-        profile_collection_service (IProfileCollectionService): The injected profile collection dependency.
+        validation_service (IValidationService): The injected validation service dependency.
 
     Returns:
         dict: The updated trade offer details.
@@ -126,21 +200,20 @@ async def update_trade_offer(
         HTTPException: 404 if data does not exist.
     """
 
-    if await service.get_by_id(trade_offer_id=trade_offer_id):
-        if await profile_service.get_by_id(updated_trade_offer.profile_posted):
-            if await profile_collection_service.get_all_profile_collections_by_profile_id_and_card_id(
-                    updated_trade_offer.card_offered,
-                    updated_trade_offer.profile_posted):
-                if await card_service.get_by_id(updated_trade_offer.card_wanted):
-                    await service.update_trade_offer(
-                        trade_offer_id=trade_offer_id,
-                        data=updated_trade_offer,
-                    )
-                    return {**updated_trade_offer.model_dump(), "id": trade_offer_id}
-                raise HTTPException(status_code=404, detail="Card wanted not found")
-            raise HTTPException(status_code=404, detail="Card offered not found")
-        raise HTTPException(status_code=404, detail="Profile not found")
-    raise HTTPException(status_code=404, detail="Trade Offer not found")
+    missing = await validation_service.first_missing([
+        Reference.trade_offer(trade_offer_id),
+        Reference.profile(updated_trade_offer.profile_posted),
+        Reference.owned_card(updated_trade_offer.profile_posted, updated_trade_offer.card_offered),
+        Reference.card(updated_trade_offer.card_wanted),
+    ])
+    if missing is None:
+        await service.update_trade_offer(
+            trade_offer_id=trade_offer_id,
+            data=updated_trade_offer,
+        )
+        return {**updated_trade_offer.model_dump(), "id": trade_offer_id}
+
+    raise HTTPException(status_code=404, detail=MISSING_DETAILS[missing.kind])
 
 
 @router.delete("/{trade_offer_id}", status_code=204)
@@ -0,0 +1,132 @@
+"""A benchmark of hydrating DB rows into domain models and serializing them for list endpoints.
+
+For every model stored in the database, the same rows are hydrated twice: once the way
+from_record used to do it (copy the record into a dict and validate every field) and once
+through from_record (trusted construction). The models are then serialized twice: once the
+way FastAPI does it for a returned list (validate against the response_model, dump to
+JSON-able Python and encode with json) and once through json_list_response (pydantic-core
+dump_json). No database is needed, the rows are built in memory.
+
+Run with ``python -m card_collector.benchmarks.hydration``.
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+from card_collector.api.responses import json_list_response
+from card_collector.core.domains.card import Card
+from card_collector.core.domains.profile import Profile
+from card_collector.core.domains.profile_collection import ProfileCollection
+from card_collector.core.domains.quest import Quest
+from card_collector.core.domains.trade_offer import TradeOffer
+
+MODELS: Tuple[Type[BaseModel], ...] = (Card, Profile, ProfileCollection, TradeOffer, Quest)
+
+
+def make_rows(model: Type[BaseModel], count: int) -> List[Dict[str, Any]]:
+    """Function building rows with the columns of a model.
+
+    Args:
+        model (Type[BaseModel]): The model.
+        count (int): The number of rows.
+
+    Returns:
+        List[Dict[str, Any]]: The rows.
+    """
+    def value(name: str, annotation: Any, index: int) -> Any:
+        return f"{name} {index}" if annotation is str else index
+
+    return [
+        {name: value(name, field.annotation, index) for name, field in model.model_fields.items()}
+        for index in range(1, count + 1)
+    ]
+
+
+def legacy_from_record(model: Type[BaseModel], record: Dict[str, Any]) -> BaseModel:
+    """Function hydrating a model the way from_record used to, with full validation.
+
+    Args:
+        model (Type[BaseModel]): The model.
+        record (Dict[str, Any]): The DB record.
+
+    Returns:
+        BaseModel: The model instance.
+    """
+    record_dict = dict(record)
+
+    return model(**{name: record_dict.get(name) for name in model.model_fields})
+
+
+def legacy_serialize(model: Type[BaseModel], models: List[BaseModel]) -> bytes:
+    """Function serializing a list the way FastAPI does for a returned list and a response_model.
+
+    Args:
+        model (Type[BaseModel]): The model of the list.
+        models (List[BaseModel]): The models.
+
+    Returns:
+        bytes: The JSON body.
+    """
+    adapter = TypeAdapter(List[model])  # type: ignore[valid-type]
+    validated = adapter.validate_python(models, from_attributes=True)
+
+    return json.dumps(adapter.dump_python(validated, mode="json")).encode()
+
+
+def timed(function: Callable[[], Any]) -> Tuple[float, Any]:
+    """Function timing one call.
+
+    Args:
+        function (Callable[[], Any]): The function.
+
+    Returns:
+        Tuple[float, Any]: The time in milliseconds and the result.
+    """
+    started = time.perf_counter()
+    result = function()
+
+    return (time.perf_counter() - started) * 1000, result
+
+
+def run(rows: int) -> None:
+    """Function running the benchmark and printing the results.
+
+    Args:
+        rows (int): The number of rows per model.
+    """
+    print(f"{'model':<20}{'hydrate before':>16}{'after':>10}{'serialize before':>18}{'after':>10}")
+    for model in MODELS:
+        records = make_rows(model, rows)
+
+        legacy_hydration, legacy_models = timed(lambda: [legacy_from_record(model, record) for record in records])
+        hydration, models = timed(lambda: [model.from_record(record) for record in records])
+        if models != legacy_models:
+            raise AssertionError(f"Hydrated {model.__name__} models differ")
+
+        legacy_serialization, legacy_body = timed(lambda: legacy_serialize(model, models))
+        serialization, response = timed(lambda: json_list_response(model, models))
+        if json.loads(response.body) != json.loads(legacy_body):
+            raise AssertionError(f"Serialized {model.__name__} bodies differ")
+
+        print(
+            f"{model.__name__:<20}"
+            f"{legacy_hydration:>14.1f}ms{hydration:>8.1f}ms"
+            f"{legacy_serialization:>16.1f}ms{serialization:>8.1f}ms"
+        )
+
+
+def main() -> None:
+    """Function parsing the arguments and running the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""A benchmark of the ownership reads of profile collections.
+
+For profiles owning 1, 100 and 10k copies of a card, "does the profile own the card" and
+"how many copies does it own" are answered twice against the configured backend: once
+the way the services used to (fetch and hydrate every copy of the card) and once through
+owns and count_owned. The database backend rolls back all writes at the end, the memory
+backend writes to a store of its own.
+
+Run with ``python -m card_collector.benchmarks.ownership``, or with ``DB_BACKEND=memory``
+to run without a database.
+"""
+
+import argparse
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Tuple
+
+from card_collector.config import config
+from card_collector.core.domains.card import CardIn
+from card_collector.core.domains.profile import ProfileIn
+from card_collector.core.domains.profile_collection import ProfileCollectionIn
+from card_collector.db import database, init_db
+from card_collector.core.repositories.i_card_repository import ICardRepository
+from card_collector.core.repositories.i_profile_collection_repository import IProfileCollectionRepository
+from card_collector.core.repositories.i_profile_repository import IProfileRepository
+from card_collector.infrastructure.repositories.card_repository import CardRepository
+from card_collector.infrastructure.repositories.memory_card_repository import MemoryCardRepository
+from card_collector.infrastructure.repositories.memory_profile_collection_repository import MemoryProfileCollectionRepository
+from card_collector.infrastructure.repositories.memory_profile_repository import MemoryProfileRepository
+from card_collector.infrastructure.repositories.memory_store import MemoryStore
+from card_collector.infrastructure.repositories.profile_collection_repository import ProfileCollectionRepository
+from card_collector.infrastructure.repositories.profile_repository import ProfileRepository
+
+COPIES = (1, 100, 10_000)
+
+
+async def measure(operation: Callable[[], Awaitable[Any]], iterations: int) -> Tuple[float, Any]:
+    """Function running an operation a number of times.
+
+    Args:
+        operation (Callable[[], Awaitable[Any]]): The operation.
+        iterations (int): The number of runs.
+
+    Returns:
+        Tuple[float, Any]: Milliseconds per run and the last result.
+    """
+    result = None
+    started = time.perf_counter()
+    for _ in range(iterations):
+        result = await operation()
+
+    return (time.perf_counter() - started) / iterations * 1e3, result
+
+
+@asynccontextmanager
+async def repositories() -> AsyncIterator[Tuple[ICardRepository, IProfileRepository, IProfileCollectionRepository]]:
+    """Function opening the repositories of the configured backend, rolling back database writes at the end.
+
+    Returns:
+        AsyncIterator[Tuple[ICardRepository, IProfileRepository, IProfileCollectionRepository]]:
+            The card, profile and profile collection repositories.
+    """
+    if config.DB_BACKEND == "memory":
+        store = MemoryStore()
+        yield MemoryCardRepository(store), MemoryProfileRepository(store), MemoryProfileCollectionRepository(store)
+        return
+
+    await init_db()
+    try:
+        async with database.transaction(force_rollback=True):
+            yield CardRepository(), ProfileRepository(), ProfileCollectionRepository()
+    finally:
+        await database.disconnect()
+
+
+async def run(iterations: int) -> None:
+    """Function measuring the ownership reads before and after.
+
+    Args:
+        iterations (int): The number of reads per profile.
+    """
+    print(f"backend: {config.DB_BACKEND}, iterations: {iterations}")
+    print(f"{'copies':>8}{'owns before':>14}{'after':>10}{'count before':>15}{'after':>10}")
+    async with repositories() as (cards, profiles, repository):
+        card = await cards.add_card(CardIn(name="benchmark-owned", rarity_id=1))
+
+        for copies in COPIES:
+            profile = await profiles.add_profile(ProfileIn(name=f"benchmark-{copies}"))
+            await repository.add_many([
+                ProfileCollectionIn(profile_id=profile.id, card_id=card.id) for _ in range(copies)
+            ])
+
+            async def legacy_owns() -> bool:
+                return bool(await repository.get_all_profile_collections_by_profile_id_and_card_id(card.id, profile.id))
+
+            async def legacy_count() -> int:
+                return len(await repository.get_all_profile_collections_by_profile_id_and_card_id(card.id, profile.id))
+
+            owns_before, owned_before = await measure(legacy_owns, iterations)
+            owns_after, owned = await measure(lambda: repository.owns(profile.id, card.id), iterations)
+            count_before, counted_before = await measure(legacy_count, iterations)
+            count_after, counted = await measure(lambda: repository.count_owned(profile.id, card.id), iterations)
+            if not (owned is owned_before is True and counted == counted_before == copies):
+                raise AssertionError(f"Ownership of {copies} copies differs")
+
+            print(
+                f"{copies:>8}"
+                f"{owns_before:>12.3f}ms{owns_after:>8.3f}ms"
+                f"{count_before:>13.3f}ms{count_after:>8.3f}ms"
+            )
+
+
+def main() -> None:
+    """Function parsing the arguments and running the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
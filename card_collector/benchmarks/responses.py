@@ -0,0 +1,126 @@
+"""A benchmark of encoding large list payloads of the list endpoints.
+
+For every list endpoint model, the same hydrated models are encoded four ways:
+the FastAPI default for a returned list (validate against the response_model, convert
+to JSON-able data and encode with json in a JSONResponse), the same path with
+FastJSONResponse as the response class, the pydantic-core list serializer which
+json_list_response used before orjson, and json_list_response itself. Every way is
+warmed up, then timed over several runs and reported by its median. No database is
+needed, the rows are built in memory.
+
+Run with ``python -m card_collector.benchmarks.responses``.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import time
+from typing import Any, Awaitable, Callable, List, Tuple, Type
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import BaseModel
+
+from card_collector.api.responses import FastJSONResponse, _list_adapter, json_list_response, orjson
+from card_collector.benchmarks.hydration import MODELS, make_rows
+
+
+async def default_response(model: Type[BaseModel], models: List[BaseModel], response_class: Type[JSONResponse]) -> bytes:
+    """Function encoding a returned list the way FastAPI does with a response_model.
+
+    Args:
+        model (Type[BaseModel]): The model of the list.
+        models (List[BaseModel]): The models.
+        response_class (Type[JSONResponse]): The response class of the app.
+
+    Returns:
+        bytes: The body.
+    """
+    field = create_model_field(name="Response", type_=List[model], mode="serialization")  # type: ignore[valid-type]
+    content = await serialize_response(field=field, response_content=models)
+
+    return response_class(content).body
+
+
+async def timed(function: Callable[[], Awaitable[Any]], warmup: int, repeat: int) -> Tuple[float, Any]:
+    """Function timing repeated calls after warmup calls, with the garbage collector off like timeit.
+
+    Args:
+        function (Callable[[], Awaitable[Any]]): The function.
+        warmup (int): The number of untimed calls.
+        repeat (int): The number of timed calls.
+
+    Returns:
+        Tuple[float, Any]: The median time in milliseconds and the result of the last call.
+    """
+    for _ in range(warmup):
+        await function()
+
+    times = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = await function()
+            times.append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+
+    return statistics.median(times), result
+
+
+async def run(rows: int, warmup: int, repeat: int) -> None:
+    """Function running the benchmark and printing the results.
+
+    Args:
+        rows (int): The number of rows per list.
+        warmup (int): The number of untimed calls of each way.
+        repeat (int): The number of timed calls of each way.
+    """
+    async def baseline(model: Type[BaseModel], models: List[BaseModel]) -> bytes:
+        return _list_adapter(model).dump_json(models)
+
+    async def bypass(model: Type[BaseModel], models: List[BaseModel]) -> bytes:
+        return json_list_response(model, models).body
+
+    print(f"encoder: {'orjson' if orjson else 'pydantic-core'}, rows: {rows}, warmup: {warmup}, median of {repeat}")
+    print(
+        f"{'model':<20}{'default':>12}{'fast class':>12}{'baseline':>12}{'bypass':>12}"
+        f"{'vs default':>12}{'vs baseline':>13}"
+    )
+    for model in MODELS:
+        models = [model.from_record(record) for record in make_rows(model, rows)]
+
+        default, default_body = await timed(lambda: default_response(model, models, JSONResponse), warmup, repeat)
+        fast_class, fast_class_body = await timed(
+            lambda: default_response(model, models, FastJSONResponse), warmup, repeat
+        )
+        base, base_body = await timed(lambda: baseline(model, models), warmup, repeat)
+        fast, fast_body = await timed(lambda: bypass(model, models), warmup, repeat)
+        if not json.loads(default_body) == json.loads(fast_class_body) == json.loads(base_body) == json.loads(fast_body):
+            raise AssertionError(f"Encoded {model.__name__} bodies differ")
+
+        print(
+            f"{model.__name__:<20}"
+            f"{default:>10.1f}ms{fast_class:>10.1f}ms{base:>10.1f}ms{fast:>10.1f}ms"
+            f"{default / fast:>11.1f}x{base / fast:>12.1f}x"
+        )
+
+
+def main() -> None:
+    """Function parsing the arguments and running the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.warmup, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
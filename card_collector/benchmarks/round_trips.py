@@ -0,0 +1,203 @@
+"""A benchmark of database round trips made by the repository write paths.
+
+Every write behind the create, update and delete endpoints is run twice against the configured
+database: once the way the repositories used to do it (write, then re-select or select, then
+write) and once through the repositories (a single statement with RETURNING).
+Round trips are counted by a query logger on the asyncpg connection, so statements of
+databases, of the statement registry and of transactions are all counted.
+All writes are rolled back at the end.
+
+Run with ``python -m card_collector.benchmarks.round_trips``.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+import sqlalchemy
+from asyncpg.connection import LoggedQuery
+from pydantic import BaseModel
+
+from card_collector.core.domains.card import CardIn
+from card_collector.core.domains.profile import ProfileIn
+from card_collector.core.domains.quest import QuestIn
+from card_collector.core.domains.trade_offer import TradeOfferIn
+from card_collector.db import (
+    card_table,
+    database,
+    init_db,
+    profile_table,
+    quest_table,
+    trade_offer_table,
+)
+from card_collector.infrastructure.repositories.card_repository import CardRepository
+from card_collector.infrastructure.repositories.profile_repository import ProfileRepository
+from card_collector.infrastructure.repositories.quest_repository import QuestRepository
+from card_collector.infrastructure.repositories.trade_offer_repository import TradeOfferRepository
+
+class RoundTripCounter:
+    """A counter of statements sent on an asyncpg connection, registered as its query logger."""
+
+    count: int
+
+    def __init__(self) -> None:
+        """The initializer of the counter."""
+        self.count = 0
+
+    def __call__(self, record: LoggedQuery) -> None:
+        """The method counting a statement logged by the connection.
+
+        Args:
+            record (LoggedQuery): The logged statement.
+        """
+        self.count += 1
+
+    async def settled(self) -> int:
+        """The method getting the count once the connection has called back for every finished statement.
+
+        Returns:
+            int: The number of statements.
+        """
+        # asyncpg calls query loggers with loop.call_soon, so one turn of the loop runs them.
+        await asyncio.sleep(0)
+
+        return self.count
+
+
+async def legacy_add(table: sqlalchemy.Table, data: BaseModel) -> Any:
+    """Function adding a row the way the repositories used to: insert, then select by id."""
+    row_id = await database.execute(table.insert().values(**data.model_dump()))
+
+    return await database.fetch_one(table.select().where(table.c.id == row_id))
+
+
+async def legacy_update(table: sqlalchemy.Table, row_id: int, data: BaseModel) -> Any:
+    """Function updating a row the way the repositories used to: update, then select by id."""
+    await database.execute(table.update().where(table.c.id == row_id).values(**data.model_dump()))
+
+    return await database.fetch_one(table.select().where(table.c.id == row_id))
+
+
+async def legacy_delete(table: sqlalchemy.Table, row_id: int) -> bool:
+    """Function removing a row the way the repositories used to: select by id, then delete."""
+    if await database.fetch_one(table.select().where(table.c.id == row_id)):
+        await database.execute(table.delete().where(table.c.id == row_id))
+        return True
+
+    return False
+
+
+async def measure(
+        counter: RoundTripCounter,
+        operation: Callable[[int], Awaitable[Any]],
+        ids: List[int],
+) -> Tuple[float, float]:
+    """Function running an operation once per id.
+
+    Args:
+        counter (RoundTripCounter): The round trip counter.
+        operation (Callable[[int], Awaitable[Any]]): The operation.
+        ids (List[int]): The ids passed to the operation.
+
+    Returns:
+        Tuple[float, float]: Round trips and milliseconds per operation.
+    """
+    count = await counter.settled()
+    started = time.perf_counter()
+    for row_id in ids:
+        await operation(row_id)
+    elapsed = time.perf_counter() - started
+
+    return (await counter.settled() - count) / len(ids), elapsed / len(ids) * 1e3
+
+
+async def run(counter: RoundTripCounter, iterations: int) -> None:
+    """Function measuring every write endpoint before and after.
+
+    Args:
+        counter (RoundTripCounter): The round trip counter of the connection of the current task.
+        iterations (int): The number of writes per endpoint.
+    """
+    # Profile collections are copies counted in profile_card rows, with no row of their own to compare.
+    writes: Dict[str, Tuple[sqlalchemy.Table, Any, Callable[[int], BaseModel]]] = {
+        "card": (card_table, CardRepository(), lambda i: CardIn(name=f"benchmark-{i}", rarity_id=1)),
+        "profile": (profile_table, ProfileRepository(), lambda i: ProfileIn(name=f"benchmark-{i}")),
+        "trade_offer": (
+            trade_offer_table,
+            TradeOfferRepository(),
+            lambda i: TradeOfferIn(profile_posted=profile.id, card_offered=offered.id, card_wanted=wanted.id),
+        ),
+        "quest": (
+            quest_table,
+            QuestRepository(),
+            lambda i: QuestIn(profile_id=profile.id, cards_collected=0, cards_needed=10, reward=wanted.id),
+        ),
+    }
+
+    print(f"{'endpoint':<34}{'before':>16}{'after':>16}")
+    async with database.transaction(force_rollback=True):
+        profile = await ProfileRepository().add_profile(ProfileIn(name="benchmark"))
+        offered = await CardRepository().add_card(CardIn(name="benchmark-offered", rarity_id=1))
+        wanted = await CardRepository().add_card(CardIn(name="benchmark-wanted", rarity_id=1))
+
+        for name, (table, repository, make) in writes.items():
+            ids = list(range(iterations))
+            legacy_ids: List[int] = []
+            ids_after: List[int] = []
+
+            async def add_before(i: int) -> None:
+                legacy_ids.append((await legacy_add(table, make(i)))["id"])
+
+            async def add_after(i: int) -> None:
+                ids_after.append((await getattr(repository, f"add_{name}")(make(iterations + i))).id)
+
+            rows = [
+                ("POST", await measure(counter, add_before, ids), await measure(counter, add_after, ids)),
+                (
+                    "PUT",
+                    await measure(counter, lambda i: legacy_update(table, i, make(-i)), legacy_ids),
+                    await measure(counter, lambda i: getattr(repository, f"update_{name}")(i, make(-i)), ids_after),
+                ),
+                (
+                    "DELETE",
+                    await measure(counter, lambda i: legacy_delete(table, i), legacy_ids),
+                    await measure(counter, getattr(repository, f"delete_{name}"), ids_after),
+                ),
+            ]
+            for method, before, after in rows:
+                print(
+                    f"{method + ' /' + name:<34}"
+                    f"{before[0]:>5.1f} rt {before[1]:>6.2f}ms"
+                    f"{after[0]:>5.1f} rt {after[1]:>6.2f}ms"
+                )
+
+
+async def main_async(iterations: int) -> None:
+    """Function connecting to the database and running the benchmark.
+
+    Args:
+        iterations (int): The number of writes per endpoint.
+    """
+    await init_db()
+    try:
+        # Every statement of the benchmark runs in this task, so on this connection.
+        async with database.connection() as connection:
+            counter = RoundTripCounter()
+            with connection.raw_connection.query_logger(counter):
+                await run(counter, iterations)
+    finally:
+        await database.disconnect()
+
+
+def main() -> None:
+    """Function parsing the arguments and running the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
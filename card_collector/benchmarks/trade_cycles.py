@@ -0,0 +1,76 @@
+"""A benchmark of the trade cycle search on synthetic order books.
+
+Run with ``python -m card_collector.benchmarks.trade_cycles``.
+"""
+
+import argparse
+import random
+import time
+
+from card_collector.core.domains.trade_offer import TradeOffer
+from card_collector.infrastructure.services.trade_cycle_finder import TradeCycleFinder
+from card_collector.infrastructure.services.trade_order_book import TradeOrderBook
+
+
+def synthetic_offers(offers: int, cards: int, profiles: int, seed: int) -> list[TradeOffer]:
+    """Function generating random open trade offers.
+
+    Args:
+        offers (int): The number of offers.
+        cards (int): The number of distinct cards.
+        profiles (int): The number of distinct profiles.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        list[TradeOffer]: The generated offers.
+    """
+    rng = random.Random(seed)
+    generated = []
+
+    for trade_offer_id in range(1, offers + 1):
+        card_offered, card_wanted = rng.sample(range(1, cards + 1), 2)
+        generated.append(TradeOffer(
+            id=trade_offer_id,
+            profile_posted=rng.randint(1, profiles),
+            card_offered=card_offered,
+            card_wanted=card_wanted,
+        ))
+
+    return generated
+
+
+def main() -> None:
+    """Function running the benchmark and printing its timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--offers", type=int, default=100_000)
+    parser.add_argument("--cards", type=int, default=500)
+    parser.add_argument("--profiles", type=int, default=10_000)
+    parser.add_argument("--max-length", type=int, default=4)
+    parser.add_argument("--inserts", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    offers = synthetic_offers(args.offers, args.cards, args.profiles, args.seed)
+    finder = TradeCycleFinder(args.max_length)
+    book = TradeOrderBook()
+
+    started = time.perf_counter()
+    book.hydrate(offers)
+    print(f"hydrate: {len(book)} offers, {len(book.pairs())} pairs in {time.perf_counter() - started:.3f}s")
+
+    started = time.perf_counter()
+    found = 0
+    for trade_offer in offers[:args.inserts]:
+        found += bool(finder.find_cycle(book, trade_offer.card_offered, trade_offer.card_wanted))
+    elapsed = time.perf_counter() - started
+    print(f"find_cycle: {args.inserts} searches, {found} cycles, {elapsed / args.inserts * 1e6:.1f}us per search")
+
+    started = time.perf_counter()
+    plan = finder.plan_clearing(book)
+    elapsed = time.perf_counter() - started
+    cleared = sum(len(pairs) * times for pairs, times in plan)
+    print(f"plan_clearing: {len(plan)} cycles, {cleared} offers cleared in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
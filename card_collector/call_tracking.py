@@ -0,0 +1,156 @@
+"""A module tracking the repository calls and the SQL statements of each HTTP request.
+
+InstrumentedRepository records every call of an async repository method with its latency.
+A call has a shape, named repository.method, whatever the arguments: the same shape
+repeated many times in one request is the signature of an N+1 loop. A call may run several
+statements or none, like the cache hits of the card catalog, which are not counted. The
+call counts are the same on the postgres and memory backends, so budgets checked against
+the memory backend hold for postgres too.
+
+The statements sent to postgres are recorded apart, by the database client and the
+statement registry, with the time spent waiting for them. The memory backend sends none.
+
+The tracker of the current request lives in a context variable, which the tasks and
+threads started while serving the request share.
+"""
+
+from collections import Counter as ShapeCounter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List
+
+Observer = Callable[[str, "RequestCalls"], None]
+
+
+class RequestCalls:
+    """The repository calls of one request: how many, how long they took and how often each shape ran,
+    and the same for the SQL statements they sent."""
+
+    count: int
+    seconds: float
+    shapes: ShapeCounter
+    statements: int
+    statement_seconds: float
+
+    def __init__(self) -> None:
+        """The initializer of the tracker."""
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = ShapeCounter()
+        self.statements = 0
+        self.statement_seconds = 0.0
+
+    def record(self, shape: str, elapsed: float) -> None:
+        """Function recording one repository call.
+
+        Args:
+            shape (str): The shape of the call, repository.method.
+            elapsed (float): The time of the call in seconds.
+        """
+        self.count += 1
+        self.seconds += elapsed
+        self.shapes[shape] += 1
+
+    def record_statement(self, elapsed: float, statements: int = 1) -> None:
+        """Function recording SQL statements sent together.
+
+        Args:
+            elapsed (float): The time of the statements in seconds.
+            statements (int): The number of statements. Defaults to 1.
+        """
+        self.statements += statements
+        self.statement_seconds += elapsed
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        """Function listing the shapes which ran at least threshold times, most repeated first.
+
+        Args:
+            threshold (int): The number of runs of a shape flagged as N+1.
+
+        Returns:
+            Dict[str, int]: The runs of each repeated shape.
+        """
+        return {shape: runs for shape, runs in self.shapes.most_common() if runs >= threshold}
+
+    def summary(self) -> str:
+        """Function describing the repository calls and statements for logs and assertion messages.
+
+        Returns:
+            str: The count, time and runs of each shape, then the count and time of the statements.
+        """
+        shapes = ", ".join(f"{shape} x{runs}" for shape, runs in self.shapes.most_common())
+
+        return (
+            f"{self.count} repository calls in {self.seconds * 1000:.1f}ms" + (f" ({shapes})" if shapes else "")
+            + f", {self.statements} statements in {self.statement_seconds * 1000:.1f}ms"
+        )
+
+
+_current: ContextVar[RequestCalls | None] = ContextVar("request_calls", default=None)
+_observers: List[Observer] = []
+
+
+def record_call(shape: str, elapsed: float) -> None:
+    """Function recording a repository call in the tracker of the current request, if any.
+
+    Args:
+        shape (str): The shape of the call, repository.method.
+        elapsed (float): The time of the call in seconds.
+    """
+    if (calls := _current.get()) is not None:
+        calls.record(shape, elapsed)
+
+
+def record_statement(elapsed: float, statements: int = 1) -> None:
+    """Function recording SQL statements in the tracker of the current request, if any.
+
+    Args:
+        elapsed (float): The time of the statements in seconds.
+        statements (int): The number of statements. Defaults to 1.
+    """
+    if (calls := _current.get()) is not None:
+        calls.record_statement(elapsed, statements)
+
+
+@contextmanager
+def track() -> Iterator[RequestCalls]:
+    """Function tracking the repository calls and statements made in the current context until the block ends.
+
+    Returns:
+        Iterator[RequestCalls]: The tracker.
+    """
+    calls = RequestCalls()
+    token = _current.set(calls)
+    try:
+        yield calls
+    finally:
+        _current.reset(token)
+
+
+def add_observer(observer: Observer) -> None:
+    """Function registering a function called with the route and the repository calls of every finished request.
+
+    Args:
+        observer (Observer): The observer.
+    """
+    _observers.append(observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    """Function unregistering an observer.
+
+    Args:
+        observer (Observer): The observer.
+    """
+    _observers.remove(observer)
+
+
+def notify(route: str, calls: RequestCalls) -> None:
+    """Function passing the repository calls of a finished request to the observers.
+
+    Args:
+        route (str): The method and route template of the request, e.g. GET /card/{card_id}.
+        calls (RequestCalls): The repository calls of the request.
+    """
+    for observer in list(_observers):
+        observer(route, calls)
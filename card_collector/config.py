@@ -1,6 +1,6 @@
 """A module providing configuration variables."""
 
-from typing import Optional
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +15,23 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_BACKEND: str = "postgres"
+    DB_FORCE_ROLLBACK: bool = False
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_CONNECT_TIMEOUT: float = 10.0
+    DB_POOL_RECYCLE: float = 300.0
+    DB_COMMAND_TIMEOUT: Optional[float] = None
+    LOAD_FIXTURES: bool = False
+    CARD_CACHE_TTL: Optional[float] = None
+    CARD_SAMPLER_SEED: Optional[int] = None
+    RARITY_WEIGHTS: Dict[int, float] = {}
+    TRADE_CYCLE_MAX_LENGTH: int = 4
+    FAST_JSON_RESPONSES: bool = True
+    QUEST_REWARD_MAX_DEPTH: int = 32
+    N_PLUS_ONE_THRESHOLD: int = 5
+    SERVER_TIMING: bool = True
 
 
 config = AppConfig()
@@ -1,8 +1,25 @@
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Factory, Object, Selector, Singleton
+
+from card_collector.config import config
+
+from card_collector.infrastructure.repositories.database_transaction_manager import DatabaseTransactionManager
+from card_collector.infrastructure.repositories.unit_of_work import UnitOfWork
+from card_collector.infrastructure.repositories.instrumented_repository import InstrumentedRepository
+from card_collector.infrastructure.repositories.memory_store import MemoryStore
+from card_collector.infrastructure.repositories.memory_card_repository import MemoryCardRepository
+from card_collector.infrastructure.repositories.memory_profile_repository import MemoryProfileRepository
+from card_collector.infrastructure.repositories.memory_profile_collection_repository import MemoryProfileCollectionRepository
+from card_collector.infrastructure.repositories.memory_trade_offer_repository import MemoryTradeOfferRepository
+from card_collector.infrastructure.repositories.memory_quest_repository import MemoryQuestRepository
+from card_collector.infrastructure.repositories.fixture_loader import FixtureLoader
+from card_collector.infrastructure.repositories.memory_fixture_loader import MemoryFixtureLoader
+from card_collector.infrastructure.repositories.memory_reference_repository import MemoryReferenceRepository
 
 from card_collector.infrastructure.repositories.card_repository import CardRepository
+from card_collector.infrastructure.repositories.cached_card_repository import CachedCardRepository
 from card_collector.infrastructure.services.card_service import CardService
+from card_collector.infrastructure.services.card_sampler import CardSampler
 
 from card_collector.infrastructure.repositories.profile_repository import ProfileRepository
 from card_collector.infrastructure.services.profile_service import ProfileService
@@ -12,22 +29,112 @@ from card_collector.infrastructure.services.profile_collection_service import Pr
 
 from card_collector.infrastructure.repositories.trade_offer_repository import TradeOfferRepository
 from card_collector.infrastructure.services.trade_offer_service import TradeOfferService
+from card_collector.infrastructure.services.trade_order_book import TradeOrderBook
 
 from card_collector.infrastructure.repositories.quest_repository import QuestRepository
 from card_collector.infrastructure.services.quest_service import QuestService
 
+from card_collector.infrastructure.services.trade_cycle_finder import TradeCycleFinder
+from card_collector.infrastructure.services.trade_cycle_service import TradeCycleService
+
 from card_collector.infrastructure.services.collection_integration_service import CollectionIntegrationService
 
+from card_collector.infrastructure.repositories.reference_repository import ReferenceRepository
+from card_collector.infrastructure.services.validation_service import ValidationService
+
 class Container(DeclarativeContainer):
-    card_repository = Singleton(CardRepository)
-    profile_repository = Singleton(ProfileRepository)
-    profile_collection_repository = Singleton(ProfileCollectionRepository)
-    trade_offer_repository = Singleton(TradeOfferRepository)
-    quest_repository = Singleton(QuestRepository)
+    backend = Object(config.DB_BACKEND)
+    memory_store = Singleton(MemoryStore)
+
+    transactions = Selector(
+        backend,
+        postgres=Singleton(DatabaseTransactionManager),
+        memory=memory_store
+    )
+
+    card_repository = Singleton(
+        CachedCardRepository,
+        repository=Singleton(
+            InstrumentedRepository,
+            repository=Selector(
+                backend,
+                postgres=Singleton(CardRepository),
+                memory=Singleton(MemoryCardRepository, store=memory_store)
+            ),
+            name="card"
+        ),
+        transactions=transactions,
+        ttl=config.CARD_CACHE_TTL
+    )
+    profile_repository = Singleton(
+        InstrumentedRepository,
+        repository=Selector(
+            backend,
+            postgres=Singleton(ProfileRepository),
+            memory=Singleton(MemoryProfileRepository, store=memory_store)
+        ),
+        name="profile"
+    )
+    profile_collection_repository = Singleton(
+        InstrumentedRepository,
+        repository=Selector(
+            backend,
+            postgres=Singleton(ProfileCollectionRepository),
+            memory=Singleton(MemoryProfileCollectionRepository, store=memory_store)
+        ),
+        name="profile_collection"
+    )
+    trade_offer_repository = Singleton(
+        InstrumentedRepository,
+        repository=Selector(
+            backend,
+            postgres=Singleton(TradeOfferRepository),
+            memory=Singleton(MemoryTradeOfferRepository, store=memory_store)
+        ),
+        name="trade_offer"
+    )
+    quest_repository = Singleton(
+        InstrumentedRepository,
+        repository=Selector(
+            backend,
+            postgres=Singleton(QuestRepository),
+            memory=Singleton(MemoryQuestRepository, store=memory_store)
+        ),
+        name="quest"
+    )
+
+    reference_repository = Singleton(
+        InstrumentedRepository,
+        repository=Selector(
+            backend,
+            postgres=Singleton(ReferenceRepository),
+            memory=Singleton(MemoryReferenceRepository, store=memory_store)
+        ),
+        name="reference"
+    )
+    fixture_loader = Selector(
+        backend,
+        postgres=Singleton(FixtureLoader),
+        memory=Singleton(MemoryFixtureLoader, store=memory_store)
+    )
+
+    trade_order_book = Singleton(TradeOrderBook)
 
     trade_offer_service = Factory(
         TradeOfferService,
         repository=trade_offer_repository,
+        order_book=trade_order_book,
+        transactions=transactions
+    )
+
+    unit_of_work = Factory(
+        UnitOfWork,
+        transactions=transactions
+    )
+
+    validation_service = Factory(
+        ValidationService,
+        repository=reference_repository
     )
 
     quest_service = Factory(
@@ -39,19 +146,44 @@ class Container(DeclarativeContainer):
         ProfileCollectionService,
         repository=profile_collection_repository,
         trade_offer_service=trade_offer_service,
-        quest_service=quest_service
+        quest_service=quest_service,
+        transactions=transactions
+    )
+
+    trade_cycle_finder = Singleton(
+        TradeCycleFinder,
+        max_length=config.TRADE_CYCLE_MAX_LENGTH
+    )
+
+    trade_cycle_service = Factory(
+        TradeCycleService,
+        order_book=trade_order_book,
+        finder=trade_cycle_finder,
+        trade_offer_service=trade_offer_service,
+        profile_collection_service=profile_collection_service,
+        transactions=transactions
     )
 
     collection_integration_service = Factory(
         CollectionIntegrationService,
         profile_collection_service=profile_collection_service,
-        trade_offer_service=trade_offer_service
+        trade_offer_service=trade_offer_service,
+        trade_cycle_service=trade_cycle_service,
+        transactions=transactions
+    )
+
+    card_sampler = Singleton(
+        CardSampler,
+        repository=card_repository,
+        rarity_weights=config.RARITY_WEIGHTS,
+        seed=config.CARD_SAMPLER_SEED
     )
 
     card_service = Factory(
         CardService,
         repository=card_repository,
         profile_collection_service=profile_collection_service,
+        sampler=card_sampler,
     )
 
     profile_service = Factory(
@@ -59,5 +191,7 @@ class Container(DeclarativeContainer):
         repository=profile_repository,
         card_service=card_service,
         profile_collection_service=profile_collection_service,
-        quest_service=quest_service
+        quest_service=quest_service,
+        trade_offer_service=trade_offer_service,
+        transactions=transactions
     )
@@ -1,6 +1,8 @@
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from card_collector.core.domains.hydration import hydrate
+
 class CardIn(BaseModel):
     """Model representing card's attributes."""
     name: str
@@ -15,7 +17,7 @@ class Card(CardIn):
     @classmethod
     def from_record(cls, record: Record) -> "Card":
         """
-        A method for preparing instance based on DB record.
+        A method for preparing instance based on trusted DB record, without validation.
 
         Args:
             record (Record): The DB record.
@@ -23,10 +25,26 @@ class Card(CardIn):
         Returns:
             Card: The final Card instance.
         """
-        record_dict = dict(record)
+        return hydrate(cls, record)
+
 
-        return cls(
-            id=record_dict.get("id"),
-            name=record_dict.get("name"),
-            rarity_id=record_dict.get("rarity_id"),
-        )
+class CardReferences(BaseModel):
+    """Model representing whether rows of other tables still refer to a card."""
+    profile_collection: bool
+    trade_offer: bool
+    quest: bool
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @classmethod
+    def from_record(cls, record: Record) -> "CardReferences":
+        """
+        A method for preparing instance based on trusted DB record, without validation.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            CardReferences: The final CardReferences instance.
+        """
+        return hydrate(cls, record)
@@ -0,0 +1,11 @@
+from typing import Any, Iterable, NamedTuple, Tuple
+
+class Fixture(NamedTuple):
+    """Rows of one table loaded in bulk, with explicit ids so the rows of other tables can refer to them.
+
+    The rows are tuples in the order of the columns and may be a generator, so large
+    synthetic datasets are streamed to the storage instead of being held in memory.
+    """
+    table: str
+    columns: Tuple[str, ...]
+    rows: Iterable[Tuple[Any, ...]]
@@ -0,0 +1,38 @@
+"""A module providing the hydration of domain models from trusted DB records."""
+
+from functools import lru_cache
+from typing import Any, Mapping, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _fields(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Function getting the field names of a model, computed once per model.
+
+    Args:
+        model (Type[BaseModel]): The model.
+
+    Returns:
+        Tuple[str, ...]: The field names.
+    """
+    return tuple(model.model_fields)
+
+
+def hydrate(model: Type[Model], record: Mapping[str, Any]) -> Model:
+    """Function building a model from a trusted DB record with model_construct, without validation.
+
+    Rows read from the database already have the column types of the model. Only the fields
+    are read from the record, so columns which are not fields are ignored, and a missing
+    column raises KeyError.
+
+    Args:
+        model (Type[Model]): The model.
+        record (Mapping[str, Any]): The DB record, or any mapping of column names to values.
+
+    Returns:
+        Model: The model instance.
+    """
+    return model.model_construct(**{name: record[name] for name in _fields(model)})
@@ -1,6 +1,8 @@
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from card_collector.core.domains.hydration import hydrate
+
 class ProfileIn(BaseModel):
     """Model representing profile's attributes."""
     name: str
@@ -13,7 +15,7 @@ class Profile(ProfileIn):
 
     @classmethod
     def from_record(cls, record: Record) -> "Profile":
-        """A method for preparing instance based on DB record.
+        """A method for preparing instance based on trusted DB record, without validation.
 
         Args:
             record (Record): The DB record.
@@ -21,9 +23,11 @@ class Profile(ProfileIn):
         Returns:
             Profile: The final Profile instance.
         """
-        record_dict = dict(record)
+        return hydrate(cls, record)
 
-        return cls(
-            id=record_dict.get("id"),
-            name=record_dict.get("name"),
-        )
+class ProfileDeletion(BaseModel):
+    """Model representing the rows removed together with a profile, per table."""
+    profile: int
+    profile_collection: int
+    trade_offer: int
+    quest: int
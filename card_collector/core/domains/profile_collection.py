@@ -1,6 +1,15 @@
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from card_collector.core.domains.hydration import hydrate
+
+class NotLastCopyError(ValueError):
+    """Error raised when a copy other than the last copy of a card owned by a profile is removed or moved.
+
+    Copies are numbered 1 to the count of the card, so only the last one can go without
+    another copy taking its id.
+    """
+
 class ProfileCollectionIn(BaseModel):
     """Model representing profile collection's attributes."""
     profile_id: int
@@ -14,7 +23,7 @@ class ProfileCollection(ProfileCollectionIn):
 
     @classmethod
     def from_record(cls, record: Record) -> "ProfileCollection":
-        """A method for preparing instance based on DB record.
+        """A method for preparing instance based on trusted DB record, without validation.
 
         Args:
             record (Record): The DB record.
@@ -22,10 +31,25 @@ class ProfileCollection(ProfileCollectionIn):
         Returns:
             ProfileCollection: The final profile collection instance.
         """
-        record_dict = dict(record)
+        return hydrate(cls, record)
+
+
+class ProfileCardCount(BaseModel):
+    """Model representing the number of copies of a card owned by a profile."""
+    profile_id: int
+    card_id: int
+    count: int
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @classmethod
+    def from_record(cls, record: Record) -> "ProfileCardCount":
+        """A method for preparing instance based on trusted DB record, without validation.
+
+        Args:
+            record (Record): The DB record.
 
-        return cls(
-            id=record_dict.get("id"),
-            profile_id=record_dict.get("profile_id"),
-            card_id=record_dict.get("card_id"),
-        )
+        Returns:
+            ProfileCardCount: The final profile card count instance.
+        """
+        return hydrate(cls, record)
@@ -1,6 +1,8 @@
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from card_collector.core.domains.hydration import hydrate
+
 class QuestIn(BaseModel):
     """Model representing quest's attributes."""
     profile_id: int
@@ -16,7 +18,7 @@ class Quest(QuestIn):
 
     @classmethod
     def from_record(cls, record: Record) -> "Quest":
-        """A method for preparing instance based on DB quest.
+        """A method for preparing instance based on trusted DB quest, without validation.
 
         Args:
             record (Record): The DB quest.
@@ -24,12 +26,4 @@ class Quest(QuestIn):
         Returns:
             Quest: The final quest instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),
-            profile_id=record_dict.get("profile_id"),
-            cards_collected=record_dict.get("cards_collected"),
-            cards_needed=record_dict.get("cards_needed"),
-            reward=record_dict.get("reward"),
-        )
+        return hydrate(cls, record)
@@ -0,0 +1,78 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+class ReferenceKind(str, Enum):
+    """Enum of the rows a write can refer to, used as the error code of a missing reference."""
+    PROFILE = "profile"
+    CARD = "card"
+    OWNED_CARD = "owned_card"
+    TRADE_OFFER = "trade_offer"
+    QUEST = "quest"
+
+class Reference(BaseModel):
+    """Model representing a row referred to by a write, with the owning profile of an owned card."""
+    kind: ReferenceKind
+    id: int
+    profile_id: int | None = None
+
+    @classmethod
+    def profile(cls, profile_id: int) -> "Reference":
+        """A method for referring to a profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            Reference: The reference.
+        """
+        return cls(kind=ReferenceKind.PROFILE, id=profile_id)
+
+    @classmethod
+    def card(cls, card_id: int) -> "Reference":
+        """A method for referring to a card.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            Reference: The reference.
+        """
+        return cls(kind=ReferenceKind.CARD, id=card_id)
+
+    @classmethod
+    def owned_card(cls, profile_id: int, card_id: int) -> "Reference":
+        """A method for referring to a copy of a card in the collection of a profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            Reference: The reference.
+        """
+        return cls(kind=ReferenceKind.OWNED_CARD, id=card_id, profile_id=profile_id)
+
+    @classmethod
+    def trade_offer(cls, trade_offer_id: int) -> "Reference":
+        """A method for referring to a trade offer.
+
+        Args:
+            trade_offer_id (int): The id of the trade offer.
+
+        Returns:
+            Reference: The reference.
+        """
+        return cls(kind=ReferenceKind.TRADE_OFFER, id=trade_offer_id)
+
+    @classmethod
+    def quest(cls, quest_id: int) -> "Reference":
+        """A method for referring to a quest.
+
+        Args:
+            quest_id (int): The id of the quest.
+
+        Returns:
+            Reference: The reference.
+        """
+        return cls(kind=ReferenceKind.QUEST, id=quest_id)
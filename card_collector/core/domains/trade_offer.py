@@ -1,6 +1,8 @@
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from card_collector.core.domains.hydration import hydrate
+
 class TradeOfferIn(BaseModel):
     """Model representing trade_offer's attributes."""
     profile_posted: int
@@ -15,7 +17,7 @@ class TradeOffer(TradeOfferIn):
 
     @classmethod
     def from_record(cls, record: Record) -> "TradeOffer":
-        """A method for preparing instance based on DB record.
+        """A method for preparing instance based on trusted DB record, without validation.
 
         Args:
             record (Record): The DB record.
@@ -23,11 +25,17 @@ class TradeOffer(TradeOfferIn):
         Returns:
             TradeOffer: The final trade offer instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),
-            profile_posted=record_dict.get("profile_posted"),
-            card_offered=record_dict.get("card_offered"),
-            card_wanted=record_dict.get("card_wanted"),
-        )
+        return hydrate(cls, record)
+
+
+class TradeOfferDepth(BaseModel):
+    """Model representing the number of open trade offers with a given offer."""
+    card_offered: int
+    card_wanted: int
+    depth: int
+
+
+class TradeClearing(BaseModel):
+    """Model representing the result of clearing trade cycles."""
+    cycles: int
+    trade_offers: int
@@ -1,6 +1,6 @@
 import string
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, AsyncIterator, List
 
 from card_collector.core.domains.card import CardIn
 
@@ -15,6 +15,28 @@ class ICardRepository(ABC):
             List[Any]: Cards in the database.
         """
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The abstract class getting a page of cards ordered by id from the database.
+
+        Args:
+            limit (int): The maximal number of cards.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Cards in the database.
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[Any]:
+        """
+        The abstract class streaming all cards ordered by id from the database.
+
+        Returns:
+            AsyncIterator[Any]: Cards in the database.
+        """
+
     @abstractmethod
     async def get_all_by_rarity(self, rarity_id: int) -> List[Any]:
         """
@@ -50,6 +72,18 @@ class ICardRepository(ABC):
             Any | None: The card details.
         """
 
+    @abstractmethod
+    async def get_by_names(self, names: List[str]) -> List[Any]:
+        """
+        The abstract class getting the cards with given names.
+
+        Args:
+            names (List[str]): The names of the cards.
+
+        Returns:
+            List[Any]: The cards found, in the order of their names.
+        """
+
     @abstractmethod
     async def add_card(self, data: CardIn) -> Any | None:
         """
@@ -62,6 +96,18 @@ class ICardRepository(ABC):
             Any | None: The newly added card.
         """
 
+    @abstractmethod
+    async def add_many(self, data: List[CardIn]) -> List[Any]:
+        """
+        The abstract class adding many cards to the database with multi-row inserts.
+
+        Args:
+            data (List[CardIn]): The details of the new cards.
+
+        Returns:
+            List[Any]: The newly added cards.
+        """
+
     @abstractmethod
     async def update_card(
             self,
@@ -79,6 +125,19 @@ class ICardRepository(ABC):
             Any | None: The updated card details.
         """
 
+    @abstractmethod
+    async def has_references(self, card_id: int) -> Any:
+        """
+        The abstract class checking whether profile collections, trade offers or quests refer to a card,
+            stopping at the first referring row of each table.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            Any: The tables referring to the card.
+        """
+
     @abstractmethod
     async def delete_card(self, card_id: int) -> bool:
         """
@@ -90,4 +149,27 @@ class ICardRepository(ABC):
         Returns:
             bool: Success of the operation.
         """
-        
\ No newline at end of file
+
+    @abstractmethod
+    async def delete_many(self, card_ids: List[int]) -> List[Any]:
+        """
+        The abstract class removing cards with given ids from the database in a single statement.
+
+        Args:
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            List[Any]: The removed cards.
+        """
+
+    @abstractmethod
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The abstract class removing cards with given column values from the database in a single statement.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Any]: The removed cards.
+        """
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable
+
+from card_collector.core.domains.fixture import Fixture
+
+class IFixtureLoader(ABC):
+
+    @abstractmethod
+    async def is_seeded(self) -> bool:
+        """
+        The abstract class checking whether any table of the storage already has rows.
+
+        Returns:
+            bool: True if the storage is seeded.
+        """
+
+    @abstractmethod
+    async def load(self, fixtures: Iterable[Fixture]) -> Dict[str, int] | None:
+        """
+        The abstract class loading fixtures in bulk in one transaction, unless the storage is already seeded.
+            The fixtures are loaded in the given order, referenced tables first, and the id sequences
+            continue after the loaded ids.
+
+        Args:
+            fixtures (Iterable[Fixture]): The fixtures.
+
+        Returns:
+            Dict[str, int] | None: The number of rows loaded per table, None if the storage was already seeded.
+        """
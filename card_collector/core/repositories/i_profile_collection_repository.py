@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, List
 
 from card_collector.core.domains.profile_collection import ProfileCollectionIn
 
@@ -14,6 +14,28 @@ class IProfileCollectionRepository(ABC):
             List[Any]: Profile Collections in the database.
         """
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The abstract class getting a page of profile collections ordered by id from the database.
+
+        Args:
+            limit (int): The maximal number of profile collections.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Profile collections in the database.
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[Any]:
+        """
+        The abstract class streaming all profile collections ordered by id from the database.
+
+        Returns:
+            AsyncIterator[Any]: Profile collections in the database.
+        """
+
     @abstractmethod
     async def get_all_by_card_id(self, card_id: int) -> List[Any]:
         """
@@ -51,6 +73,57 @@ class IProfileCollectionRepository(ABC):
             List[Any]: Profile Collections in the database.
         """
 
+    @abstractmethod
+    async def get_counts_by_profile_id(self, profile_id: int) -> List[Any]:
+        """
+        The abstract class getting the number of copies of each card owned by a given profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[Any]: Card counts of the profile.
+        """
+
+    @abstractmethod
+    async def owns(self, profile_id: int, card_id: int) -> bool:
+        """
+        The abstract class checking whether a profile owns at least one copy of a card.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            bool: Whether the profile owns the card.
+        """
+
+    @abstractmethod
+    async def count_owned(self, profile_id: int, card_id: int) -> int:
+        """
+        The abstract class getting the number of copies of a card owned by a profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            int: The number of copies.
+        """
+
+    @abstractmethod
+    async def owned_counts(self, profile_id: int, card_ids: List[int]) -> Dict[int, int]:
+        """
+        The abstract class getting the number of copies of given cards owned by a profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            Dict[int, int]: The number of copies by card id, cards without a copy left out.
+        """
+
     @abstractmethod
     async def get_by_id(self, profile_collection_id: int) -> Any | None:
         """
@@ -75,6 +148,32 @@ class IProfileCollectionRepository(ABC):
             Any | None: The newly added profile collection.
         """
 
+    @abstractmethod
+    async def add_many(self, data: List[ProfileCollectionIn]) -> List[Any]:
+        """
+        The abstract class adding many profile collections to the database with multi-row inserts.
+
+        Args:
+            data (List[ProfileCollectionIn]): The details of the new profile collections.
+
+        Returns:
+            List[Any]: The newly added profile collections.
+        """
+
+    @abstractmethod
+    async def transfer(self, profile_from: int, profile_to: int, card_id: int) -> Any | None:
+        """
+        The abstract class moving a single copy of a card from one profile to another.
+
+        Args:
+            profile_from (int): The id of the profile giving the card.
+            profile_to (int): The id of the profile receiving the card.
+            card_id (int): The id of the card.
+
+        Returns:
+            Any | None: The moved profile collection, None if the giving profile has no copy.
+        """
+
     @abstractmethod
     async def update_profile_collection(
             self,
@@ -90,6 +189,9 @@ class IProfileCollectionRepository(ABC):
 
         Returns:
             Any | None: The updated profile_collection details.
+
+        Raises:
+            NotLastCopyError: If the copy is not the last copy of its card.
         """
 
     @abstractmethod
@@ -102,4 +204,34 @@ class IProfileCollectionRepository(ABC):
 
         Returns:
             bool: Success of the operation.
+
+        Raises:
+            NotLastCopyError: If the copy is not the last copy of its card.
+        """
+
+    @abstractmethod
+    async def delete_many(self, profile_collection_ids: List[int]) -> List[Any]:
+        """
+        The abstract class removing profile collections with given ids from the database in a single statement.
+
+        Args:
+            profile_collection_ids (List[int]): The ids of the profile collections.
+
+        Returns:
+            List[Any]: The removed profile collections.
+
+        Raises:
+            NotLastCopyError: If a removed copy is not among the last copies of its card.
+        """
+
+    @abstractmethod
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The abstract class removing profile collections with given column values from the database in a single statement.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Any]: The removed profile collections.
         """
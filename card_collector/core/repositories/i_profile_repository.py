@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, List
 
 from card_collector.core.domains.profile import ProfileIn
 
@@ -14,6 +14,28 @@ class IProfileRepository(ABC):
             List[Any]: Profiles in the database.
         """
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The abstract class getting a page of profiles ordered by id from the database.
+
+        Args:
+            limit (int): The maximal number of profiles.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Profiles in the database.
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[Any]:
+        """
+        The abstract class streaming all profiles ordered by id from the database.
+
+        Returns:
+            AsyncIterator[Any]: Profiles in the database.
+        """
+
     @abstractmethod
     async def get_by_id(self, profile_id: int) -> Any | None:
         """
@@ -66,3 +88,15 @@ class IProfileRepository(ABC):
         Returns:
             bool: Success of the operation.
         """
+
+    @abstractmethod
+    async def delete_cascade(self, profile_id: int) -> Dict[str, int]:
+        """
+        The abstract class removing profile together with its profile collections and quests from the database.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            Dict[str, int]: The number of removed rows per table.
+        """
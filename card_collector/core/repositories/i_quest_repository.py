@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, AsyncIterator, List
 
 from card_collector.core.domains.quest import QuestIn
 
@@ -15,6 +15,28 @@ class IQuestRepository(ABC):
 .
         """
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The abstract class getting a page of quests ordered by id from the database.
+
+        Args:
+            limit (int): The maximal number of quests.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Quests in the database.
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[Any]:
+        """
+        The abstract class streaming all quests ordered by id from the database.
+
+        Returns:
+            AsyncIterator[Any]: Quests in the database.
+        """
+
     @abstractmethod
     async def get_all_by_profile(self, profile_id: int) -> List[Any]:
         """
@@ -63,6 +85,18 @@ class IQuestRepository(ABC):
             Any | None: The newly added quest.
         """
 
+    @abstractmethod
+    async def add_many(self, data: List[QuestIn]) -> List[Any]:
+        """
+        The abstract class adding many quests to the database with multi-row inserts.
+
+        Args:
+            data (List[QuestIn]): The details of the new quests.
+
+        Returns:
+            List[Any]: The newly added quests.
+        """
+
     @abstractmethod
     async def update_quest(
             self,
@@ -80,6 +114,31 @@ class IQuestRepository(ABC):
             Any | None: The updated quest details.
         """
 
+    @abstractmethod
+    async def add_progress(self, profile_id: int, amount: int) -> int:
+        """
+        The abstract class increasing cards collected of all quests of a given profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+            amount (int): The number of collected cards.
+
+        Returns:
+            int: The number of quests of the profile completed after the update.
+        """
+
+    @abstractmethod
+    async def delete_completed_by_profile(self, profile_id: int) -> List[int]:
+        """
+        The abstract class removing completed quests of a given profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[int]: The rewards of the removed quests.
+        """
+
     @abstractmethod
     async def delete_quest(self, quest_id: int) -> bool:
         """
@@ -91,3 +150,27 @@ class IQuestRepository(ABC):
         Returns:
             bool: Success of the operation.
         """
+
+    @abstractmethod
+    async def delete_many(self, quest_ids: List[int]) -> List[Any]:
+        """
+        The abstract class removing quests with given ids from the database in a single statement.
+
+        Args:
+            quest_ids (List[int]): The ids of the quests.
+
+        Returns:
+            List[Any]: The removed quests.
+        """
+
+    @abstractmethod
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The abstract class removing quests with given column values from the database in a single statement.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Any]: The removed quests.
+        """
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from card_collector.core.domains.reference import Reference, ReferenceKind
+
+class IReferenceRepository(ABC):
+
+    @abstractmethod
+    async def exist(self, references: List[Reference]) -> List[bool]:
+        """
+        The abstract class checking in one round trip whether the referenced rows exist in the database.
+
+        Args:
+            references (List[Reference]): The references.
+
+        Returns:
+            List[bool]: Whether each reference exists, in the order of the references.
+        """
+
+    @abstractmethod
+    async def missing(self, kind: ReferenceKind, ids: List[int]) -> List[int]:
+        """
+        The abstract class finding in one round trip which of many rows of a kind do not exist in the database.
+
+        Args:
+            kind (ReferenceKind): The kind of the rows, any but an owned card.
+            ids (List[int]): The ids of the rows.
+
+        Returns:
+            List[int]: The missing ids, ascending and without duplicates.
+
+        Raises:
+            ValueError: If the kind is an owned card.
+        """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, AsyncIterator, List
 
 from card_collector.core.domains.trade_offer import TradeOfferIn
 
@@ -13,6 +13,29 @@ class ITradeOfferRepository(ABC):
         Returns:
             List[Any]: Trade Offers in the database.
         """
+
+    @abstractmethod
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The abstract class getting a page of trade offers ordered by id from the database.
+
+        Args:
+            limit (int): The maximal number of trade offers.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Trade offers in the database.
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[Any]:
+        """
+        The abstract class streaming all trade offers ordered by id from the database.
+
+        Returns:
+            AsyncIterator[Any]: Trade offers in the database.
+        """
+
     @abstractmethod
     async def get_all_by_card_offered(self, card_offered: int) -> List[Any]:
         """
@@ -75,6 +98,32 @@ class ITradeOfferRepository(ABC):
             TradeOffer | None: The trade offer details.
         """
 
+    @abstractmethod
+    async def claim_by_offer(self, card_offered: int, card_wanted: int) -> Any | None:
+        """
+        The abstract class removing and returning the oldest trade offer with a given card offered and wanted id,
+            skipping offers locked by concurrent transactions.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            Any | None: The claimed trade offer details.
+        """
+
+    @abstractmethod
+    async def claim_by_id(self, trade_offer_id: int) -> Any | None:
+        """
+        The abstract class removing and returning trade offer with a given id, unless it is locked.
+
+        Args:
+            trade_offer_id (int): The id of the trade offer.
+
+        Returns:
+            Any | None: The claimed trade offer details.
+        """
+
     @abstractmethod
     async def add_trade_offer(self, data: TradeOfferIn) -> Any | None:
         """
@@ -87,6 +136,18 @@ class ITradeOfferRepository(ABC):
             Any | None: The newly added trade offer.
         """
 
+    @abstractmethod
+    async def add_many(self, data: List[TradeOfferIn]) -> List[Any]:
+        """
+        The abstract class adding many trade offers to the database with multi-row inserts.
+
+        Args:
+            data (List[TradeOfferIn]): The details of the new trade offers.
+
+        Returns:
+            List[Any]: The newly added trade offers.
+        """
+
     @abstractmethod
     async def update_trade_offer(
             self,
@@ -115,3 +176,27 @@ class ITradeOfferRepository(ABC):
         Returns:
             bool: Success of the operation.
         """
+
+    @abstractmethod
+    async def delete_many(self, trade_offer_ids: List[int]) -> List[Any]:
+        """
+        The abstract class removing trade offers with given ids from the database in a single statement.
+
+        Args:
+            trade_offer_ids (List[int]): The ids of the trade offers.
+
+        Returns:
+            List[Any]: The removed trade offers.
+        """
+
+    @abstractmethod
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The abstract class removing trade offers with given column values from the database in a single statement.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Any]: The removed trade offers.
+        """
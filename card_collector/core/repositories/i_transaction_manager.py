@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+class ITransactionManager(ABC):
+
+    @abstractmethod
+    def transaction(self) -> Any:
+        """
+        The abstract class opening a transaction of the storage backend, nested ones being savepoints.
+            The transaction is used as an async context manager committing on success, or awaited
+            to be started by hand and finished with commit() or rollback().
+
+        Returns:
+            Any: The transaction.
+        """
+
+    @abstractmethod
+    def connection(self) -> Any:
+        """
+        The abstract class holding a connection of the storage backend for the current task.
+            Every statement and transaction of the task made while it is held runs on that connection.
+
+        Returns:
+            Any: The connection, used as an async context manager.
+        """
+
+    @abstractmethod
+    def after_commit(self, hook: Callable[[], None]) -> None:
+        """
+        The abstract class running a callback once the transactions open in the current task commit.
+            Without an open transaction the callback runs at once, and on rollback it is dropped.
+
+        Args:
+            hook (Callable[[], None]): The callback publishing a committed write to in-memory state.
+        """
+
+    @abstractmethod
+    def on_rollback(self, hook: Callable[[], None]) -> None:
+        """
+        The abstract class running a callback if the innermost transaction open in the current task rolls back.
+            Callbacks of a committed savepoint follow the enclosing transaction.
+
+        Args:
+            hook (Callable[[], None]): The callback undoing a write applied early to in-memory state.
+        """
@@ -1,8 +1,8 @@
 import string
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, AsyncIterator, List
 
-from card_collector.core.domains.card import Card, CardIn
+from card_collector.core.domains.card import Card, CardIn, CardReferences
 
 class ICardService(ABC):
 
@@ -15,6 +15,28 @@ class ICardService(ABC):
             List[Card]: All cards.
         """
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: int | None = None) -> List[Card]:
+        """
+        The method getting a page of cards ordered by id from the repository.
+
+        Args:
+            limit (int): The maximal number of cards.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Card]: Cards.
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[Card]:
+        """
+        The method streaming all cards ordered by id from the repository.
+
+        Returns:
+            AsyncIterator[Card]: Cards.
+        """
+
     async def get_all_by_rarity(self, rarity_id: int) -> List[Card]:
         """
         The method getting all cards by id from the repository.
@@ -50,6 +72,18 @@ class ICardService(ABC):
             Card | None: The card details.
         """
 
+    @abstractmethod
+    async def get_by_names(self, names: List[str]) -> List[Card]:
+        """
+        The method getting the cards with given names.
+
+        Args:
+            names (List[str]): The names of the cards.
+
+        Returns:
+            List[Card]: The cards found, in the order of their names.
+        """
+
     @abstractmethod
     async def add_card(self, data: CardIn) -> Card | None:
         """
@@ -62,6 +96,18 @@ class ICardService(ABC):
             Card | None: Details of the newly added card.
         """
 
+    @abstractmethod
+    async def add_many(self, data: List[CardIn]) -> List[Card]:
+        """
+        The method adding many cards to the database in a single transaction.
+
+        Args:
+            data (List[CardIn]): The details of the new cards.
+
+        Returns:
+            List[Card]: Full details of the newly added cards.
+        """
+
     @abstractmethod
     async def get_random_cards_by_rarity(self, amount: int, rarity_id: int) -> List[Card]:
         """
@@ -104,6 +150,18 @@ class ICardService(ABC):
             Card | None: The updated card details.
         """
 
+    @abstractmethod
+    async def has_references(self, card_id: int) -> CardReferences:
+        """
+        The method checking whether profile collections, trade offers or quests refer to a card.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            CardReferences: The tables referring to the card.
+        """
+
     @abstractmethod
     async def delete_card(self, card_id: int) -> bool:
         """
@@ -115,3 +173,27 @@ class ICardService(ABC):
         Returns:
             bool: Success of the operation.
         """
+
+    @abstractmethod
+    async def delete_many(self, card_ids: List[int]) -> List[Card]:
+        """
+        The method removing cards with given ids from the database.
+
+        Args:
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            List[Card]: The removed cards.
+        """
+
+    @abstractmethod
+    async def delete_where(self, **filters: Any) -> List[Card]:
+        """
+        The method removing cards with given column values from the database, e.g. rarity_id=1.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Card]: The removed cards.
+        """
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, AsyncIterator, Dict, List
 
-from card_collector.core.domains.profile_collection import ProfileCollection, ProfileCollectionIn
+from card_collector.core.domains.profile_collection import ProfileCardCount, ProfileCollection, ProfileCollectionIn
 
 class IProfileCollectionService(ABC):
 
@@ -14,6 +14,28 @@ class IProfileCollectionService(ABC):
             List[ProfileCollection]: All profile collections.
         """
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: int | None = None) -> List[ProfileCollection]:
+        """
+        The method getting a page of profile collections ordered by id from the repository.
+
+        Args:
+            limit (int): The maximal number of profile collections.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[ProfileCollection]: Profile collections.
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[ProfileCollection]:
+        """
+        The method streaming all profile collections ordered by id from the repository.
+
+        Returns:
+            AsyncIterator[ProfileCollection]: Profile collections.
+        """
+
     @abstractmethod
     async def get_all_by_card_id(self, card_id: int) -> List[ProfileCollection]:
         """
@@ -66,6 +88,57 @@ class IProfileCollectionService(ABC):
             List[ProfileCollection]: Profile collections.
         """
 
+    @abstractmethod
+    async def get_counts_by_profile_id(self, profile_id: int) -> List[ProfileCardCount]:
+        """
+        The method getting the number of copies of each card owned by a given profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[ProfileCardCount]: Card counts of the profile.
+        """
+
+    @abstractmethod
+    async def owns(self, profile_id: int, card_id: int) -> bool:
+        """
+        The method checking whether a profile owns at least one copy of a card.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            bool: Whether the profile owns the card.
+        """
+
+    @abstractmethod
+    async def count_owned(self, profile_id: int, card_id: int) -> int:
+        """
+        The method getting the number of copies of a card owned by a profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            int: The number of copies.
+        """
+
+    @abstractmethod
+    async def owned_counts(self, profile_id: int, card_ids: List[int]) -> Dict[int, int]:
+        """
+        The method getting the number of copies of given cards owned by a profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            Dict[int, int]: The number of copies by card id, cards without a copy left out.
+        """
+
     @abstractmethod
     async def get_by_id(self, profile_collection_id: int) -> ProfileCollection | None:
         """
@@ -90,6 +163,52 @@ class IProfileCollectionService(ABC):
             ProfileCollection | None: Full details of the newly added profile collection.
         """
 
+    @abstractmethod
+    async def add_profile_collections(self, profile_id: int, card_ids: List[int]) -> List[ProfileCollection]:
+        """
+        The method adding many cards to a profile collection in a single transaction.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            List[ProfileCollection]: Full details of the newly added profile collections.
+        """
+
+    @abstractmethod
+    async def add_many(self, data: List[ProfileCollectionIn]) -> List[ProfileCollection]:
+        """
+        The method adding many profile collections to the database in a single transaction.
+            The quests of every profile receiving cards are advanced in the same transaction.
+
+        Args:
+            data (List[ProfileCollectionIn]): The details of the new profile collections.
+
+        Returns:
+            List[ProfileCollection]: Full details of the newly added profile collections.
+        """
+
+    @abstractmethod
+    async def transfer_profile_collection(
+            self,
+            profile_from: int,
+            profile_to: int,
+            card_id: int
+    ) -> ProfileCollection | None:
+        """
+        The method moving a single copy of a card from one profile to another.
+            Must be called inside a transaction.
+
+        Args:
+            profile_from (int): The id of the profile giving the card.
+            profile_to (int): The id of the profile receiving the card.
+            card_id (int): The id of the card.
+
+        Returns:
+            ProfileCollection | None: The moved profile collection, None if the giving profile has no copy.
+        """
+
     @abstractmethod
     async def update_profile_collection(
             self,
@@ -105,6 +224,9 @@ class IProfileCollectionService(ABC):
 
         Returns:
             ProfileCollection | None: The updated profile collection details.
+
+        Raises:
+            NotLastCopyError: If the copy is not the last copy of its card.
         """
 
     @abstractmethod
@@ -117,4 +239,36 @@ class IProfileCollectionService(ABC):
 
         Returns:
             bool: Success of the operation.
+
+        Raises:
+            NotLastCopyError: If the copy is not the last copy of its card.
+        """
+
+    @abstractmethod
+    async def delete_many(self, profile_collection_ids: List[int]) -> List[ProfileCollection]:
+        """
+        The method removing profile collections with given ids from the database.
+            Trade offers of cards whose last copy was removed are removed as well.
+
+        Args:
+            profile_collection_ids (List[int]): The ids of the profile collections.
+
+        Returns:
+            List[ProfileCollection]: The removed profile collections.
+
+        Raises:
+            NotLastCopyError: If a removed copy is not among the last copies of its card.
+        """
+
+    @abstractmethod
+    async def delete_where(self, **filters: Any) -> List[ProfileCollection]:
+        """
+        The method removing profile collections with given column values from the database, e.g. profile_id=1.
+            Trade offers of cards whose last copy was removed are removed as well.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[ProfileCollection]: The removed profile collections.
         """
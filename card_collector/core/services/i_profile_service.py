@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List
 
-from card_collector.core.domains.profile import Profile, ProfileIn
+from card_collector.core.domains.profile import Profile, ProfileDeletion, ProfileIn
 from card_collector.core.domains.card import Card
 
 class IProfileService(ABC):
@@ -16,6 +16,28 @@ class IProfileService(ABC):
         """
 
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: int | None = None) -> List[Profile]:
+        """
+        The method getting a page of profiles ordered by id from the repository.
+
+        Args:
+            limit (int): The maximal number of profiles.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Profile]: Profiles.
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[Profile]:
+        """
+        The method streaming all profiles ordered by id from the repository.
+
+        Returns:
+            AsyncIterator[Profile]: Profiles.
+        """
+
     @abstractmethod
     async def get_by_id(self, profile_id: int) -> Profile | None:
         """
@@ -72,13 +94,13 @@ class IProfileService(ABC):
         """
 
     @abstractmethod
-    async def delete_profile(self, profile_id: int) -> bool:
+    async def delete_profile(self, profile_id: int) -> ProfileDeletion | None:
         """
-        The method removing profile from the database.
+        The method removing profile together with its profile collections, trade offers and quests.
 
         Args:
             profile_id (int): The id of the profile.
 
         Returns:
-            bool: Success of the operation.
+            ProfileDeletion | None: The number of removed rows per table, None if the profile does not exist.
         """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, AsyncIterator, List
 
 from card_collector.core.domains.quest import Quest, QuestIn
 
@@ -14,6 +14,28 @@ class IQuestService(ABC):
             List[Quest]: All quests.
         """
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: int | None = None) -> List[Quest]:
+        """
+        The method getting a page of quests ordered by id from the repository.
+
+        Args:
+            limit (int): The maximal number of quests.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Quest]: Quests.
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[Quest]:
+        """
+        The method streaming all quests ordered by id from the repository.
+
+        Returns:
+            AsyncIterator[Quest]: Quests.
+        """
+
     @abstractmethod
     async def get_all_by_profile(self, profile_id: int) -> List[Quest]:
         """
@@ -62,6 +84,18 @@ class IQuestService(ABC):
             Quest | None: Full details of the newly added quest.
         """
 
+    @abstractmethod
+    async def add_many(self, data: List[QuestIn]) -> List[Quest]:
+        """
+        The method adding many quests to the database in a single transaction.
+
+        Args:
+            data (List[QuestIn]): The details of the new quests.
+
+        Returns:
+            List[Quest]: Full details of the newly added quests.
+        """
+
     @abstractmethod
     async def update_quest(
             self,
@@ -79,6 +113,31 @@ class IQuestService(ABC):
             Quest | None: The updated quest details.
         """
 
+    @abstractmethod
+    async def add_progress(self, profile_id: int, amount: int) -> int:
+        """
+        The method increasing cards collected of all quests of a given profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+            amount (int): The number of collected cards.
+
+        Returns:
+            int: The number of quests of the profile completed after the update.
+        """
+
+    @abstractmethod
+    async def delete_completed_by_profile(self, profile_id: int) -> List[int]:
+        """
+        The method removing completed quests of a given profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[int]: The rewards of the removed quests.
+        """
+
     @abstractmethod
     async def delete_quest(self, quest_id: int) -> bool:
         """
@@ -90,3 +149,27 @@ class IQuestService(ABC):
         Returns:
             bool: Success of the operation.
         """
+
+    @abstractmethod
+    async def delete_many(self, quest_ids: List[int]) -> List[Quest]:
+        """
+        The method removing quests with given ids from the database.
+
+        Args:
+            quest_ids (List[int]): The ids of the quests.
+
+        Returns:
+            List[Quest]: The removed quests.
+        """
+
+    @abstractmethod
+    async def delete_where(self, **filters: Any) -> List[Quest]:
+        """
+        The method removing quests with given column values from the database, e.g. profile_id=1.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Quest]: The removed quests.
+        """
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from card_collector.core.domains.trade_offer import TradeClearing, TradeOffer
+
+class ITradeCycleService(ABC):
+
+    @abstractmethod
+    async def clear_offer(self, trade_offer: TradeOffer) -> List[TradeOffer]:
+        """
+        The method executing a trade cycle going through a given trade offer, if there is one.
+
+        Args:
+            trade_offer (TradeOffer): The trade offer.
+
+        Returns:
+            List[TradeOffer]: The completed trade offers, empty if no cycle was executed.
+        """
+
+    @abstractmethod
+    async def clear_all(self) -> TradeClearing:
+        """
+        The method executing all trade cycles found among open trade offers.
+
+        Returns:
+            TradeClearing: The number of executed cycles and completed trade offers.
+        """
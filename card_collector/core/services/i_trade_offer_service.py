@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, AsyncIterator, List
 
 from card_collector.core.domains.trade_offer import TradeOffer, TradeOfferIn
 
@@ -14,6 +14,47 @@ class ITradeOfferService(ABC):
             List[TradeOffer]: All trade offers.
         """
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: int | None = None) -> List[TradeOffer]:
+        """
+        The method getting a page of trade offers ordered by id from the repository.
+
+        Args:
+            limit (int): The maximal number of trade offers.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[TradeOffer]: Trade offers.
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[TradeOffer]:
+        """
+        The method streaming all trade offers ordered by id from the repository.
+
+        Returns:
+            AsyncIterator[TradeOffer]: Trade offers.
+        """
+
+    @abstractmethod
+    async def load_order_book(self) -> None:
+        """
+        The method hydrating the order book with all open trade offers from the repository.
+        """
+
+    @abstractmethod
+    async def get_depth(self, card_offered: int, card_wanted: int) -> int:
+        """
+        The method counting open trade offers with a given offer.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            int: The number of open trade offers.
+        """
+
     @abstractmethod
     async def get_all_by_card_offered(self, card_offered: int) -> List[TradeOffer] | None:
         """
@@ -80,6 +121,31 @@ class ITradeOfferService(ABC):
             TradeOffer | None: The trade offer details.
         """
 
+    @abstractmethod
+    async def claim_by_offer(self, card_offered: int, card_wanted: int) -> TradeOffer | None:
+        """
+        The method removing and returning the oldest trade offer with a given offer that is not locked.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            TradeOffer | None: The claimed trade offer details.
+        """
+
+    @abstractmethod
+    async def claim_by_id(self, trade_offer_id: int) -> TradeOffer | None:
+        """
+        The method removing and returning trade offer with a given id, unless it is locked.
+
+        Args:
+            trade_offer_id (int): The id of the trade offer.
+
+        Returns:
+            TradeOffer | None: The claimed trade offer details.
+        """
+
     @abstractmethod
     async def add_trade_offer(self, data: TradeOfferIn) -> TradeOffer | None:
         """
@@ -92,6 +158,18 @@ class ITradeOfferService(ABC):
             TradeOffer | None: Full details of the newly added trade offer.
         """
 
+    @abstractmethod
+    async def add_many(self, data: List[TradeOfferIn]) -> List[TradeOffer]:
+        """
+        The method adding many trade offers to the database in a single transaction.
+
+        Args:
+            data (List[TradeOfferIn]): The details of the new trade offers.
+
+        Returns:
+            List[TradeOffer]: Full details of the newly added trade offers.
+        """
+
     @abstractmethod
     async def update_trade_offer(
             self,
@@ -121,6 +199,30 @@ class ITradeOfferService(ABC):
             bool: Success of the operation.
         """
 
+    @abstractmethod
+    async def delete_many(self, trade_offer_ids: List[int]) -> List[TradeOffer]:
+        """
+        The method removing trade offers with given ids from the database.
+
+        Args:
+            trade_offer_ids (List[int]): The ids of the trade offers.
+
+        Returns:
+            List[TradeOffer]: The removed trade offers.
+        """
+
+    @abstractmethod
+    async def delete_where(self, **filters: Any) -> List[TradeOffer]:
+        """
+        The method removing trade offers with given column values from the database, e.g. profile_posted=1.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[TradeOffer]: The removed trade offers.
+        """
+
     @abstractmethod
     async def delete_trade_offer_by_profile_id_and_card_offered_id(
             self,
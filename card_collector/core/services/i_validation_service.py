@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from card_collector.core.domains.reference import Reference, ReferenceKind
+
+class IValidationService(ABC):
+
+    @abstractmethod
+    async def first_missing(self, references: List[Reference]) -> Reference | None:
+        """
+        The method checking all references of a write at once.
+
+        Args:
+            references (List[Reference]): The references, in the order their errors take precedence.
+
+        Returns:
+            Reference | None: The first missing reference, whose kind is the error code, None if all exist.
+        """
+
+    @abstractmethod
+    async def first_missing_of(self, ids_by_kind: Dict[ReferenceKind, List[int]]) -> Reference | None:
+        """
+        The method checking the many references of a bulk write with one statement per kind.
+
+        Args:
+            ids_by_kind (Dict[ReferenceKind, List[int]]): The referenced ids by kind, in the order their errors take precedence.
+
+        Returns:
+            Reference | None: The missing reference of the smallest id of the first kind with one, None if all exist.
+        """
@@ -1,17 +1,25 @@
 """A module providing database access."""
 
 import asyncio
+import time
+from contextlib import contextmanager
+from typing import Any, AsyncGenerator, Dict, Iterable, Iterator, List, Mapping, Tuple
 
 import databases
 import sqlalchemy
-from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.sql import ClauseElement
 from asyncpg.exceptions import (    # type: ignore
     CannotConnectNowError,
     ConnectionDoesNotExistError,
 )
 
+from card_collector.call_tracking import record_statement
 from card_collector.config import config
+from card_collector.core.domains.profile_collection import NotLastCopyError
+from card_collector.db_compat import asyncpg_pool
 
 metadata = sqlalchemy.MetaData()
 
@@ -21,6 +29,8 @@ card_table = sqlalchemy.Table(
     sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
     sqlalchemy.Column("name", sqlalchemy.String),
     sqlalchemy.Column("rarity_id", sqlalchemy.Integer),
+    sqlalchemy.Index("ux_card_name", "name", unique=True),
+    sqlalchemy.Index("ix_card_rarity_id", "rarity_id"),
 )
 
 profile_table = sqlalchemy.Table(
@@ -30,21 +40,16 @@ profile_table = sqlalchemy.Table(
     sqlalchemy.Column("name", sqlalchemy.String),
 )
 
-profile_collection_table = sqlalchemy.Table(
-    "profile_collection",
-    metadata,
-    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
-    sqlalchemy.Column("profile_id", sqlalchemy.Integer, sqlalchemy.ForeignKey('profile.id')),
-    sqlalchemy.Column("card_id", sqlalchemy.Integer, sqlalchemy.ForeignKey('card.id')),
-)
-
 trade_offer_table = sqlalchemy.Table(
     "trade_offer",
     metadata,
     sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
     sqlalchemy.Column("profile_posted", sqlalchemy.Integer),
     sqlalchemy.Column("card_offered", sqlalchemy.Integer, sqlalchemy.ForeignKey('card.id')),
-    sqlalchemy.Column("card_wanted", sqlalchemy.Integer, sqlalchemy.ForeignKey('card.id'))
+    sqlalchemy.Column("card_wanted", sqlalchemy.Integer, sqlalchemy.ForeignKey('card.id')),
+    sqlalchemy.Index("ix_trade_offer_card_offered_card_wanted", "card_offered", "card_wanted", "id"),
+    sqlalchemy.Index("ix_trade_offer_card_wanted", "card_wanted"),
+    sqlalchemy.Index("ix_trade_offer_profile_posted_card_offered", "profile_posted", "card_offered"),
 )
 
 quest_table = sqlalchemy.Table(
@@ -54,7 +59,124 @@ quest_table = sqlalchemy.Table(
     sqlalchemy.Column("profile_id", sqlalchemy.Integer, sqlalchemy.ForeignKey('profile.id')),
     sqlalchemy.Column("cards_collected", sqlalchemy.Integer),
     sqlalchemy.Column("cards_needed", sqlalchemy.Integer),
-    sqlalchemy.Column("reward", sqlalchemy.Integer, sqlalchemy.ForeignKey('card.id'))
+    sqlalchemy.Column("reward", sqlalchemy.Integer, sqlalchemy.ForeignKey('card.id')),
+    sqlalchemy.Index("ix_quest_table_profile_id", "profile_id"),
+    sqlalchemy.Index("ix_quest_table_reward", "reward"),
+)
+
+# The per-copy API addresses copy n (1..count) of the profile_card row i as the profile
+# collection i * COPY_ID_SPACE + n, so the count of a row stays below COPY_ID_SPACE.
+# Copies of a card are interchangeable, so only the last numbers of a row can be removed or
+# moved: removing another would hand its id to a copy that is still owned.
+COPY_ID_SPACE = 1 << 20
+
+# The ownership store: one row per card owned by a profile with the number of its copies,
+# moved by atomic count = count ± n upserts. A row is deleted with its last copy.
+profile_card_table = sqlalchemy.Table(
+    "profile_card",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.BigInteger, primary_key=True),
+    sqlalchemy.Column("profile_id", sqlalchemy.Integer, sqlalchemy.ForeignKey('profile.id'), nullable=False),
+    sqlalchemy.Column("card_id", sqlalchemy.Integer, sqlalchemy.ForeignKey('card.id'), nullable=False),
+    sqlalchemy.Column("count", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.CheckConstraint(f"count BETWEEN 1 AND {COPY_ID_SPACE - 1}", name="ck_profile_card_count"),
+    sqlalchemy.Index("ux_profile_card_profile_id_card_id", "profile_id", "card_id", unique=True),
+    sqlalchemy.Index("ix_profile_card_card_id", "card_id"),
+)
+
+copy_number = (
+    sqlalchemy.func.generate_series(1, profile_card_table.c.count)
+    .table_valued("number")
+    .render_derived()
+    .lateral("copy_number")
+)
+
+
+def profile_collection_copies(*conditions: sqlalchemy.ColumnElement) -> sqlalchemy.Select:
+    """Function expanding the profile_card rows matching given conditions into one row per copy.
+
+    Args:
+        *conditions (sqlalchemy.ColumnElement): The conditions on profile_card.
+
+    Returns:
+        sqlalchemy.Select: The id, profile_id and card_id of every copy, ordered by id.
+    """
+    return (
+        sqlalchemy.select(
+            (profile_card_table.c.id * COPY_ID_SPACE + copy_number.c.number).label("id"),
+            profile_card_table.c.profile_id,
+            profile_card_table.c.card_id,
+        )
+        .select_from(profile_card_table.join(copy_number, sqlalchemy.true()))
+        .where(*conditions)
+        .order_by(profile_card_table.c.id, copy_number.c.number)
+    )
+
+
+def copy_id(profile_card_id: int, number: int) -> int:
+    """Function getting the id of the profile collection of a copy.
+
+    Args:
+        profile_card_id (int): The id of the profile_card row.
+        number (int): The number of the copy, from 1 to the count of the row.
+
+    Returns:
+        int: The id of the profile collection.
+    """
+    return profile_card_id * COPY_ID_SPACE + number
+
+
+def copies(rows: Iterable[Mapping[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Function expanding profile_card rows into the records of their copies.
+
+    Args:
+        rows (Iterable[Mapping[str, Any]]): The profile_card rows.
+
+    Yields:
+        Dict[str, Any]: The id, profile_id and card_id of every copy, ordered by id within a row.
+    """
+    for row in rows:
+        for number in range(1, row["count"] + 1):
+            yield {"id": copy_id(row["id"], number), "profile_id": row["profile_id"], "card_id": row["card_id"]}
+
+
+def split_copy_id(profile_collection_id: int) -> Tuple[int, int]:
+    """Function splitting the id of a profile collection into its profile_card row and copy number.
+
+    Args:
+        profile_collection_id (int): The id of the profile collection.
+
+    Returns:
+        Tuple[int, int]: The id of the profile_card row and the number of the copy.
+    """
+    return divmod(profile_collection_id, COPY_ID_SPACE)
+
+
+def check_last_copies(profile_card_id: int, count: int, numbers: Iterable[int]) -> None:
+    """Function checking that removed copies of a profile_card row are its last ones.
+
+    Args:
+        profile_card_id (int): The id of the profile_card row.
+        count (int): The count of the row.
+        numbers (Iterable[int]): The distinct numbers of the removed copies, all from 1 to count.
+
+    Raises:
+        NotLastCopyError: If a copy is numbered below one that is kept.
+    """
+    numbers = sorted(numbers)
+    if numbers and numbers[0] <= count - len(numbers):
+        raise NotLastCopyError(copy_id(profile_card_id, numbers[0]))
+
+
+# The per-copy table of earlier versions, replaced by a read-only view over profile_card
+# for SQL clients. python -m card_collector.utils.migrate_profile_card converts it once.
+profile_collection_view = (
+    "CREATE OR REPLACE VIEW profile_collection AS "
+    + str(
+        profile_collection_copies()
+        .order_by(None)
+        .compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
 )
 
 db_uri = (
@@ -62,39 +184,208 @@ db_uri = (
     f"@{config.DB_HOST}/{config.DB_NAME}"
 )
 
-engine = create_async_engine(
-    db_uri,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
-)
+@contextmanager
+def _statements(count: int = 1) -> Iterator[None]:
+    """Function recording the statements sent until the block ends in the tracker of the current request.
 
-database = databases.Database(
+    Args:
+        count (int): The number of statements. Defaults to 1.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_statement(time.perf_counter() - started, count)
+
+
+class TrackedDatabase(databases.Database):
+    """A database client recording every statement it sends, and the time waited for it, per request.
+
+    The time includes waiting for the connection of the task, as the request waits for both.
+    """
+
+    async def fetch_all(self, query: ClauseElement | str, values: dict | None = None) -> List[Any]:
+        """The method fetching all rows of a query, recorded as a statement of the current request."""
+        with _statements():
+            return await super().fetch_all(query, values)
+
+    async def fetch_one(self, query: ClauseElement | str, values: dict | None = None) -> Any | None:
+        """The method fetching the first row of a query, recorded as a statement of the current request."""
+        with _statements():
+            return await super().fetch_one(query, values)
+
+    async def fetch_val(self, query: ClauseElement | str, values: dict | None = None, column: Any = 0) -> Any:
+        """The method fetching a value of the first row of a query, recorded as a statement of the current request."""
+        with _statements():
+            return await super().fetch_val(query, values, column=column)
+
+    async def execute(self, query: ClauseElement | str, values: dict | None = None) -> Any:
+        """The method executing a query, recorded as a statement of the current request."""
+        with _statements():
+            return await super().execute(query, values)
+
+    async def execute_many(self, query: ClauseElement | str, values: list) -> None:
+        """The method executing a query once per set of values, each recorded as a statement of the current request."""
+        with _statements(len(values)):
+            return await super().execute_many(query, values)
+
+    async def iterate(self, query: ClauseElement | str, values: dict | None = None) -> AsyncGenerator[Mapping, None]:
+        """The method streaming the rows of a query, recorded as a statement of the current request."""
+        # Only the time spent fetching counts, not the time the consumer spends between rows.
+        records = super().iterate(query, values)
+        elapsed = 0.0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    record = await records.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - started
+                yield record
+        finally:
+            await records.aclose()
+            record_statement(elapsed)
+
+
+# The only client of the app: one asyncpg pool, each task checking out its own connection.
+# With DB_FORCE_ROLLBACK every statement shares one connection inside a transaction rolled
+# back on disconnect, which suits tests but serializes all requests of a worker.
+database = TrackedDatabase(
     db_uri,
-    force_rollback=True,
+    force_rollback=config.DB_FORCE_ROLLBACK,
+    min_size=config.DB_POOL_MIN_SIZE,
+    max_size=config.DB_POOL_MAX_SIZE,
+    statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+    timeout=config.DB_CONNECT_TIMEOUT,
+    max_inactive_connection_lifetime=config.DB_POOL_RECYCLE,
+    command_timeout=config.DB_COMMAND_TIMEOUT,
 )
 
 
+# Rows sent in one multi-row insert, keeping a statement well below the bind parameter limit of Postgres.
+BULK_BATCH_SIZE = 1000
+
+
+def pool_connections() -> Dict[str, int]:
+    """Function counting the connections of the pool by state.
+
+    Returns:
+        Dict[str, int]: The idle and busy connections, empty while the pool is not connected.
+    """
+    pool = asyncpg_pool(database)
+    if pool is None:
+        return {}
+
+    return {"idle": pool.get_idle_size(), "busy": pool.get_size() - pool.get_idle_size()}
+
+
+def any_of(column: sqlalchemy.Column, values: List[Any]) -> sqlalchemy.ColumnElement:
+    """Function matching a column against a list of values sent as a single array parameter.
+
+    Args:
+        column (sqlalchemy.Column): The column.
+        values (List[Any]): The values.
+
+    Returns:
+        sqlalchemy.ColumnElement: The condition column = ANY(values).
+    """
+    return column == sqlalchemy.any_(
+        sqlalchemy.bindparam(None, values, type_=ARRAY(column.type))
+    )
+
+
+def equal_to(table: sqlalchemy.Table, filters: Dict[str, Any]) -> List[sqlalchemy.ColumnElement]:
+    """Function turning column filters into equality conditions.
+
+    Args:
+        table (sqlalchemy.Table): The filtered table.
+        filters (Dict[str, Any]): The values of the filtered columns.
+
+    Returns:
+        List[sqlalchemy.ColumnElement]: The conditions.
+
+    Raises:
+        ValueError: If there are no filters or a column does not exist.
+    """
+    if not filters:
+        raise ValueError(f"At least one filter of {table.name} is required")
+    if unknown := filters.keys() - table.c.keys():
+        raise ValueError(f"Unknown columns of {table.name}: {', '.join(sorted(unknown))}")
+
+    return [table.c[name] == value for name, value in filters.items()]
+
+
 async def init_db(retries: int = 5, delay: int = 5) -> None:
-    """Function initializing the DB.
+    """Function connecting the pool and initializing the DB.
 
     Args:
         retries (int, optional): Number of retries of connect to DB.
             Defaults to 5.
-        delay (int, optional): Delay of connect do DB. Defaults to 2.
+        delay (int, optional): Delay of connect do DB. Defaults to 5.
     """
     for attempt in range(retries):
         try:
-            async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
-            return
+            await database.connect()
+            break
         except (
-                OperationalError,
-                DatabaseError,
+                OSError,
+                asyncio.TimeoutError,
                 CannotConnectNowError,
                 ConnectionDoesNotExistError,
         ) as e:
             print(f"Attempt {attempt + 1} failed: {e}")
             await asyncio.sleep(delay)
+    else:
+        raise ConnectionError("Could not connect to DB after several retries.")
+
+    await create_schema()
+
+
+async def create_schema() -> None:
+    """Function creating missing tables with their indexes, and the profile_collection view.
+
+    Like create_all, indexes are only created together with their table.
+
+    Raises:
+        RuntimeError: If the per-copy profile_collection table of earlier versions has not been migrated.
+    """
+    query = "SELECT tablename FROM pg_tables WHERE schemaname = current_schema()"
+
+    async with database.transaction():
+        existing = {row["tablename"] for row in await database.fetch_all(query)}
+        if "profile_collection" in existing:
+            raise RuntimeError(
+                "The profile_collection table predates profile_card, "
+                "run python -m card_collector.utils.migrate_profile_card once"
+            )
+        for table in metadata.sorted_tables:
+            if table.name in existing:
+                continue
+            await database.execute(CreateTable(table))
+            for index in sorted(table.indexes, key=lambda ix: ix.name):
+                await database.execute(CreateIndex(index))
+        await database.execute(profile_collection_view)
+
+
+async def check_indexes() -> List[str]:
+    """Function reporting indexes declared in the metadata but missing in the DB.
+
+    Tables created before an index was declared do not get it from create_all,
+    so the missing ones have to be created by hand.
+
+    Returns:
+        List[str]: Names of the missing indexes.
+    """
+    query = "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()"
+    existing = {row["indexname"] for row in await database.fetch_all(query)}
+
+    missing = []
+    for table in metadata.sorted_tables:
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name not in existing:
+                missing.append(index.name)
+                print(f"Missing index {index.name} on {table.name}: {CreateIndex(index).compile(dialect=postgresql.dialect())}")
 
-    raise ConnectionError("Could not connect to DB after several retries.")
+    return missing
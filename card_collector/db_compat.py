@@ -0,0 +1,61 @@
+"""A module wrapping the internals of databases the app reaches past its public API.
+
+databases offers no access to the asyncpg pool, and raw_connection alone lets a task run
+asyncpg calls while a statement of databases is still running on the same connection.
+Only this module touches those internals. It was checked against the databases version
+pinned in requirements.txt, and fails loudly instead of misbehaving when they change.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import asyncpg
+import databases
+
+# The version of databases whose internals this module was checked against.
+DATABASES_VERSION = "0.9.0"
+
+if databases.__version__ != DATABASES_VERSION:
+    print(
+        f"databases {databases.__version__} is installed but card_collector.db_compat "
+        f"was checked against {DATABASES_VERSION}"
+    )
+
+
+def asyncpg_pool(database: databases.Database) -> asyncpg.Pool | None:
+    """Function getting the asyncpg pool of a database client.
+
+    Args:
+        database (databases.Database): The database client.
+
+    Returns:
+        asyncpg.Pool | None: The pool, None while the client is not connected or not backed by asyncpg.
+    """
+    return getattr(database._backend, "_pool", None)
+
+
+@asynccontextmanager
+async def raw_connection(database: databases.Database) -> AsyncIterator[asyncpg.Connection]:
+    """Function checking out the asyncpg connection of the current task for direct asyncpg calls.
+
+    The query lock of databases is held meanwhile, so that tasks sharing the connection,
+    like every task under DB_FORCE_ROLLBACK, do not run two statements on it at once.
+
+    Args:
+        database (databases.Database): The database client.
+
+    Returns:
+        AsyncIterator[asyncpg.Connection]: The connection, usable until the block ends.
+
+    Raises:
+        RuntimeError: If the installed databases no longer has the query lock.
+    """
+    async with database.connection() as connection:
+        query_lock = getattr(connection, "_query_lock", None)
+        if query_lock is None:
+            raise RuntimeError(
+                f"databases {databases.__version__} has no query lock on connections, "
+                f"card_collector.db_compat supports {DATABASES_VERSION}"
+            )
+        async with query_lock:
+            yield connection.raw_connection
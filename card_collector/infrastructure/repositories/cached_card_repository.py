@@ -0,0 +1,369 @@
+import asyncio
+import string
+import time
+from collections import Counter
+from typing import Any, AsyncIterator, Awaitable, Dict, List
+
+from card_collector.core.repositories.i_card_repository import ICardRepository
+from card_collector.core.repositories.i_transaction_manager import ITransactionManager
+from card_collector.core.domains.card import Card, CardIn
+
+class CardCatalog:
+    """
+    A snapshot of the card catalog indexed by id, name and rarity.
+    """
+
+    cards: List[Card]
+    by_id: Dict[int, Card]
+    by_name: Dict[str, Card]
+    by_rarity: Dict[int, List[Card]]
+
+    def __init__(self, cards: List[Card]) -> None:
+        """
+        The initializer of the catalog.
+
+        Args:
+            cards (List[Card]): The cards in the catalog.
+        """
+        self.cards = cards
+        self.by_id = {}
+        self.by_name = {}
+        self.by_rarity = {}
+        for card in cards:
+            self.by_id[card.id] = card
+            self.by_name[card.name] = card
+            self.by_rarity.setdefault(card.rarity_id, []).append(card)
+
+
+class CachedCardRepository(ICardRepository):
+    """
+    A read-through cache of the card catalog decorating another card repository.
+        The whole catalog is loaded at once and indexed by id, name and rarity.
+        Any write made through the repository invalidates the cache once its transaction commits,
+        so concurrent readers never cache the old catalog under the version of the write,
+        and once it rolls back. While a card write is uncommitted, a loaded catalog may hold it,
+        so nothing is published as the cache, and the writing task reads through the cache
+        to see its own writes.
+    """
+
+    _repository: ICardRepository
+    _transactions: ITransactionManager
+    _ttl: float | None
+    _lock: asyncio.Lock
+    _loaded_at: float | None
+    _catalog: CardCatalog | None
+    _writers: Counter
+
+    hits: int
+    misses: int
+    version: int
+
+    def __init__(self, repository: ICardRepository, transactions: ITransactionManager, ttl: float | None = None) -> None:
+        """
+        The initializer of the cached card repository.
+
+        Args:
+            repository (ICardRepository): The reference to the decorated repository.
+            transactions (ITransactionManager): The reference to the transaction manager.
+            ttl (float | None): Seconds after which the catalog is reloaded. Defaults to None (never).
+        """
+        self._repository = repository
+        self._transactions = transactions
+        self._ttl = ttl
+        self._lock = asyncio.Lock()
+        self._writers = Counter()
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self.invalidate()
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        The ratio of catalog reads served from the cache.
+
+        Returns:
+            float: The hit ratio, 0 if there were no reads.
+        """
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    def invalidate(self) -> None:
+        """
+        The method dropping the cached catalog, so the next read reloads it.
+        """
+        self._loaded_at = None
+        self._catalog = None
+        self.version += 1
+
+    async def _write(self, write: Awaitable[Any]) -> Any:
+        """
+        The method running a write of the decorated repository, holding back the cache until its transaction ends.
+            The cache is invalidated once the transaction commits or rolls back.
+
+        Args:
+            write (Awaitable[Any]): The write.
+
+        Returns:
+            Any: The result of the write.
+        """
+        task = asyncio.current_task()
+        self._writers[task] += 1
+
+        def settle() -> None:
+            self._writers[task] -= 1
+            if not self._writers[task]:
+                del self._writers[task]
+            self.invalidate()
+
+        try:
+            return await write
+        finally:
+            # Exactly one of the two callbacks runs: the commit one at once without a transaction.
+            self._transactions.after_commit(settle)
+            self._transactions.on_rollback(settle)
+
+    def _is_fresh(self) -> bool:
+        """
+        The method checking whether the cached catalog can be served.
+
+        Returns:
+            bool: True if the catalog is loaded and not expired.
+        """
+        if self._loaded_at is None:
+            return False
+
+        return self._ttl is None or time.monotonic() - self._loaded_at < self._ttl
+
+    async def catalog(self) -> CardCatalog:
+        """
+        The method getting the catalog, loading it if the cache is empty or expired, counting cache hits and misses.
+            A task with uncommitted card writes gets a catalog read through the cache.
+
+        Returns:
+            CardCatalog: The catalog.
+        """
+        if asyncio.current_task() in self._writers:
+            self.misses += 1
+            return CardCatalog(await self._repository.get_all_cards())
+
+        if self._is_fresh():
+            self.hits += 1
+            return self._catalog
+
+        async with self._lock:
+            if self._is_fresh():
+                self.hits += 1
+                return self._catalog
+
+            self.misses += 1
+            while True:
+                version = self.version
+                catalog = CardCatalog(await self._repository.get_all_cards())
+
+                # An uncommitted write may be in the result, so it is served without being published.
+                if self._writers:
+                    return catalog
+                # A write committed while loading invalidates the result, so it is loaded again.
+                if version == self.version:
+                    self._publish(catalog)
+                    return catalog
+
+    def _publish(self, catalog: CardCatalog) -> None:
+        """
+        The method replacing the cached catalog.
+
+        Args:
+            catalog (CardCatalog): The loaded catalog.
+        """
+        self.invalidate()
+        self._catalog = catalog
+        self._loaded_at = time.monotonic()
+
+    async def get_all_cards(self) -> List[Any]:
+        """
+        The method getting all cards from the cache.
+
+        Returns:
+            List[Any]: Cards in the catalog.
+        """
+        return list((await self.catalog()).cards)
+
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The method getting a page of cards ordered by id from the cache.
+
+        Args:
+            limit (int): The maximal number of cards.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Cards in the catalog.
+        """
+        cards = sorted((await self.catalog()).cards, key=lambda card: card.id)
+        if after is not None:
+            cards = [card for card in cards if card.id > after]
+
+        return cards[:limit]
+
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all cards ordered by id from the cache.
+
+        Returns:
+            AsyncIterator[Any]: Cards in the catalog.
+        """
+        for card in sorted((await self.catalog()).cards, key=lambda card: card.id):
+            yield card
+
+    async def get_all_by_rarity(self, rarity_id: int) -> List[Any]:
+        """
+        The method getting all cards with a given rarity from the cache.
+
+        Args:
+            rarity_id (int): The id of the rarity.
+
+        Returns:
+            List[Any]: Cards in the catalog.
+        """
+        return list((await self.catalog()).by_rarity.get(rarity_id, []))
+
+    async def get_by_id(self, card_id: int) -> Any | None:
+        """
+        The method getting card with a given id from the cache.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            Any | None: The card details.
+        """
+        return (await self.catalog()).by_id.get(card_id)
+
+    async def get_by_name(self, name: string) -> Any | None:
+        """
+        The method getting card with a given name from the cache.
+
+        Args:
+            name (string): The name of the card.
+
+        Returns:
+            Any | None: The card details.
+        """
+        return (await self.catalog()).by_name.get(name)
+
+    async def get_by_names(self, names: List[str]) -> List[Any]:
+        """
+        The method getting the cards with given names from the cache.
+
+        Args:
+            names (List[str]): The names of the cards.
+
+        Returns:
+            List[Any]: The cards found, in the order of their names.
+        """
+        by_name = (await self.catalog()).by_name
+
+        return [by_name[name] for name in names if name in by_name]
+
+    async def add_card(self, data: CardIn) -> Any | None:
+        """
+        The method adding new card and invalidating the cache once its transaction ends.
+
+        Args:
+            data (CardIn): The details of the new card.
+
+        Returns:
+            Any | None: The newly added card.
+        """
+        card = await self._write(self._repository.add_card(data))
+
+        return card
+
+    async def add_many(self, data: List[CardIn]) -> List[Any]:
+        """
+        The method adding many cards and invalidating the cache once its transaction ends.
+
+        Args:
+            data (List[CardIn]): The details of the new cards.
+
+        Returns:
+            List[Any]: The newly added cards.
+        """
+        cards = await self._write(self._repository.add_many(data))
+
+        return cards
+
+    async def update_card(
+            self,
+            card_id: int,
+            data: CardIn,
+    ) -> Any | None:
+        """
+        The method updating card data and invalidating the cache once its transaction ends.
+
+        Args:
+            card_id (int): The id of the card.
+            data (CardIn): The details of the updated card.
+
+        Returns:
+            Any | None: The updated card details.
+        """
+        card = await self._write(self._repository.update_card(card_id=card_id, data=data))
+
+        return card
+
+    async def has_references(self, card_id: int) -> Any:
+        """
+        The method checking whether rows of other tables refer to a card, which the cache does not hold.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            Any: The tables referring to the card.
+        """
+        return await self._repository.has_references(card_id)
+
+    async def delete_card(self, card_id: int) -> bool:
+        """
+        The method removing card and invalidating the cache once its transaction ends.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            bool: Success of the operation.
+        """
+        deleted = await self._write(self._repository.delete_card(card_id))
+
+        return deleted
+
+    async def delete_many(self, card_ids: List[int]) -> List[Any]:
+        """
+        The method removing cards with given ids and invalidating the cache once its transaction ends.
+
+        Args:
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            List[Any]: The removed cards.
+        """
+        cards = await self._write(self._repository.delete_many(card_ids))
+
+        return cards
+
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The method removing cards with given column values and invalidating the cache once its transaction ends.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Any]: The removed cards.
+        """
+        cards = await self._write(self._repository.delete_where(**filters))
+
+        return cards
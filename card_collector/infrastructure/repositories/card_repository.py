@@ -1,15 +1,61 @@
 import string
-from typing import Any, List
+from typing import Any, AsyncIterator, List
 
-from sqlalchemy import select
+from sqlalchemy import exists, or_, select, bindparam
 
 from card_collector.core.repositories.i_card_repository import ICardRepository
-from card_collector.core.domains.card import Card, CardIn
+from card_collector.core.domains.card import Card, CardIn, CardReferences
 from card_collector.db import (
+    BULK_BATCH_SIZE,
+    any_of,
+    equal_to,
     card_table,
     database,
+    profile_card_table,
+    quest_table,
+    trade_offer_table,
+)
+from card_collector.infrastructure.repositories.statement_registry import statements
+
+GET_ALL_BY_RARITY = statements.register(
+    "card.get_all_by_rarity",
+    (
+        select(card_table)
+        .where(card_table.c.rarity_id == bindparam("rarity_id"))
+    ),
+)
+
+GET_BY_ID = statements.register(
+    "card.get_by_id",
+    (
+        card_table.select()
+        .where(card_table.c.id == bindparam("card_id"))
+    ),
+)
+
+GET_BY_NAME = statements.register(
+    "card.get_by_name",
+    (
+        card_table.select()
+        .where(card_table.c.name == bindparam("name"))
+    ),
+)
+
+# Every EXISTS stops at the first row found through the card_id, card_offered, card_wanted and reward indexes,
+# so the check does not grow with the popularity of the card.
+HAS_REFERENCES = statements.register(
+    "card.has_references",
+    select(
+        exists().where(profile_card_table.c.card_id == bindparam("card_id")).label("profile_collection"),
+        or_(
+            exists().where(trade_offer_table.c.card_offered == bindparam("card_id")),
+            exists().where(trade_offer_table.c.card_wanted == bindparam("card_id")),
+        ).label("trade_offer"),
+        exists().where(quest_table.c.reward == bindparam("card_id")).label("quest"),
+    ),
 )
 
+
 class CardRepository(ICardRepository):
 
     async def get_all_cards(self) -> List[Any]:
@@ -27,9 +73,13 @@ class CardRepository(ICardRepository):
 
         return [Card.from_record(card) for card in cards]
 
-    async def get_all_by_rarity(self, _rarity_id: int) -> List[Any]:
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
         """
-        The method getting all cards with a given rarity from the database.
+        The method getting a page of cards ordered by id from the database, using the id as the cursor.
+
+        Args:
+            limit (int): The maximal number of cards.
+            after (int | None): The id after which the page starts. Defaults to None.
 
         Returns:
             List[Any]: Cards in the database.
@@ -37,12 +87,42 @@ class CardRepository(ICardRepository):
 
         query = (
             select(card_table)
-            .where(card_table.c.rarity_id == _rarity_id) # type: ignore
+            .order_by(card_table.c.id)
+            .limit(limit)
         )
+        if after is not None:
+            query = query.where(card_table.c.id > after)
         cards = await database.fetch_all(query)
 
         return [Card.from_record(card) for card in cards]
 
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all cards ordered by id from the database through a server-side cursor.
+
+        Returns:
+            AsyncIterator[Any]: Cards in the database.
+        """
+
+        query = (
+            select(card_table)
+            .order_by(card_table.c.id)
+        )
+        async for card in database.iterate(query):
+            yield Card.from_record(card)
+
+    async def get_all_by_rarity(self, _rarity_id: int) -> List[Any]:
+        """
+        The method getting all cards with a given rarity from the database.
+
+        Returns:
+            List[Any]: Cards in the database.
+        """
+
+        cards = await statements.fetch_all(GET_ALL_BY_RARITY, rarity_id=_rarity_id)
+
+        return [Card.from_record(card) for card in cards]
+
 
     async def get_by_id(self, card_id: int) -> Any | None:
         """
@@ -54,12 +134,7 @@ class CardRepository(ICardRepository):
         Returns:
             Any | None: The card details.
         """
-        query = (
-            card_table.select()
-            .where(card_table.c.id == card_id)
-        )
-
-        card = await database.fetch_one(query)
+        card = await statements.fetch_one(GET_BY_ID, card_id=card_id)
 
         return Card.from_record(card) if card else None
 
@@ -73,15 +148,31 @@ class CardRepository(ICardRepository):
         Returns:
             Any | None: The card details.
         """
-        query = (
-            card_table.select()
-            .where(card_table.c.name == name)
-        )
-
-        card = await database.fetch_one(query)
+        card = await statements.fetch_one(GET_BY_NAME, name=name)
 
         return Card.from_record(card) if card else None
 
+    async def get_by_names(self, names: List[str]) -> List[Any]:
+        """
+        The method getting the cards with given names with one = ANY(names) lookup of the name index.
+
+        Args:
+            names (List[str]): The names of the cards.
+
+        Returns:
+            List[Any]: The cards found, in the order of their names.
+        """
+
+        if not names:
+            return []
+
+        cards = {
+            card["name"]: Card.from_record(card)
+            for card in await database.fetch_all(card_table.select().where(any_of(card_table.c.name, names)))
+        }
+
+        return [cards[name] for name in names if name in cards]
+
     async def add_card(self, data: CardIn) -> Any | None:
         """
         The method adding new card to the database.
@@ -93,11 +184,40 @@ class CardRepository(ICardRepository):
             Any | None: The newly added card.
         """
 
-        query = card_table.insert().values(**data.model_dump())
-        new_card_id = await database.execute(query)
-        new_card = await self.get_by_id(new_card_id)
+        query = (
+            card_table.insert()
+            .values(**data.model_dump())
+            .returning(card_table)
+        )
+        new_card = await database.fetch_one(query)
+
+        return Card.from_record(new_card) if new_card else None
+
+    async def add_many(self, data: List[CardIn]) -> List[Any]:
+        """
+        The method adding many cards to the database with multi-row inserts, in batches inside one transaction.
+
+        Args:
+            data (List[CardIn]): The details of the new cards.
 
-        return Card(**dict(new_card)) if new_card else None
+        Returns:
+            List[Any]: The newly added cards.
+        """
+
+        if not data:
+            return []
+
+        new_cards = []
+        async with database.transaction():
+            for start in range(0, len(data), BULK_BATCH_SIZE):
+                query = (
+                    card_table.insert()
+                    .values([card.model_dump() for card in data[start:start + BULK_BATCH_SIZE]])
+                    .returning(card_table)
+                )
+                new_cards += await database.fetch_all(query)
+
+        return [Card.from_record(card) for card in new_cards]
 
     async def update_card(
             self,
@@ -115,19 +235,28 @@ class CardRepository(ICardRepository):
             Any | None: The updated card details.
         """
 
-        if self.get_by_id(card_id):
-            query = (
-                card_table.update()
-                .where(card_table.c.id == card_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+        query = (
+            card_table.update()
+            .where(card_table.c.id == card_id)
+            .values(**data.model_dump())
+            .returning(card_table)
+        )
+        card = await database.fetch_one(query)
+
+        return Card.from_record(card) if card else None
 
-            card = await self.get_by_id(card_id)
+    async def has_references(self, card_id: int) -> Any:
+        """
+        The method checking whether profile collections, trade offers or quests refer to a card with one EXISTS per table.
 
-            return Card(**dict(card)) if card else None
+        Args:
+            card_id (int): The id of the card.
 
-        return None
+        Returns:
+            Any: The tables referring to the card.
+        """
+
+        return CardReferences.from_record(await statements.fetch_one(HAS_REFERENCES, card_id=card_id))
 
     async def delete_card(self, card_id: int) -> bool:
         """
@@ -140,12 +269,53 @@ class CardRepository(ICardRepository):
             bool: Success of the operation.
         """
 
-        if await self.get_by_id(card_id):
-            query = card_table \
-                .delete() \
-                .where(card_table.c.id == card_id)
-            await database.execute(query)
+        query = (
+            card_table.delete()
+            .where(card_table.c.id == card_id)
+            .returning(card_table.c.id)
+        )
+
+        return await database.fetch_one(query) is not None
+
+    async def delete_many(self, card_ids: List[int]) -> List[Any]:
+        """
+        The method removing cards with given ids from the database with one delete.
+
+        Args:
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            List[Any]: The removed cards.
+        """
+
+        if not card_ids:
+            return []
+
+        query = (
+            card_table.delete()
+            .where(any_of(card_table.c.id, card_ids))
+            .returning(card_table)
+        )
+        cards = await database.fetch_all(query)
+
+        return [Card.from_record(card) for card in cards]
+
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The method removing cards with given column values from the database with one delete.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
 
-            return True
+        Returns:
+            List[Any]: The removed cards.
+        """
+
+        query = (
+            card_table.delete()
+            .where(*equal_to(card_table, filters))
+            .returning(card_table)
+        )
+        cards = await database.fetch_all(query)
 
-        return False
+        return [Card.from_record(card) for card in cards]
@@ -0,0 +1,57 @@
+from typing import Callable
+
+from databases.core import Connection
+
+from card_collector.core.repositories.i_transaction_manager import ITransactionManager
+from card_collector.db import database
+from card_collector.infrastructure.repositories.transaction_hooks import HookedTransaction, TransactionHooks
+
+class DatabaseTransactionManager(ITransactionManager):
+
+    _hooks: TransactionHooks
+
+    def __init__(self) -> None:
+        """
+        The initializer of the database transaction manager.
+        """
+        self._hooks = TransactionHooks()
+
+    def transaction(self) -> HookedTransaction:
+        """
+        The method opening a transaction on the connection of the current task.
+
+        Returns:
+            HookedTransaction: The database transaction.
+        """
+
+        return HookedTransaction(database.transaction(), self._hooks)
+
+    def connection(self) -> Connection:
+        """
+        The method checking out one pool connection shared by the current task until released.
+
+        Returns:
+            Connection: The database connection.
+        """
+
+        return database.connection()
+
+    def after_commit(self, hook: Callable[[], None]) -> None:
+        """
+        The method running a callback once the transactions open in the current task commit.
+
+        Args:
+            hook (Callable[[], None]): The callback.
+        """
+
+        self._hooks.after_commit(hook)
+
+    def on_rollback(self, hook: Callable[[], None]) -> None:
+        """
+        The method running a callback if the innermost transaction open in the current task rolls back.
+
+        Args:
+            hook (Callable[[], None]): The callback.
+        """
+
+        self._hooks.on_rollback(hook)
@@ -0,0 +1,100 @@
+from itertools import islice
+from typing import Dict, Iterable
+
+from sqlalchemy import exists, func, or_, select
+
+from card_collector.core.domains.fixture import Fixture
+from card_collector.core.repositories.i_fixture_loader import IFixtureLoader
+from card_collector.db import database, metadata
+from card_collector.db_compat import raw_connection
+
+# Rows sent in one COPY, so a batch of a streamed fixture stays small in memory.
+COPY_BATCH_SIZE = 100_000
+
+# The key of the advisory lock held while loading, so that workers starting together load the fixtures once.
+FIXTURE_LOCK_KEY = 0x66697874
+
+# Tables with an id sequence.
+SEEDED_TABLES = tuple(table for table in metadata.sorted_tables if "id" in table.c)
+
+
+class FixtureLoader(IFixtureLoader):
+    """
+    A fixture loader streaming rows into the database with COPY.
+    """
+
+    async def is_seeded(self) -> bool:
+        """
+        The method checking whether any table of the database already has rows, with one EXISTS per table.
+
+        Returns:
+            bool: True if the database is seeded.
+        """
+
+        query = select(or_(*(exists().select_from(table) for table in SEEDED_TABLES)))
+
+        return bool(await database.fetch_val(query))
+
+    async def load(self, fixtures: Iterable[Fixture]) -> Dict[str, int] | None:
+        """
+        The method loading fixtures with COPY in one transaction, unless the database is already seeded.
+            The tables are analyzed after the commit so the planner sees the new row counts.
+
+        Args:
+            fixtures (Iterable[Fixture]): The fixtures.
+
+        Returns:
+            Dict[str, int] | None: The number of rows loaded per table, None if the database was already seeded.
+
+        Raises:
+            ValueError: If a table does not exist.
+        """
+
+        loaded: Dict[str, int] = {}
+        async with database.transaction():
+            await database.fetch_val(select(func.pg_advisory_xact_lock(FIXTURE_LOCK_KEY)))
+            if await self.is_seeded():
+                return None
+
+            for fixture in fixtures:
+                if fixture.table not in metadata.tables:
+                    raise ValueError(f"Unknown table {fixture.table}")
+                loaded[fixture.table] = loaded.get(fixture.table, 0) + await self._copy(fixture)
+
+            for name in loaded:
+                table = metadata.tables[name]
+                await database.fetch_val(select(func.setval(
+                    func.pg_get_serial_sequence(name, "id"),
+                    func.coalesce(func.max(table.c.id), 0) + 1,
+                    False,
+                )))
+
+        for name in loaded:
+            await database.execute(f"ANALYZE {name}")
+
+        return loaded
+
+    @staticmethod
+    async def _copy(fixture: Fixture) -> int:
+        """
+        The method streaming the rows of a fixture with COPY, in batches.
+
+        Args:
+            fixture (Fixture): The fixture.
+
+        Returns:
+            int: The number of rows.
+        """
+
+        count = 0
+        rows = iter(fixture.rows)
+        while batch := list(islice(rows, COPY_BATCH_SIZE)):
+            async with raw_connection(database) as connection:
+                await connection.copy_records_to_table(
+                    fixture.table,
+                    columns=list(fixture.columns),
+                    records=batch,
+                )
+            count += len(batch)
+
+        return count
@@ -0,0 +1,77 @@
+import functools
+import inspect
+import time
+from typing import Any, Callable
+
+from card_collector.metrics import REPOSITORY_CALL_DURATION, REPOSITORY_CALL_ERRORS
+from card_collector.call_tracking import record_call
+
+class InstrumentedRepository:
+    """
+    A decorator of any repository recording the latency and the errors of its async methods.
+        Each call is also counted as a repository call of the current request, shaped repository.method.
+        Other attributes, async iterators included, are passed through untouched.
+        The timed method is built on first access and kept, so later calls pay one extra await.
+    """
+
+    _repository: Any
+    _name: str
+
+    def __init__(self, repository: Any, name: str) -> None:
+        """
+        The initializer of the instrumented repository.
+
+        Args:
+            repository (Any): The reference to the decorated repository.
+            name (str): The name of the repository in the metrics.
+        """
+        self._repository = repository
+        self._name = name
+
+    def __getattr__(self, attribute: str) -> Any:
+        """
+        The method getting an attribute of the decorated repository, timing it if it is an async method.
+
+        Args:
+            attribute (str): The name of the attribute.
+
+        Returns:
+            Any: The attribute.
+        """
+        value = getattr(self._repository, attribute)
+        if not inspect.iscoroutinefunction(value):
+            return value
+
+        timed = self._timed(attribute, value)
+        setattr(self, attribute, timed)
+
+        return timed
+
+    def _timed(self, method_name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        The method wrapping an async method of the decorated repository.
+
+        Args:
+            method_name (str): The name of the method.
+            method (Callable[..., Any]): The bound method.
+
+        Returns:
+            Callable[..., Any]: The timed method.
+        """
+        labels = {"repository": self._name, "method": method_name}
+        shape = f"{self._name}.{method_name}"
+
+        @functools.wraps(method)
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            except Exception:
+                REPOSITORY_CALL_ERRORS.inc(**labels)
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                REPOSITORY_CALL_DURATION.observe(elapsed, **labels)
+                record_call(shape, elapsed)
+
+        return timed
@@ -0,0 +1,224 @@
+import string
+from itertools import islice
+from typing import Any, AsyncIterator, List
+
+from card_collector.core.repositories.i_card_repository import ICardRepository
+from card_collector.core.domains.card import Card, CardIn, CardReferences
+from card_collector.db import card_table, profile_card_table, quest_table, trade_offer_table
+from card_collector.infrastructure.repositories.memory_store import MemoryStore, MemoryTable
+
+class MemoryCardRepository(ICardRepository):
+    """
+    A card repository keeping cards in the memory store.
+    """
+
+    _store: MemoryStore
+    _table: MemoryTable
+
+    def __init__(self, store: MemoryStore) -> None:
+        """
+        The initializer of the memory card repository.
+
+        Args:
+            store (MemoryStore): The reference to the memory store.
+        """
+        self._store = store
+        self._table = store.table(card_table.name)
+
+    async def get_all_cards(self) -> List[Any]:
+        """
+        The method getting all cards from the store.
+
+        Returns:
+            List[Any]: Cards in the store.
+        """
+
+        return [Card.from_record(card) for card in self._table.scan()]
+
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The method getting a page of cards ordered by id from the store.
+
+        Args:
+            limit (int): The maximal number of cards.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Cards in the store.
+        """
+
+        return [Card.from_record(card) for card in islice(self._table.scan(after), limit)]
+
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all cards ordered by id from the store.
+
+        Returns:
+            AsyncIterator[Any]: Cards in the store.
+        """
+
+        for card in self._table.scan():
+            yield Card.from_record(card)
+
+    async def get_all_by_rarity(self, rarity_id: int) -> List[Any]:
+        """
+        The method getting all cards with a given rarity from the store.
+
+        Args:
+            rarity_id (int): The id of the rarity.
+
+        Returns:
+            List[Any]: Cards in the store.
+        """
+
+        return [Card.from_record(card) for card in self._table.select(rarity_id=rarity_id)]
+
+    async def get_by_id(self, card_id: int) -> Any | None:
+        """
+        The method getting card with a given id.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            Any | None: The card details.
+        """
+
+        card = self._table.get(card_id)
+
+        return Card.from_record(card) if card else None
+
+    async def get_by_name(self, name: string) -> Any | None:
+        """
+        The method getting card with a given name.
+
+        Args:
+            name (string): The name of the card.
+
+        Returns:
+            Any | None: The card details.
+        """
+
+        cards = self._table.select(name=name)
+
+        return Card.from_record(cards[0]) if cards else None
+
+    async def get_by_names(self, names: List[str]) -> List[Any]:
+        """
+        The method getting the cards with given names.
+
+        Args:
+            names (List[str]): The names of the cards.
+
+        Returns:
+            List[Any]: The cards found, in the order of their names.
+        """
+
+        return [Card.from_record(card) for name in names for card in self._table.select(name=name)]
+
+    async def add_card(self, data: CardIn) -> Any | None:
+        """
+        The method adding new card to the store.
+
+        Args:
+            data (CardIn): The details of the new card.
+
+        Returns:
+            Any | None: The newly added card.
+        """
+
+        return Card.from_record(self._table.insert(data.model_dump()))
+
+    async def add_many(self, data: List[CardIn]) -> List[Any]:
+        """
+        The method adding many cards to the store in one transaction.
+
+        Args:
+            data (List[CardIn]): The details of the new cards.
+
+        Returns:
+            List[Any]: The newly added cards.
+        """
+
+        async with self._store.transaction():
+            return [Card.from_record(self._table.insert(card.model_dump())) for card in data]
+
+    async def update_card(
+            self,
+            card_id: int,
+            data: CardIn,
+    ) -> Any | None:
+        """
+        The method updating card data in the store.
+
+        Args:
+            card_id (int): The id of the card.
+            data (CardIn): The details of the updated card.
+
+        Returns:
+            Any | None: The updated card details.
+        """
+
+        card = self._table.update(card_id, data.model_dump())
+
+        return Card.from_record(card) if card else None
+
+    async def has_references(self, card_id: int) -> Any:
+        """
+        The method checking whether profile collections, trade offers or quests in the store refer to a card.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            Any: The tables referring to the card.
+        """
+
+        trade_offers = self._store.table(trade_offer_table.name)
+
+        return CardReferences(
+            profile_collection=self._store.table(profile_card_table.name).exists(card_id=card_id),
+            trade_offer=trade_offers.exists(card_offered=card_id) or trade_offers.exists(card_wanted=card_id),
+            quest=self._store.table(quest_table.name).exists(reward=card_id),
+        )
+
+    async def delete_card(self, card_id: int) -> bool:
+        """
+        The method removing card from the store.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        return self._table.delete(card_id) is not None
+
+    async def delete_many(self, card_ids: List[int]) -> List[Any]:
+        """
+        The method removing cards with given ids from the store.
+
+        Args:
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            List[Any]: The removed cards.
+        """
+
+        cards = [self._table.delete(card_id) for card_id in card_ids]
+
+        return [Card.from_record(card) for card in cards if card]
+
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The method removing cards with given column values from the store.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Any]: The removed cards.
+        """
+
+        return [Card.from_record(card) for card in self._table.delete_where(**filters)]
@@ -0,0 +1,62 @@
+from typing import Dict, Iterable
+
+from card_collector.core.domains.fixture import Fixture
+from card_collector.core.repositories.i_fixture_loader import IFixtureLoader
+from card_collector.infrastructure.repositories.memory_store import MemoryStore
+
+class MemoryFixtureLoader(IFixtureLoader):
+    """
+    A fixture loader inserting rows into the memory store.
+    """
+
+    _store: MemoryStore
+
+    def __init__(self, store: MemoryStore) -> None:
+        """
+        The initializer of the memory fixture loader.
+
+        Args:
+            store (MemoryStore): The reference to the memory store.
+        """
+        self._store = store
+
+    async def is_seeded(self) -> bool:
+        """
+        The method checking whether any table of the store already has rows.
+
+        Returns:
+            bool: True if the store is seeded.
+        """
+
+        return any(len(table) for table in self._store.tables())
+
+    async def load(self, fixtures: Iterable[Fixture]) -> Dict[str, int] | None:
+        """
+        The method loading fixtures into the store in one transaction, unless the store is already seeded.
+
+        Args:
+            fixtures (Iterable[Fixture]): The fixtures.
+
+        Returns:
+            Dict[str, int] | None: The number of rows loaded per table, None if the store was already seeded.
+
+        Raises:
+            ValueError: If a table does not exist.
+        """
+
+        if await self.is_seeded():
+            return None
+
+        loaded: Dict[str, int] = {}
+        async with self._store.transaction():
+            for fixture in fixtures:
+                if fixture.table not in {table.name for table in self._store.tables()}:
+                    raise ValueError(f"Unknown table {fixture.table}")
+                table = self._store.table(fixture.table)
+                count = 0
+                for row in fixture.rows:
+                    table.insert(dict(zip(fixture.columns, row)))
+                    count += 1
+                loaded[fixture.table] = loaded.get(fixture.table, 0) + count
+
+        return loaded
@@ -0,0 +1,389 @@
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List
+
+from card_collector.core.repositories.i_profile_collection_repository import IProfileCollectionRepository
+from card_collector.core.domains.profile_collection import ProfileCardCount, ProfileCollection, ProfileCollectionIn
+from card_collector.db import check_last_copies, copies, copy_id, profile_card_table, split_copy_id
+from card_collector.infrastructure.repositories.memory_store import MemoryStore, MemoryTable, Row
+
+class MemoryProfileCollectionRepository(IProfileCollectionRepository):
+    """
+    A profile collection repository serving the per-copy API from the profile_card rows of the memory store.
+    """
+
+    _store: MemoryStore
+    _table: MemoryTable
+
+    def __init__(self, store: MemoryStore) -> None:
+        """
+        The initializer of the memory profile collection repository.
+
+        Args:
+            store (MemoryStore): The reference to the memory store.
+        """
+        self._store = store
+        self._table = store.table(profile_card_table.name)
+
+    async def get_all_profile_collections(self) -> List[Any]:
+        """
+        The method getting all profile collections from the store.
+
+        Returns:
+            List[Any]: Profile collections in the store.
+        """
+
+        return [ProfileCollection.from_record(profile_collection) for profile_collection in copies(self._table.scan())]
+
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The method getting a page of profile collections ordered by id from the store.
+
+        Args:
+            limit (int): The maximal number of profile collections.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Profile collections in the store.
+        """
+
+        rows = self._table.scan(split_copy_id(after)[0] - 1 if after is not None else None)
+        profile_collections = (
+            profile_collection for profile_collection in copies(rows)
+            if after is None or profile_collection["id"] > after
+        )
+
+        return [ProfileCollection.from_record(profile_collection) for profile_collection in islice(profile_collections, limit)]
+
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all profile collections ordered by id from the store.
+
+        Returns:
+            AsyncIterator[Any]: Profile collections in the store.
+        """
+
+        for profile_collection in copies(self._table.scan()):
+            yield ProfileCollection.from_record(profile_collection)
+
+    async def get_all_by_card_id(self, card_id: int) -> List[Any]:
+        """
+        The method getting all profile collections with a given card id from the store.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            List[Any]: Profile collections in the store.
+        """
+
+        return [
+            ProfileCollection.from_record(profile_collection)
+            for profile_collection in copies(self._table.select(card_id=card_id))
+        ]
+
+    async def get_all_by_profile_id(self, profile_id: int) -> List[Any]:
+        """
+        The method getting all profile collections with a given profile id from the store.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[Any]: Profile collections in the store.
+        """
+
+        return [
+            ProfileCollection.from_record(profile_collection)
+            for profile_collection in copies(self._table.select(profile_id=profile_id))
+        ]
+
+    async def get_all_profile_collections_by_profile_id_and_card_id(self, card_id: int, profile_id: int) -> List[Any]:
+        """
+        The method getting all profile collections with a given profile id and card id from the store.
+
+        Args:
+            card_id (int): The id of the card.
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[Any]: Profile collections in the store.
+        """
+
+        return [
+            ProfileCollection.from_record(profile_collection)
+            for profile_collection in copies(self._table.select(profile_id=profile_id, card_id=card_id))
+        ]
+
+    async def get_counts_by_profile_id(self, profile_id: int) -> List[Any]:
+        """
+        The method getting the number of copies of each card owned by a given profile, ordered by card id.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[Any]: The card counts.
+        """
+
+        rows = sorted(self._table.select(profile_id=profile_id), key=lambda row: row["card_id"])
+
+        return [ProfileCardCount.from_record(row) for row in rows]
+
+    async def owns(self, profile_id: int, card_id: int) -> bool:
+        """
+        The method checking whether a profile owns at least one copy of a card in the store.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            bool: Whether the profile owns the card.
+        """
+
+        return self._table.exists(profile_id=profile_id, card_id=card_id)
+
+    async def count_owned(self, profile_id: int, card_id: int) -> int:
+        """
+        The method getting the number of copies of a card owned by a profile in the store.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            int: The number of copies.
+        """
+
+        rows = self._table.select(profile_id=profile_id, card_id=card_id)
+
+        return rows[0]["count"] if rows else 0
+
+    async def owned_counts(self, profile_id: int, card_ids: List[int]) -> Dict[int, int]:
+        """
+        The method getting the number of copies of given cards owned by a profile in the store.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            Dict[int, int]: The number of copies by card id, cards without a copy left out.
+        """
+
+        wanted = set(card_ids)
+
+        return {row["card_id"]: row["count"] for row in self._table.select(profile_id=profile_id) if row["card_id"] in wanted}
+
+    async def get_by_id(self, profile_collection_id: int) -> Any | None:
+        """
+        The method getting profile collection with a given id.
+
+        Args:
+            profile_collection_id (int): The id of the profile collection.
+
+        Returns:
+            Any | None: The profile collection details.
+        """
+
+        profile_card_id, number = split_copy_id(profile_collection_id)
+        row = self._table.get(profile_card_id)
+        if row is None or not 1 <= number <= row["count"]:
+            return None
+
+        return ProfileCollection.from_record({**row, "id": profile_collection_id})
+
+    async def add_profile_collection(self, data: ProfileCollectionIn) -> Any | None:
+        """
+        The method adding a copy of a card to a profile in the store.
+
+        Args:
+            data (ProfileCollectionIn): The details of the new profile collection.
+
+        Returns:
+            Any | None: The newly added profile collection.
+        """
+
+        return self._last_copy(self._add(data.profile_id, data.card_id))
+
+    async def add_many(self, data: List[ProfileCollectionIn]) -> List[Any]:
+        """
+        The method adding many copies to the store in one transaction.
+
+        Args:
+            data (List[ProfileCollectionIn]): The details of the new profile collections.
+
+        Returns:
+            List[Any]: The newly added profile collections, in the order of the data.
+        """
+
+        async with self._store.transaction():
+            return [
+                self._last_copy(self._add(profile_collection.profile_id, profile_collection.card_id))
+                for profile_collection in data
+            ]
+
+    async def transfer(self, profile_from: int, profile_to: int, card_id: int) -> Any | None:
+        """
+        The method moving a copy of a card from one profile to another.
+
+        Args:
+            profile_from (int): The id of the profile giving the card.
+            profile_to (int): The id of the profile receiving the card.
+            card_id (int): The id of the card.
+
+        Returns:
+            Any | None: The moved profile collection, None if the giving profile has no copy.
+        """
+
+        rows = self._table.select(profile_id=profile_from, card_id=card_id)
+        if not rows:
+            return None
+        if profile_from == profile_to:
+            return self._last_copy(rows[0])
+
+        self._take(rows[0], 1)
+
+        return self._last_copy(self._add(profile_to, card_id))
+
+    async def update_profile_collection(
+            self,
+            profile_collection_id: int,
+            data: ProfileCollectionIn,
+    ) -> Any | None:
+        """
+        The method moving a copy to the profile and card of the data in the store.
+
+        Args:
+            profile_collection_id (int): The id of the profile collection.
+            data (ProfileCollectionIn): The details of the updated profile collection.
+
+        Returns:
+            Any | None: The updated profile collection details.
+
+        Raises:
+            NotLastCopyError: If the copy is not the last copy of its card.
+        """
+
+        profile_collection = await self.get_by_id(profile_collection_id)
+        if profile_collection is None:
+            return None
+        if (profile_collection.profile_id, profile_collection.card_id) == (data.profile_id, data.card_id):
+            return profile_collection
+
+        profile_card_id, number = split_copy_id(profile_collection_id)
+        row = self._table.get(profile_card_id)
+        check_last_copies(profile_card_id, row["count"], [number])
+        self._take(row, 1)
+
+        return self._last_copy(self._add(data.profile_id, data.card_id))
+
+    async def delete_profile_collection(self, profile_collection_id: int) -> bool:
+        """
+        The method removing profile collection from the store.
+
+        Args:
+            profile_collection_id (int): The id of the profile collection.
+
+        Returns:
+            bool: Success of the operation.
+
+        Raises:
+            NotLastCopyError: If the copy is not the last copy of its card.
+        """
+
+        return bool(await self.delete_many([profile_collection_id]))
+
+    async def delete_many(self, profile_collection_ids: List[int]) -> List[Any]:
+        """
+        The method removing profile collections with given ids from the store.
+
+        Args:
+            profile_collection_ids (List[int]): The ids of the profile collections.
+
+        Returns:
+            List[Any]: The removed profile collections.
+
+        Raises:
+            NotLastCopyError: If a removed copy is not among the last copies of its card.
+        """
+
+        removed = [
+            profile_collection for profile_collection_id in dict.fromkeys(profile_collection_ids)
+            if (profile_collection := await self.get_by_id(profile_collection_id))
+        ]
+        taken: Dict[int, List[int]] = {}
+        for profile_collection in removed:
+            profile_card_id, number = split_copy_id(profile_collection.id)
+            taken.setdefault(profile_card_id, []).append(number)
+        for profile_card_id, numbers in taken.items():
+            check_last_copies(profile_card_id, self._table.get(profile_card_id)["count"], numbers)
+        for profile_card_id, numbers in taken.items():
+            self._take(self._table.get(profile_card_id), len(numbers))
+
+        return removed
+
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The method removing all copies with given profile or card ids from the store.
+
+        Args:
+            **filters (Any): The values of profile_id and card_id.
+
+        Returns:
+            List[Any]: The removed profile collections.
+
+        Raises:
+            ValueError: If there are no filters or a filter is not profile_id or card_id.
+        """
+
+        if unknown := filters.keys() - {"profile_id", "card_id"}:
+            raise ValueError(f"Profile collections are only filtered by profile_id and card_id, not {', '.join(sorted(unknown))}")
+
+        return [ProfileCollection.from_record(profile_collection) for profile_collection in copies(self._table.delete_where(**filters))]
+
+    def _add(self, profile_id: int, card_id: int) -> Row:
+        """
+        The method adding a copy to the profile_card row of a profile and card, creating the row if it is missing.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            Row: The row.
+        """
+
+        rows = self._table.select(profile_id=profile_id, card_id=card_id)
+        if not rows:
+            return self._table.insert({"profile_id": profile_id, "card_id": card_id, "count": 1})
+
+        return self._table.update(rows[0]["id"], {"count": rows[0]["count"] + 1})
+
+    def _take(self, row: Row, amount: int) -> None:
+        """
+        The method removing copies from a profile_card row, deleting it with its last copy.
+
+        Args:
+            row (Row): The row.
+            amount (int): The number of copies.
+        """
+
+        if row["count"] <= amount:
+            self._table.delete(row["id"])
+        else:
+            self._table.update(row["id"], {"count": row["count"] - amount})
+
+    @staticmethod
+    def _last_copy(row: Row) -> ProfileCollection:
+        """
+        The method getting the last copy of a profile_card row, the one added last.
+
+        Args:
+            row (Row): The row.
+
+        Returns:
+            ProfileCollection: The copy.
+        """
+
+        return ProfileCollection.from_record({**row, "id": copy_id(row["id"], row["count"])})
@@ -0,0 +1,140 @@
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List
+
+from card_collector.core.repositories.i_profile_repository import IProfileRepository
+from card_collector.core.domains.profile import Profile, ProfileIn
+from card_collector.db import profile_card_table, profile_table, quest_table
+from card_collector.infrastructure.repositories.memory_store import MemoryStore, MemoryTable
+
+class MemoryProfileRepository(IProfileRepository):
+    """
+    A profile repository keeping profiles in the memory store.
+    """
+
+    _store: MemoryStore
+    _table: MemoryTable
+
+    def __init__(self, store: MemoryStore) -> None:
+        """
+        The initializer of the memory profile repository.
+
+        Args:
+            store (MemoryStore): The reference to the memory store.
+        """
+        self._store = store
+        self._table = store.table(profile_table.name)
+
+    async def get_all_profiles(self) -> List[Any]:
+        """
+        The method getting all profiles from the store.
+
+        Returns:
+            List[Any]: Profiles in the store.
+        """
+
+        return [Profile.from_record(profile) for profile in self._table.scan()]
+
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The method getting a page of profiles ordered by id from the store.
+
+        Args:
+            limit (int): The maximal number of profiles.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Profiles in the store.
+        """
+
+        return [Profile.from_record(profile) for profile in islice(self._table.scan(after), limit)]
+
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all profiles ordered by id from the store.
+
+        Returns:
+            AsyncIterator[Any]: Profiles in the store.
+        """
+
+        for profile in self._table.scan():
+            yield Profile.from_record(profile)
+
+    async def get_by_id(self, profile_id: int) -> Any | None:
+        """
+        The method getting profile with a given id.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            Any | None: The profile details.
+        """
+
+        profile = self._table.get(profile_id)
+
+        return Profile.from_record(profile) if profile else None
+
+    async def add_profile(self, data: ProfileIn) -> Any | None:
+        """
+        The method adding new profile to the store.
+
+        Args:
+            data (ProfileIn): The details of the new profile.
+
+        Returns:
+            Any | None: The newly added profile.
+        """
+
+        return Profile.from_record(self._table.insert(data.model_dump()))
+
+    async def update_profile(
+            self,
+            profile_id: int,
+            data: ProfileIn,
+    ) -> Any | None:
+        """
+        The method updating profile data in the store.
+
+        Args:
+            profile_id (int): The id of the profile.
+            data (ProfileIn): The details of the updated profile.
+
+        Returns:
+            Any | None: The updated profile details.
+        """
+
+        profile = self._table.update(profile_id, data.model_dump())
+
+        return Profile.from_record(profile) if profile else None
+
+    async def delete_profile(self, profile_id: int) -> bool:
+        """
+        The method removing profile from the store.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        return self._table.delete(profile_id) is not None
+
+    async def delete_cascade(self, profile_id: int) -> Dict[str, int]:
+        """
+        The method removing profile together with its profile collections and quests from the store.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            Dict[str, int]: The number of removed rows per table.
+        """
+
+        async with self._store.transaction():
+            return {
+                "profile_collection": sum(
+                    row["count"] for row in self._store.table(profile_card_table.name).delete_where(profile_id=profile_id)),
+                "quest": len(self._store.table(quest_table.name).delete_where(profile_id=profile_id)),
+                "profile": int(self._table.delete(profile_id) is not None),
+            }
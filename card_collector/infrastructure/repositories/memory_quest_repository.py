@@ -0,0 +1,225 @@
+from itertools import islice
+from typing import Any, AsyncIterator, List
+
+from card_collector.core.repositories.i_quest_repository import IQuestRepository
+from card_collector.core.domains.quest import Quest, QuestIn
+from card_collector.db import quest_table
+from card_collector.infrastructure.repositories.memory_store import MemoryStore, MemoryTable
+
+class MemoryQuestRepository(IQuestRepository):
+    """
+    A quest repository keeping quests in the memory store.
+    """
+
+    _store: MemoryStore
+    _table: MemoryTable
+
+    def __init__(self, store: MemoryStore) -> None:
+        """
+        The initializer of the memory quest repository.
+
+        Args:
+            store (MemoryStore): The reference to the memory store.
+        """
+        self._store = store
+        self._table = store.table(quest_table.name)
+
+    async def get_all_quests(self) -> List[Any]:
+        """
+        The method getting all quests from the store.
+
+        Returns:
+            List[Any]: Quests in the store.
+        """
+
+        return [Quest.from_record(quest) for quest in self._table.scan()]
+
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The method getting a page of quests ordered by id from the store.
+
+        Args:
+            limit (int): The maximal number of quests.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Quests in the store.
+        """
+
+        return [Quest.from_record(quest) for quest in islice(self._table.scan(after), limit)]
+
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all quests ordered by id from the store.
+
+        Returns:
+            AsyncIterator[Any]: Quests in the store.
+        """
+
+        for quest in self._table.scan():
+            yield Quest.from_record(quest)
+
+    async def get_all_by_profile(self, profile_id: int) -> List[Any]:
+        """
+        The method getting all quests of a given profile from the store.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[Any]: Quests in the store.
+        """
+
+        return [Quest.from_record(quest) for quest in self._table.select(profile_id=profile_id)]
+
+    async def get_all_by_reward(self, reward_id: int) -> List[Any]:
+        """
+        The method getting all quests with a given reward from the store.
+
+        Args:
+            reward_id (int): The id of the rewarded card.
+
+        Returns:
+            List[Any]: Quests in the store.
+        """
+
+        return [Quest.from_record(quest) for quest in self._table.select(reward=reward_id)]
+
+    async def get_by_id(self, quest_id: int) -> Any | None:
+        """
+        The method getting quest with a given id.
+
+        Args:
+            quest_id (int): The id of the quest.
+
+        Returns:
+            Any | None: The quest details.
+        """
+
+        quest = self._table.get(quest_id)
+
+        return Quest.from_record(quest) if quest else None
+
+    async def add_quest(self, data: QuestIn) -> Any | None:
+        """
+        The method adding new quest to the store.
+
+        Args:
+            data (QuestIn): The details of the new quest.
+
+        Returns:
+            Any | None: The newly added quest.
+        """
+
+        return Quest.from_record(self._table.insert(data.model_dump()))
+
+    async def add_many(self, data: List[QuestIn]) -> List[Any]:
+        """
+        The method adding many quests to the store in one transaction.
+
+        Args:
+            data (List[QuestIn]): The details of the new quests.
+
+        Returns:
+            List[Any]: The newly added quests.
+        """
+
+        async with self._store.transaction():
+            return [Quest.from_record(self._table.insert(quest.model_dump())) for quest in data]
+
+    async def update_quest(
+            self,
+            quest_id: int,
+            data: QuestIn,
+    ) -> Any | None:
+        """
+        The method updating quest data in the store.
+
+        Args:
+            quest_id (int): The id of the quest.
+            data (QuestIn): The details of the updated quest.
+
+        Returns:
+            Any | None: The updated quest details.
+        """
+
+        quest = self._table.update(quest_id, data.model_dump())
+
+        return Quest.from_record(quest) if quest else None
+
+    async def add_progress(self, profile_id: int, amount: int) -> int:
+        """
+        The method increasing cards collected of all quests of a given profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+            amount (int): The number of collected cards.
+
+        Returns:
+            int: The number of quests of the profile completed after the update.
+        """
+
+        completed = 0
+        for quest in self._table.select(profile_id=profile_id):
+            quest = self._table.update(quest["id"], {"cards_collected": quest["cards_collected"] + amount})
+            completed += quest["cards_collected"] >= quest["cards_needed"]
+
+        return completed
+
+    async def delete_completed_by_profile(self, profile_id: int) -> List[int]:
+        """
+        The method removing completed quests of a given profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[int]: The rewards of the removed quests.
+        """
+
+        return [
+            self._table.delete(quest["id"])["reward"]
+            for quest in self._table.select(profile_id=profile_id)
+            if quest["cards_collected"] >= quest["cards_needed"]
+        ]
+
+    async def delete_quest(self, quest_id: int) -> bool:
+        """
+        The method removing quest from the store.
+
+        Args:
+            quest_id (int): The id of the quest.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        return self._table.delete(quest_id) is not None
+
+    async def delete_many(self, quest_ids: List[int]) -> List[Any]:
+        """
+        The method removing quests with given ids from the store.
+
+        Args:
+            quest_ids (List[int]): The ids of the quests.
+
+        Returns:
+            List[Any]: The removed quests.
+        """
+
+        quests = [self._table.delete(quest_id) for quest_id in quest_ids]
+
+        return [Quest.from_record(quest) for quest in quests if quest]
+
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The method removing quests with given column values from the store.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Any]: The removed quests.
+        """
+
+        return [Quest.from_record(quest) for quest in self._table.delete_where(**filters)]
@@ -0,0 +1,90 @@
+from typing import List
+
+from card_collector.core.domains.reference import Reference, ReferenceKind
+from card_collector.core.repositories.i_reference_repository import IReferenceRepository
+from card_collector.db import (
+    card_table,
+    profile_card_table,
+    profile_table,
+    quest_table,
+    trade_offer_table,
+)
+from card_collector.infrastructure.repositories.memory_store import MemoryStore
+
+# The table of each kind of reference with an id of its own.
+TABLES_BY_KIND = {
+    ReferenceKind.PROFILE: profile_table,
+    ReferenceKind.CARD: card_table,
+    ReferenceKind.TRADE_OFFER: trade_offer_table,
+    ReferenceKind.QUEST: quest_table,
+}
+
+class MemoryReferenceRepository(IReferenceRepository):
+    """
+    A reference repository looking the referenced rows up in the memory store.
+    """
+
+    _store: MemoryStore
+
+    def __init__(self, store: MemoryStore) -> None:
+        """
+        The initializer of the memory reference repository.
+
+        Args:
+            store (MemoryStore): The reference to the memory store.
+        """
+        self._store = store
+
+    async def exist(self, references: List[Reference]) -> List[bool]:
+        """
+        The method checking whether the referenced rows exist in the store.
+
+        Args:
+            references (List[Reference]): The references.
+
+        Returns:
+            List[bool]: Whether each reference exists, in the order of the references.
+        """
+
+        return [self._exists(reference) for reference in references]
+
+    async def missing(self, kind: ReferenceKind, ids: List[int]) -> List[int]:
+        """
+        The method finding which of many rows of a kind do not exist in the store.
+
+        Args:
+            kind (ReferenceKind): The kind of the rows, any but an owned card.
+            ids (List[int]): The ids of the rows.
+
+        Returns:
+            List[int]: The missing ids, ascending and without duplicates.
+
+        Raises:
+            ValueError: If the kind is an owned card.
+        """
+
+        if kind is ReferenceKind.OWNED_CARD:
+            raise ValueError("Owned cards are checked by reference, with their profile")
+
+        table = self._store.table(TABLES_BY_KIND[kind].name)
+
+        return [row_id for row_id in sorted(set(ids)) if table.get(row_id) is None]
+
+    def _exists(self, reference: Reference) -> bool:
+        """
+        The method checking whether one referenced row exists in the store.
+
+        Args:
+            reference (Reference): The reference.
+
+        Returns:
+            bool: Whether the reference exists.
+        """
+
+        if reference.kind is ReferenceKind.OWNED_CARD:
+            return self._store.table(profile_card_table.name).exists(
+                profile_id=reference.profile_id,
+                card_id=reference.id,
+            )
+
+        return self._store.table(TABLES_BY_KIND[reference.kind].name).get(reference.id) is not None
@@ -0,0 +1,381 @@
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+import sqlalchemy
+
+from card_collector.core.repositories.i_transaction_manager import ITransactionManager
+from card_collector.db import metadata
+from card_collector.infrastructure.repositories.transaction_hooks import HookedTransaction, TransactionHooks
+
+Row = Dict[str, Any]
+
+
+class MemoryTable:
+    """
+    An in-memory table of rows keyed by an id sequence, with hash indexes on the leading column
+        of every index declared in the metadata and the columns of its unique indexes enforced.
+        Rows handed out are copies, like fetched records.
+    """
+
+    name: str
+    _columns: Tuple[str, ...]
+    _unique: Tuple[Tuple[str, ...], ...]
+    _rows: Dict[int, Row]
+    _indexes: Dict[str, Dict[Any, Dict[int, None]]]
+    _next_id: int
+    _log: Callable[[Callable[[], None]], None]
+
+    def __init__(self, table: sqlalchemy.Table, log: Callable[[Callable[[], None]], None]) -> None:
+        """
+        The initializer of the memory table.
+
+        Args:
+            table (sqlalchemy.Table): The declaration of the table.
+            log (Callable[[Callable[[], None]], None]): The callback recording how to undo a write.
+        """
+        self.name = table.name
+        self._columns = tuple(table.c.keys())
+        self._unique = tuple(tuple(column.name for column in index.columns) for index in table.indexes if index.unique)
+        self._rows = {}
+        self._indexes = {index.columns[0].name: {} for index in table.indexes}
+        self._next_id = 1
+        self._log = log
+
+    def __len__(self) -> int:
+        """
+        The number of rows in the table.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self._rows)
+
+    def get(self, row_id: int) -> Row | None:
+        """
+        The method getting a row with a given id.
+
+        Args:
+            row_id (int): The id of the row.
+
+        Returns:
+            Row | None: The row.
+        """
+        row = self._rows.get(row_id)
+
+        return dict(row) if row else None
+
+    def scan(self, after: int | None = None) -> Iterator[Row]:
+        """
+        The method iterating rows ordered by id.
+
+        Args:
+            after (int | None): The id after which the iteration starts. Defaults to None.
+
+        Yields:
+            Row: The rows.
+        """
+        for row_id in sorted(self._rows):
+            row = self._rows.get(row_id)
+            if row and (after is None or row_id > after):
+                yield dict(row)
+
+    def select(self, **filters: Any) -> List[Row]:
+        """
+        The method getting rows with given column values ordered by id, using an index when there is one.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Row]: The rows.
+        """
+        self._check(filters)
+
+        indexed = [name for name in filters if name in self._indexes or name == "id"]
+        if not indexed:
+            candidates: Iterable[int] = self._rows
+        elif indexed[0] == "id":
+            candidates = [filters["id"]] if filters["id"] in self._rows else []
+        else:
+            candidates = self._indexes[indexed[0]].get(filters[indexed[0]], {})
+
+        return [
+            dict(self._rows[row_id]) for row_id in sorted(candidates)
+            if all(self._rows[row_id][name] == value for name, value in filters.items())
+        ]
+
+    def exists(self, **filters: Any) -> bool:
+        """
+        The method checking whether a row has given column values, stopping at the first one.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            bool: Whether such a row exists.
+        """
+        self._check(filters)
+
+        indexed = [name for name in filters if name in self._indexes]
+        candidates = self._indexes[indexed[0]].get(filters[indexed[0]], {}) if indexed else self._rows
+
+        return any(
+            all(self._rows[row_id][name] == value for name, value in filters.items())
+            for row_id in candidates
+        )
+
+    def insert(self, values: Dict[str, Any]) -> Row:
+        """
+        The method adding a row with the next id of the sequence, or with a given id.
+
+        Args:
+            values (Dict[str, Any]): The values of the columns, the id included when it is given.
+
+        Returns:
+            Row: The new row.
+
+        Raises:
+            ValueError: If a column does not exist, or the id or a unique value is taken.
+        """
+        self._check(values)
+        row = {name: values.get(name) for name in self._columns}
+        if row["id"] is None:
+            row["id"] = self._next_id
+        elif row["id"] in self._rows:
+            raise ValueError(f"Duplicate value of {self.name}.id: {row['id']}")
+        self._check_unique(row)
+
+        # Like a Postgres sequence, the id is not given back on rollback, and a
+        # given id moves the sequence past it the way the fixture loader does.
+        self._next_id = max(self._next_id, row["id"] + 1)
+        self._put(row)
+        self._log(lambda: self._pop(row["id"]))
+
+        return dict(row)
+
+    def update(self, row_id: int, values: Dict[str, Any]) -> Row | None:
+        """
+        The method changing values of a row with a given id.
+
+        Args:
+            row_id (int): The id of the row.
+            values (Dict[str, Any]): The new values of the columns.
+
+        Returns:
+            Row | None: The updated row.
+
+        Raises:
+            ValueError: If a column does not exist or a unique value is taken.
+        """
+        self._check(values)
+        old = self._rows.get(row_id)
+        if old is None:
+            return None
+
+        row = {**old, **values, "id": row_id}
+        self._pop(row_id)
+        try:
+            self._check_unique(row)
+        except ValueError:
+            self._put(old)
+            raise
+        self._put(row)
+        self._log(lambda: (self._pop(row_id), self._put(old)))
+
+        return dict(row)
+
+    def delete(self, row_id: int) -> Row | None:
+        """
+        The method removing a row with a given id.
+
+        Args:
+            row_id (int): The id of the row.
+
+        Returns:
+            Row | None: The removed row.
+        """
+        row = self._pop(row_id)
+        if row is None:
+            return None
+
+        self._log(lambda: self._put(row))
+
+        return dict(row)
+
+    def delete_where(self, **filters: Any) -> List[Row]:
+        """
+        The method removing rows with given column values.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Row]: The removed rows.
+
+        Raises:
+            ValueError: If there are no filters or a column does not exist.
+        """
+        if not filters:
+            raise ValueError(f"At least one filter of {self.name} is required")
+
+        return [self.delete(row["id"]) for row in self.select(**filters)]
+
+    def _put(self, row: Row) -> None:
+        """
+        The method storing a row and indexing it.
+
+        Args:
+            row (Row): The row.
+        """
+        self._rows[row["id"]] = row
+        for name, index in self._indexes.items():
+            index.setdefault(row[name], {})[row["id"]] = None
+
+    def _pop(self, row_id: int) -> Row | None:
+        """
+        The method dropping a row and its index entries.
+
+        Args:
+            row_id (int): The id of the row.
+
+        Returns:
+            Row | None: The dropped row.
+        """
+        row = self._rows.pop(row_id, None)
+        if row is None:
+            return None
+
+        for name, index in self._indexes.items():
+            ids = index[row[name]]
+            del ids[row_id]
+            if not ids:
+                del index[row[name]]
+
+        return row
+
+    def _check(self, values: Dict[str, Any]) -> None:
+        """
+        The method checking that given columns exist.
+
+        Args:
+            values (Dict[str, Any]): The values of the columns.
+
+        Raises:
+            ValueError: If a column does not exist.
+        """
+        if unknown := values.keys() - set(self._columns):
+            raise ValueError(f"Unknown columns of {self.name}: {', '.join(sorted(unknown))}")
+
+    def _check_unique(self, row: Row) -> None:
+        """
+        The method checking that unique values of a row are not taken by another row.
+
+        Args:
+            row (Row): The row.
+
+        Raises:
+            ValueError: If a unique value is taken.
+        """
+        for names in self._unique:
+            values = {name: row[name] for name in names}
+            if None not in values.values() and self.exists(**values):
+                raise ValueError(f"Duplicate value of {self.name}.{', '.join(names)}: {', '.join(map(str, values.values()))}")
+
+
+class MemoryTransaction:
+    """
+    A transaction of the memory store, whose writes are undone by the rollback callbacks they register.
+    """
+
+    async def start(self) -> None:
+        """
+        The method starting the transaction, which needs no work in memory.
+        """
+
+    async def commit(self) -> None:
+        """
+        The method committing the transaction, which needs no work in memory.
+        """
+
+    async def rollback(self) -> None:
+        """
+        The method rolling back the transaction, which the rollback callbacks do.
+        """
+
+
+class MemoryStore(ITransactionManager):
+    """
+    An in-memory storage backend with one table per table of the metadata with an id sequence.
+        Writes made inside a transaction register how to undo them in the transaction hooks of the task.
+        Transactions are not isolated from each other and foreign keys are not enforced.
+    """
+
+    _tables: Dict[str, MemoryTable]
+    _hooks: TransactionHooks
+
+    def __init__(self) -> None:
+        """
+        The initializer of the memory store.
+        """
+        self._hooks = TransactionHooks()
+        self._tables = {
+            table.name: MemoryTable(table, self._hooks.on_rollback)
+            for table in metadata.sorted_tables if "id" in table.c
+        }
+
+    def table(self, name: str) -> MemoryTable:
+        """
+        The method getting a table by name.
+
+        Args:
+            name (str): The name of the table.
+
+        Returns:
+            MemoryTable: The table.
+        """
+        return self._tables[name]
+
+    def tables(self) -> List[MemoryTable]:
+        """
+        The method getting all tables, referenced tables first.
+
+        Returns:
+            List[MemoryTable]: The tables.
+        """
+        return list(self._tables.values())
+
+    def transaction(self) -> HookedTransaction:
+        """
+        The method opening a transaction of the current task.
+
+        Returns:
+            HookedTransaction: The memory transaction.
+        """
+        return HookedTransaction(MemoryTransaction(), self._hooks)
+
+    def connection(self) -> nullcontext:
+        """
+        The method holding a connection, which the memory store does not need.
+
+        Returns:
+            nullcontext: An empty context manager.
+        """
+        return nullcontext(self)
+
+    def after_commit(self, hook: Callable[[], None]) -> None:
+        """
+        The method running a callback once the transactions open in the current task commit.
+
+        Args:
+            hook (Callable[[], None]): The callback.
+        """
+        self._hooks.after_commit(hook)
+
+    def on_rollback(self, hook: Callable[[], None]) -> None:
+        """
+        The method running a callback if the innermost transaction open in the current task rolls back.
+
+        Args:
+            hook (Callable[[], None]): The callback.
+        """
+        self._hooks.on_rollback(hook)
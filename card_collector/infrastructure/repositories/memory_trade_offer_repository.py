@@ -0,0 +1,253 @@
+from itertools import islice
+from typing import Any, AsyncIterator, List
+
+from card_collector.core.repositories.i_trade_offer_repository import ITradeOfferRepository
+from card_collector.core.domains.trade_offer import TradeOffer, TradeOfferIn
+from card_collector.db import trade_offer_table
+from card_collector.infrastructure.repositories.memory_store import MemoryStore, MemoryTable
+
+class MemoryTradeOfferRepository(ITradeOfferRepository):
+    """
+    A trade offer repository keeping trade offers in the memory store.
+    """
+
+    _store: MemoryStore
+    _table: MemoryTable
+
+    def __init__(self, store: MemoryStore) -> None:
+        """
+        The initializer of the memory trade offer repository.
+
+        Args:
+            store (MemoryStore): The reference to the memory store.
+        """
+        self._store = store
+        self._table = store.table(trade_offer_table.name)
+
+    async def get_all_trade_offers(self) -> List[Any]:
+        """
+        The method getting all trade offers from the store.
+
+        Returns:
+            List[Any]: Trade offers in the store.
+        """
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in self._table.scan()]
+
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The method getting a page of trade offers ordered by id from the store.
+
+        Args:
+            limit (int): The maximal number of trade offers.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Trade offers in the store.
+        """
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in islice(self._table.scan(after), limit)]
+
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all trade offers ordered by id from the store.
+
+        Returns:
+            AsyncIterator[Any]: Trade offers in the store.
+        """
+
+        for trade_offer in self._table.scan():
+            yield TradeOffer.from_record(trade_offer)
+
+    async def get_all_by_card_offered(self, card_offered: int) -> List[Any]:
+        """
+        The method getting all trade offers with a given card offered from the store.
+
+        Args:
+            card_offered (int): the id of card offered.
+
+        Returns:
+            List[Any]: Trade offers in the store.
+        """
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in self._table.select(card_offered=card_offered)]
+
+    async def get_all_by_card_wanted(self, card_wanted: int) -> List[Any]:
+        """
+        The method getting all trade offers with a given card wanted from the store.
+
+        Args:
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            List[Any]: Trade offers in the store.
+        """
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in self._table.select(card_wanted=card_wanted)]
+
+    async def get_by_id(self, trade_offer_id: int) -> Any | None:
+        """
+        The method getting trade offer with a given id.
+
+        Args:
+            trade_offer_id (int): The id of the trade offer.
+
+        Returns:
+            Any | None: The trade offer details.
+        """
+
+        trade_offer = self._table.get(trade_offer_id)
+
+        return TradeOffer.from_record(trade_offer) if trade_offer else None
+
+    async def get_by_offer(self, card_offered: int, card_wanted: int) -> Any | None:
+        """
+        The method getting the oldest trade offer with a given offer.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            Any | None: The trade offer details.
+        """
+
+        trade_offers = self._table.select(card_offered=card_offered, card_wanted=card_wanted)
+
+        return TradeOffer.from_record(trade_offers[0]) if trade_offers else None
+
+    async def get_by_profile_id_and_card_offered_id(self, profile_id: int, card_offered_id: int) -> Any | None:
+        """
+        The method getting trade offers with a given profile id and card offered id.
+
+        Args:
+            profile_id (int): the id of profile.
+            card_offered_id (int): the id of card offered.
+
+        Returns:
+            Any | None: The trade offers details.
+        """
+
+        return [
+            TradeOffer.from_record(trade_offer)
+            for trade_offer in self._table.select(profile_posted=profile_id, card_offered=card_offered_id)
+        ]
+
+    async def claim_by_offer(self, card_offered: int, card_wanted: int) -> Any | None:
+        """
+        The method removing and returning the oldest trade offer with a given offer.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            Any | None: The claimed trade offer details.
+        """
+
+        trade_offers = self._table.select(card_offered=card_offered, card_wanted=card_wanted)
+
+        return TradeOffer.from_record(self._table.delete(trade_offers[0]["id"])) if trade_offers else None
+
+    async def claim_by_id(self, trade_offer_id: int) -> Any | None:
+        """
+        The method removing and returning trade offer with a given id.
+
+        Args:
+            trade_offer_id (int): The id of the trade offer.
+
+        Returns:
+            Any | None: The claimed trade offer details.
+        """
+
+        trade_offer = self._table.delete(trade_offer_id)
+
+        return TradeOffer.from_record(trade_offer) if trade_offer else None
+
+    async def add_trade_offer(self, data: TradeOfferIn) -> Any | None:
+        """
+        The method adding new trade offer to the store.
+
+        Args:
+            data (TradeOfferIn): The details of the new trade offer.
+
+        Returns:
+            Any | None: The newly added trade offer.
+        """
+
+        return TradeOffer.from_record(self._table.insert(data.model_dump()))
+
+    async def add_many(self, data: List[TradeOfferIn]) -> List[Any]:
+        """
+        The method adding many trade offers to the store in one transaction.
+
+        Args:
+            data (List[TradeOfferIn]): The details of the new trade offers.
+
+        Returns:
+            List[Any]: The newly added trade offers.
+        """
+
+        async with self._store.transaction():
+            return [TradeOffer.from_record(self._table.insert(trade_offer.model_dump())) for trade_offer in data]
+
+    async def update_trade_offer(
+            self,
+            trade_offer_id: int,
+            data: TradeOfferIn,
+    ) -> Any | None:
+        """
+        The method updating trade offer data in the store.
+
+        Args:
+            trade_offer_id (int): The id of the trade offer.
+            data (TradeOfferIn): The details of the updated trade offer.
+
+        Returns:
+            Any | None: The updated trade offer details.
+        """
+
+        trade_offer = self._table.update(trade_offer_id, data.model_dump())
+
+        return TradeOffer.from_record(trade_offer) if trade_offer else None
+
+    async def delete_trade_offer(self, trade_offer_id: int) -> bool:
+        """
+        The method removing trade offer from the store.
+
+        Args:
+            trade_offer_id (int): The id of the trade offer.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        return self._table.delete(trade_offer_id) is not None
+
+    async def delete_many(self, trade_offer_ids: List[int]) -> List[Any]:
+        """
+        The method removing trade offers with given ids from the store.
+
+        Args:
+            trade_offer_ids (List[int]): The ids of the trade offers.
+
+        Returns:
+            List[Any]: The removed trade offers.
+        """
+
+        trade_offers = [self._table.delete(trade_offer_id) for trade_offer_id in trade_offer_ids]
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in trade_offers if trade_offer]
+
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The method removing trade offers with given column values from the store.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Any]: The removed trade offers.
+        """
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in self._table.delete_where(**filters)]
@@ -1,15 +1,166 @@
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple
 
-from sqlalchemy import select, and_
+from sqlalchemy import CTE, BigInteger, Integer, any_, cast, exists, func, literal_column, not_, or_, select, and_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, Insert, insert
 
 from card_collector.core.repositories.i_profile_collection_repository import IProfileCollectionRepository
-from card_collector.core.domains.profile_collection import ProfileCollection, ProfileCollectionIn
+from card_collector.core.domains.profile_collection import (
+    NotLastCopyError,
+    ProfileCardCount,
+    ProfileCollection,
+    ProfileCollectionIn,
+)
 from card_collector.db import (
-    profile_collection_table,
+    BULK_BATCH_SIZE,
+    COPY_ID_SPACE,
+    any_of,
+    check_last_copies,
+    copies,
+    copy_id,
+    copy_number,
+    equal_to,
+    profile_card_table,
+    profile_collection_copies,
+    split_copy_id,
     database,
 )
+from card_collector.infrastructure.repositories.statement_registry import statements
+
+GET_ALL_BY_CARD_ID = statements.register(
+    "profile_collection.get_all_by_card_id",
+    profile_collection_copies(profile_card_table.c.card_id == bindparam("card_id")),
+)
+
+GET_ALL_BY_PROFILE_ID = statements.register(
+    "profile_collection.get_all_by_profile_id",
+    profile_collection_copies(profile_card_table.c.profile_id == bindparam("profile_id")),
+)
+
+GET_ALL_BY_PROFILE_ID_AND_CARD_ID = statements.register(
+    "profile_collection.get_all_by_profile_id_and_card_id",
+    profile_collection_copies(
+        profile_card_table.c.profile_id == bindparam("profile_id"),
+        profile_card_table.c.card_id == bindparam("card_id"),
+    ),
+)
+
+GET_COUNTS_BY_PROFILE_ID = statements.register(
+    "profile_collection.get_counts_by_profile_id",
+    (
+        select(profile_card_table)
+        .where(profile_card_table.c.profile_id == bindparam("profile_id"))
+        .order_by(profile_card_table.c.card_id)
+    ),
+)
+
+# The ownership reads look up the (profile_id, card_id) unique index of profile_card, one row
+# per owned card, so they cost the same whether the profile has one copy or ten thousand.
+OWNS = statements.register(
+    "profile_collection.owns",
+    select(
+        exists().where(
+            and_(
+                profile_card_table.c.profile_id == bindparam("profile_id"),
+                profile_card_table.c.card_id == bindparam("card_id"))
+        )
+    ),
+)
+
+COUNT_OWNED = statements.register(
+    "profile_collection.count_owned",
+    (
+        select(profile_card_table.c.count)
+        .where(
+            and_(
+                profile_card_table.c.profile_id == bindparam("profile_id"),
+                profile_card_table.c.card_id == bindparam("card_id"))
+        )
+    ),
+)
+
+OWNED_COUNTS = statements.register(
+    "profile_collection.owned_counts",
+    (
+        select(profile_card_table.c.card_id, profile_card_table.c.count)
+        .where(
+            and_(
+                profile_card_table.c.profile_id == bindparam("profile_id"),
+                profile_card_table.c.card_id == any_(bindparam("card_ids", type_=ARRAY(Integer))))
+        )
+    ),
+)
+
+GET_BY_ID = statements.register(
+    "profile_collection.get_by_id",
+    (
+        select(
+            (profile_card_table.c.id * COPY_ID_SPACE + bindparam("number", type_=Integer)).label("id"),
+            profile_card_table.c.profile_id,
+            profile_card_table.c.card_id,
+        )
+        .where(
+            and_(
+                profile_card_table.c.id == bindparam("profile_card_id", type_=BigInteger),
+                profile_card_table.c.count >= bindparam("number", type_=Integer))
+        )
+    ),
+)
+
+
+def _take(source: CTE) -> Tuple[CTE, CTE]:
+    """
+    Function removing copies from the profile_card rows of a source with id, count and taken columns.
+        The rows losing all their copies are deleted and the others decremented, by two CTEs touching
+        distinct rows so that they run in one statement.
+
+    Args:
+        source (CTE): The locked rows with their count and the number of copies taken from each.
+
+    Returns:
+        Tuple[CTE, CTE]: The delete and the update, to be added to the statement.
+    """
+
+    deleted = (
+        profile_card_table.delete()
+        .where(profile_card_table.c.id.in_(select(source.c.id).where(source.c.count <= source.c.taken)))
+        .cte("deleted")
+    )
+    decremented = (
+        profile_card_table.update()
+        .where(and_(profile_card_table.c.id == source.c.id, source.c.count > source.c.taken))
+        .values(count=profile_card_table.c.count - source.c.taken)
+        .cte("decremented")
+    )
+
+    return deleted, decremented
+
+
+def _upsert(query: Insert) -> Insert:
+    """
+    Function turning an insert of profile_card rows into an atomic count = count + n on existing keys.
+
+    Args:
+        query (Insert): The insert of profile_id, card_id and count.
+
+    Returns:
+        Insert: The upsert, returning the resulting rows.
+    """
+
+    return (
+        query
+        .on_conflict_do_update(
+            index_elements=[profile_card_table.c.profile_id, profile_card_table.c.card_id],
+            set_={"count": profile_card_table.c.count + query.excluded.count},
+        )
+        .returning(profile_card_table)
+    )
+
 
 class ProfileCollectionRepository(IProfileCollectionRepository):
+    """
+    A profile collection repository serving the per-copy API from the profile_card ownership store.
+        Copies are expanded from the counts on read, and writes move the counts with upserts.
+    """
 
     async def get_all_profile_collections(self) -> List[Any]:
         """
@@ -19,13 +170,45 @@ class ProfileCollectionRepository(IProfileCollectionRepository):
             List[Any]: Profile Collections in the database.
         """
 
-        query = (
-            select(profile_collection_table)
-        )
-        profile_collections = await database.fetch_all(query)
+        profile_collections = await database.fetch_all(profile_collection_copies())
 
         return [ProfileCollection.from_record(profile_collection) for profile_collection in profile_collections]
 
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The method getting a page of profile collections ordered by id from the database, using the id as the cursor.
+            The cursor seeks the primary key of profile_card, then skips the copies of its row already served.
+
+        Args:
+            limit (int): The maximal number of profile collections.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Profile collections in the database.
+        """
+
+        conditions = []
+        if after is not None:
+            profile_card_id, number = split_copy_id(after)
+            conditions = [
+                profile_card_table.c.id >= profile_card_id,
+                or_(profile_card_table.c.id > profile_card_id, copy_number.c.number > number),
+            ]
+        profile_collections = await database.fetch_all(profile_collection_copies(*conditions).limit(limit))
+
+        return [ProfileCollection.from_record(profile_collection) for profile_collection in profile_collections]
+
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all profile collections ordered by id from the database through a server-side cursor.
+
+        Returns:
+            AsyncIterator[Any]: Profile collections in the database.
+        """
+
+        async for profile_collection in database.iterate(profile_collection_copies()):
+            yield ProfileCollection.from_record(profile_collection)
+
     async def get_all_by_card_id(self, card_id: int) -> List[Any]:
         """
         The method getting all profile collections with a given card id from the database.
@@ -37,11 +220,7 @@ class ProfileCollectionRepository(IProfileCollectionRepository):
             List[Any]: Profile Collections in the database.
         """
 
-        query = (
-            select(profile_collection_table)
-            .where(profile_collection_table.c.card_id == card_id) # type: ignore
-        )
-        profile_collections = await database.fetch_all(query)
+        profile_collections = await statements.fetch_all(GET_ALL_BY_CARD_ID, card_id=card_id)
 
         return [ProfileCollection.from_record(profile_collection) for profile_collection in profile_collections]
 
@@ -56,11 +235,7 @@ class ProfileCollectionRepository(IProfileCollectionRepository):
             List[Any]: Profile Collections in the database.
         """
 
-        query = (
-            select(profile_collection_table)
-            .where(profile_collection_table.c.profile_id == profile_id) # type: ignore
-        )
-        profile_collections = await database.fetch_all(query)
+        profile_collections = await statements.fetch_all(GET_ALL_BY_PROFILE_ID, profile_id=profile_id)
 
         return [ProfileCollection.from_record(profile_collection) for profile_collection in profile_collections]
 
@@ -76,18 +251,77 @@ class ProfileCollectionRepository(IProfileCollectionRepository):
             List[Any]: ProfileCollections in the database.
         """
 
-        query = (
-            select(profile_collection_table)
-            .where(
-                and_(
-                    profile_collection_table.c.profile_id == profile_id,
-                    profile_collection_table.c.card_id == card_id)
-            )
-        )
-        profile_collections = await database.fetch_all(query)
+        profile_collections = await statements.fetch_all(GET_ALL_BY_PROFILE_ID_AND_CARD_ID, profile_id=profile_id, card_id=card_id)
 
         return [ProfileCollection.from_record(profile_collection) for profile_collection in profile_collections]
 
+    async def get_counts_by_profile_id(self, profile_id: int) -> List[Any]:
+        """
+        The method getting the number of copies of each card owned by a given profile
+            from the aggregated ownership table.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[Any]: Card counts of the profile.
+        """
+
+        counts = await statements.fetch_all(GET_COUNTS_BY_PROFILE_ID, profile_id=profile_id)
+
+        return [ProfileCardCount.from_record(count) for count in counts]
+
+    async def owns(self, profile_id: int, card_id: int) -> bool:
+        """
+        The method checking whether a profile owns at least one copy of a card, with an EXISTS on the ownership table.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            bool: Whether the profile owns the card.
+        """
+
+        row = await statements.fetch_one(OWNS, profile_id=profile_id, card_id=card_id)
+
+        return row[0]
+
+    async def count_owned(self, profile_id: int, card_id: int) -> int:
+        """
+        The method getting the number of copies of a card owned by a profile from the ownership table.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            int: The number of copies.
+        """
+
+        row = await statements.fetch_one(COUNT_OWNED, profile_id=profile_id, card_id=card_id)
+
+        return row["count"] if row else 0
+
+    async def owned_counts(self, profile_id: int, card_ids: List[int]) -> Dict[int, int]:
+        """
+        The method getting the number of copies of given cards owned by a profile from the ownership table.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            Dict[int, int]: The number of copies by card id, cards without a copy left out.
+        """
+
+        if not card_ids:
+            return {}
+
+        counts = await statements.fetch_all(OWNED_COUNTS, profile_id=profile_id, card_ids=card_ids)
+
+        return {count["card_id"]: count["count"] for count in counts}
+
     async def get_by_id(self, profile_collection_id: int) -> Any | None:
         """
         The method getting profile collection with a given id from the database.
@@ -99,34 +333,94 @@ class ProfileCollectionRepository(IProfileCollectionRepository):
             Any | None: The profile_collection details.
         """
 
-        query = (
-            profile_collection_table.select()
-            .where(profile_collection_table.c.id == profile_collection_id)
-        )
+        profile_card_id, number = split_copy_id(profile_collection_id)
+        if number < 1:
+            return None
 
-        profile_collection = await database.fetch_one(query)
+        profile_collection = await statements.fetch_one(GET_BY_ID, profile_card_id=profile_card_id, number=number)
 
         return ProfileCollection.from_record(profile_collection) if profile_collection else None
 
     async def add_profile_collection(self, data: ProfileCollectionIn) -> Any | None:
         """
-        The method adding new profile collection to the database.
+        The method adding a copy of a card to a profile with one upsert of its count.
 
         Args:
             data (ProfileCollectionIn): The details of the new profile collection.
 
         Returns:
-            ProfileCollection: Details of the newly added profile collection.
+            Any | None: The newly added profile collection.
+        """
+
+        row = await database.fetch_one(_upsert(insert(profile_card_table).values(**data.model_dump(), count=1)))
+
+        return ProfileCollection.from_record({**row, "id": copy_id(row["id"], row["count"])}) if row else None
+
+    async def add_many(self, data: List[ProfileCollectionIn]) -> List[Any]:
+        """
+        The method adding many copies with multi-row upserts of one row per profile and card,
+            in batches inside one transaction.
+
+        Args:
+            data (List[ProfileCollectionIn]): The details of the new profile collections.
 
         Returns:
-            Any | None: The newly added profile collection.
+            List[Any]: The newly added profile collections, in the order of the data.
+        """
+
+        if not data:
+            return []
+
+        added: Dict[Tuple[int, int], int] = {}
+        for profile_collection in data:
+            key = (profile_collection.profile_id, profile_collection.card_id)
+            added[key] = added.get(key, 0) + 1
+
+        numbers: Dict[Tuple[int, int], Tuple[int, Iterator[int]]] = {}
+        keys = list(added)
+        async with database.transaction():
+            for start in range(0, len(keys), BULK_BATCH_SIZE):
+                query = _upsert(insert(profile_card_table).values([
+                    {"profile_id": profile_id, "card_id": card_id, "count": added[profile_id, card_id]}
+                    for profile_id, card_id in keys[start:start + BULK_BATCH_SIZE]
+                ]))
+                for row in await database.fetch_all(query):
+                    key = (row["profile_id"], row["card_id"])
+                    numbers[key] = (row["id"], iter(range(row["count"] - added[key] + 1, row["count"] + 1)))
+
+        new_profile_collections = []
+        for profile_collection in data:
+            profile_card_id, copies = numbers[profile_collection.profile_id, profile_collection.card_id]
+            new_profile_collections.append(ProfileCollection.from_record({
+                **profile_collection.model_dump(),
+                "id": copy_id(profile_card_id, next(copies)),
+            }))
+
+        return new_profile_collections
+
+    async def transfer(self, profile_from: int, profile_to: int, card_id: int) -> Any | None:
         """
+        The method moving a single copy of a card from one profile to another with one statement
+            decrementing the giving row under a lock and upserting the receiving one.
 
-        query = profile_collection_table.insert().values(**data.model_dump())
-        new_profile_collection_id = await database.execute(query)
-        new_profile_collection = await self.get_by_id(new_profile_collection_id)
+        Args:
+            profile_from (int): The id of the profile giving the card.
+            profile_to (int): The id of the profile receiving the card.
+            card_id (int): The id of the card.
+
+        Returns:
+            Any | None: The moved profile collection, None if the giving profile has no copy.
+        """
 
-        return ProfileCollection(**dict(new_profile_collection)) if new_profile_collection else None
+        if profile_from == profile_to:
+            copies = await self.get_all_profile_collections_by_profile_id_and_card_id(card_id, profile_from)
+            return copies[-1] if copies else None
+
+        return await self._move(
+            ProfileCollectionIn(profile_id=profile_to, card_id=card_id),
+            profile_card_table.c.profile_id == profile_from,
+            profile_card_table.c.card_id == card_id,
+        )
 
     async def update_profile_collection(
             self,
@@ -134,7 +428,7 @@ class ProfileCollectionRepository(IProfileCollectionRepository):
             data: ProfileCollectionIn,
     ) -> Any | None:
         """
-        The method updating profile collection data in the database.
+        The method moving a copy to the profile and card of the data, which gives it the id of a copy of that row.
 
         Args:
             profile_collection_id (int): The id of the profile collection.
@@ -142,21 +436,61 @@ class ProfileCollectionRepository(IProfileCollectionRepository):
 
         Returns:
             Any | None: The updated profile collection details.
+
+        Raises:
+            NotLastCopyError: If the copy is not the last copy of its card.
         """
 
-        if self.get_by_id(profile_collection_id):
-            query = (
-                profile_collection_table.update()
-                .where(profile_collection_table.c.id == profile_collection_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+        profile_card_id, number = split_copy_id(profile_collection_id)
+        if number < 1:
+            return None
 
+        profile_collection = await self._move(
+            data,
+            profile_card_table.c.id == profile_card_id,
+            profile_card_table.c.count == number,
+        )
+        if profile_collection is None:
+            # The copy does not exist, already has the profile and card of the data or is not the last one.
             profile_collection = await self.get_by_id(profile_collection_id)
+            if profile_collection and (profile_collection.profile_id, profile_collection.card_id) != (data.profile_id, data.card_id):
+                raise NotLastCopyError(profile_collection_id)
+
+        return profile_collection
+
+    async def _move(self, data: ProfileCollectionIn, *conditions: Any) -> Any | None:
+        """
+        The method moving one copy of the profile_card row matching conditions to the row of the data.
+            The source is locked and excludes the target row, so that both are touched once by the statement.
+
+        Args:
+            data (ProfileCollectionIn): The profile and card receiving the copy.
+            *conditions (Any): The conditions on the giving profile_card row.
+
+        Returns:
+            Any | None: The moved profile collection, None if no row matches.
+        """
+
+        source = (
+            select(profile_card_table.c.id, profile_card_table.c.count, literal_column("1").label("taken"))
+            .where(
+                *conditions,
+                not_(and_(
+                    profile_card_table.c.profile_id == data.profile_id,
+                    profile_card_table.c.card_id == data.card_id)),
+            )
+            .with_for_update()
+            .cte("source")
+        )
+        deleted, decremented = _take(source)
+        added = _upsert(insert(profile_card_table).from_select(
+            ["profile_id", "card_id", "count"],
+            select(cast(data.profile_id, Integer), cast(data.card_id, Integer), literal_column("1")).select_from(source),
+        )).cte("added")
 
-            return ProfileCollection(**dict(profile_collection)) if profile_collection else None
+        row = await database.fetch_one(select(added).add_cte(deleted, decremented))
 
-        return None
+        return ProfileCollection.from_record({**row, "id": copy_id(row["id"], row["count"])}) if row else None
 
     async def delete_profile_collection(self, profile_collection_id: int) -> bool:
         """
@@ -167,14 +501,92 @@ class ProfileCollectionRepository(IProfileCollectionRepository):
 
         Returns:
             bool: Success of the operation.
+
+        Raises:
+            NotLastCopyError: If the copy is not the last copy of its card.
+        """
+
+        return bool(await self.delete_many([profile_collection_id]))
+
+    async def delete_many(self, profile_collection_ids: List[int]) -> List[Any]:
+        """
+        The method removing profile collections with given ids from the database,
+            locking their profile_card rows and then decrementing or deleting them with one statement.
+
+        Args:
+            profile_collection_ids (List[int]): The ids of the profile collections.
+
+        Returns:
+            List[Any]: The removed profile collections.
+
+        Raises:
+            NotLastCopyError: If a removed copy is not among the last copies of its card.
+        """
+
+        requested: Dict[int, List[int]] = {}
+        for profile_collection_id in dict.fromkeys(profile_collection_ids):
+            profile_card_id, number = split_copy_id(profile_collection_id)
+            if number >= 1:
+                requested.setdefault(profile_card_id, []).append(number)
+        if not requested:
+            return []
+
+        removed: List[ProfileCollection] = []
+        taken: Dict[int, Tuple[int, int]] = {}
+        async with database.transaction():
+            query = (
+                select(profile_card_table)
+                .where(any_of(profile_card_table.c.id, list(requested)))
+                .with_for_update()
+            )
+            for row in await database.fetch_all(query):
+                numbers = [number for number in requested[row["id"]] if number <= row["count"]]
+                check_last_copies(row["id"], row["count"], numbers)
+                if numbers:
+                    taken[row["id"]] = (row["count"], len(numbers))
+                    removed += [
+                        ProfileCollection.from_record({**row, "id": copy_id(row["id"], number)})
+                        for number in numbers
+                    ]
+
+            if taken:
+                source = select(
+                    func.unnest(
+                        cast(bindparam("ids", list(taken)), ARRAY(BigInteger)),
+                        cast(bindparam("counts", [count for count, _ in taken.values()]), ARRAY(Integer)),
+                        cast(bindparam("taken", [amount for _, amount in taken.values()]), ARRAY(Integer)),
+                    )
+                    .table_valued("id", "count", "taken")
+                    .render_derived()
+                ).cte("source")
+                deleted, decremented = _take(source)
+                await database.fetch_val(select(func.count()).select_from(source).add_cte(deleted, decremented))
+
+        order = {profile_collection_id: position for position, profile_collection_id in enumerate(profile_collection_ids)}
+
+        return sorted(removed, key=lambda profile_collection: order[profile_collection.id])
+
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The method removing all copies with given profile or card ids from the database with one delete.
+
+        Args:
+            **filters (Any): The values of profile_id and card_id.
+
+        Returns:
+            List[Any]: The removed profile collections.
+
+        Raises:
+            ValueError: If there are no filters or a filter is not profile_id or card_id.
         """
 
-        if await self.get_by_id(profile_collection_id):
-            query = profile_collection_table \
-                .delete() \
-                .where(profile_collection_table.c.id == profile_collection_id)
-            await database.execute(query)
+        if unknown := filters.keys() - {"profile_id", "card_id"}:
+            raise ValueError(f"Profile collections are only filtered by profile_id and card_id, not {', '.join(sorted(unknown))}")
 
-            return True
+        query = (
+            profile_card_table.delete()
+            .where(*equal_to(profile_card_table, filters))
+            .returning(profile_card_table)
+        )
 
-        return False
+        return [ProfileCollection.from_record(copy) for copy in copies(await database.fetch_all(query))]
@@ -1,13 +1,25 @@
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, List
 
-from sqlalchemy import select
+from sqlalchemy import func, literal_column, select, bindparam
 
 from card_collector.core.repositories.i_profile_repository import IProfileRepository
 from card_collector.core.domains.profile import Profile, ProfileIn
 from card_collector.db import (
+    profile_card_table,
     profile_table,
+    quest_table,
     database,
 )
+from card_collector.infrastructure.repositories.statement_registry import statements
+
+GET_BY_ID = statements.register(
+    "profile.get_by_id",
+    (
+        profile_table.select()
+        .where(profile_table.c.id == bindparam("profile_id"))
+    ),
+)
+
 
 class ProfileRepository(IProfileRepository):
 
@@ -26,6 +38,44 @@ class ProfileRepository(IProfileRepository):
 
         return [Profile.from_record(profile) for profile in profiles]
 
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
+        """
+        The method getting a page of profiles ordered by id from the database, using the id as the cursor.
+
+        Args:
+            limit (int): The maximal number of profiles.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Any]: Profiles in the database.
+        """
+
+        query = (
+            select(profile_table)
+            .order_by(profile_table.c.id)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(profile_table.c.id > after)
+        profiles = await database.fetch_all(query)
+
+        return [Profile.from_record(profile) for profile in profiles]
+
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all profiles ordered by id from the database through a server-side cursor.
+
+        Returns:
+            AsyncIterator[Any]: Profiles in the database.
+        """
+
+        query = (
+            select(profile_table)
+            .order_by(profile_table.c.id)
+        )
+        async for profile in database.iterate(query):
+            yield Profile.from_record(profile)
+
     async def get_by_id(self, profile_id: int) -> Any | None:
         """
         The method getting profile with a given id.
@@ -36,12 +86,7 @@ class ProfileRepository(IProfileRepository):
         Returns:
             Any | None: The profile details.
         """
-        query = (
-            profile_table.select()
-            .where(profile_table.c.id == profile_id)
-        )
-
-        profile = await database.fetch_one(query)
+        profile = await statements.fetch_one(GET_BY_ID, profile_id=profile_id)
 
         return Profile.from_record(profile) if profile else None
 
@@ -56,11 +101,14 @@ class ProfileRepository(IProfileRepository):
             Any | None: The newly added profile.
         """
 
-        query = profile_table.insert().values(**data.model_dump())
-        new_profile_id = await database.execute(query)
-        new_profile = await self.get_by_id(new_profile_id)
+        query = (
+            profile_table.insert()
+            .values(**data.model_dump())
+            .returning(profile_table)
+        )
+        new_profile = await database.fetch_one(query)
 
-        return Profile(**dict(new_profile)) if new_profile else None
+        return Profile.from_record(new_profile) if new_profile else None
 
     async def update_profile(
             self,
@@ -78,19 +126,15 @@ class ProfileRepository(IProfileRepository):
             Any | None: The updated profile details.
         """
 
-        if self.get_by_id(profile_id):
-            query = (
-                profile_table.update()
-                .where(profile_table.c.id == profile_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-
-            profile = await self.get_by_id(profile_id)
-
-            return Profile(**dict(profile)) if profile else None
+        query = (
+            profile_table.update()
+            .where(profile_table.c.id == profile_id)
+            .values(**data.model_dump())
+            .returning(profile_table)
+        )
+        profile = await database.fetch_one(query)
 
-        return None
+        return Profile.from_record(profile) if profile else None
 
     async def delete_profile(self, profile_id: int) -> bool:
         """
@@ -103,12 +147,42 @@ class ProfileRepository(IProfileRepository):
             bool: Success of the operation.
         """
 
-        if await self.get_by_id(profile_id):
-            query = profile_table \
-                .delete() \
-                .where(profile_table.c.id == profile_id)
-            await database.execute(query)
+        query = (
+            profile_table.delete()
+            .where(profile_table.c.id == profile_id)
+            .returning(profile_table.c.id)
+        )
 
-            return True
+        return await database.fetch_one(query) is not None
 
-        return False
+    async def delete_cascade(self, profile_id: int) -> Dict[str, int]:
+        """
+        The method removing profile together with its profile collections and quests from the database.
+            All rows are removed by one statement with data-modifying CTEs, so foreign keys are checked
+            once at its end and only the counts are sent back.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            Dict[str, int]: The number of removed rows per table.
+        """
+
+        deleted = [
+            table.delete()
+            .where(column == profile_id)
+            .returning(table.c.id, copies)
+            .cte(f"deleted_{table.name}")
+            for table, column, copies in (
+                (profile_card_table, profile_card_table.c.profile_id, profile_card_table.c.count),
+                (quest_table, quest_table.c.profile_id, literal_column("1").label("count")),
+                (profile_table, profile_table.c.id, literal_column("1").label("count")),
+            )
+        ]
+        query = select(*[
+            select(func.coalesce(func.sum(rows.c.count), 0)).scalar_subquery().label(label)
+            for rows, label in zip(deleted, ("profile_collection", "quest", "profile"))
+        ])
+        counts = await database.fetch_one(query)
+
+        return dict(counts)
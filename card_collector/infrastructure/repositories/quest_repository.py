@@ -1,13 +1,42 @@
-from typing import Any, List
+from typing import Any, AsyncIterator, List
 
-from sqlalchemy import select
+from sqlalchemy import func, select, bindparam
 
 from card_collector.core.repositories.i_quest_repository import IQuestRepository
 from card_collector.core.domains.quest import Quest, QuestIn
 from card_collector.db import (
+    BULK_BATCH_SIZE,
+    any_of,
+    equal_to,
     quest_table,
     database,
 )
+from card_collector.infrastructure.repositories.statement_registry import statements
+
+GET_ALL_BY_PROFILE = statements.register(
+    "quest.get_all_by_profile",
+    (
+        select(quest_table)
+        .where(quest_table.c.profile_id == bindparam("profile_id"))
+    ),
+)
+
+GET_ALL_BY_REWARD = statements.register(
+    "quest.get_all_by_reward",
+    (
+        select(quest_table)
+        .where(quest_table.c.reward == bindparam("reward_id"))
+    ),
+)
+
+GET_BY_ID = statements.register(
+    "quest.get_by_id",
+    (
+        quest_table.select()
+        .where(quest_table.c.id == bindparam("quest_id"))
+    ),
+)
+
 
 class QuestRepository(IQuestRepository):
 
@@ -26,25 +55,59 @@ class QuestRepository(IQuestRepository):
 
         return [Quest.from_record(quest) for quest in quests]
 
-    async def get_all_by_profile(self, profile_id: int) -> List[Any]:
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
         """
-        The method getting all quests with a given profile id from the database.
+        The method getting a page of quests ordered by id from the database, using the id as the cursor.
 
         Args:
-            profile_id (int): The id of the profile.
+            limit (int): The maximal number of quests.
+            after (int | None): The id after which the page starts. Defaults to None.
 
         Returns:
-            List[Quest]: Quests.
+            List[Any]: Quests in the database.
         """
 
         query = (
             select(quest_table)
-            .where(quest_table.c.profile_id == profile_id) # type: ignore
+            .order_by(quest_table.c.id)
+            .limit(limit)
         )
+        if after is not None:
+            query = query.where(quest_table.c.id > after)
         quests = await database.fetch_all(query)
 
         return [Quest.from_record(quest) for quest in quests]
 
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all quests ordered by id from the database through a server-side cursor.
+
+        Returns:
+            AsyncIterator[Any]: Quests in the database.
+        """
+
+        query = (
+            select(quest_table)
+            .order_by(quest_table.c.id)
+        )
+        async for quest in database.iterate(query):
+            yield Quest.from_record(quest)
+
+    async def get_all_by_profile(self, profile_id: int) -> List[Any]:
+        """
+        The method getting all quests with a given profile id from the database.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[Quest]: Quests.
+        """
+
+        quests = await statements.fetch_all(GET_ALL_BY_PROFILE, profile_id=profile_id)
+
+        return [Quest.from_record(quest) for quest in quests]
+
     async def get_all_by_reward(self, reward_id: int) -> List[Any]:
         """
         The method getting all quests with a given reward id from the database.
@@ -56,11 +119,7 @@ class QuestRepository(IQuestRepository):
             List[Quest]: Quests.
         """
 
-        query = (
-            select(quest_table)
-            .where(quest_table.c.reward == reward_id) # type: ignore
-        )
-        quests = await database.fetch_all(query)
+        quests = await statements.fetch_all(GET_ALL_BY_REWARD, reward_id=reward_id)
 
         return [Quest.from_record(quest) for quest in quests]
 
@@ -75,12 +134,7 @@ class QuestRepository(IQuestRepository):
             Any | None: The quest details.
         """
 
-        query = (
-            quest_table.select()
-            .where(quest_table.c.id == quest_id)
-        )
-
-        quest = await database.fetch_one(query)
+        quest = await statements.fetch_one(GET_BY_ID, quest_id=quest_id)
 
         return Quest.from_record(quest) if quest else None
 
@@ -95,11 +149,40 @@ class QuestRepository(IQuestRepository):
             Any | None: The newly added quest.
         """
 
-        query = quest_table.insert().values(**data.model_dump())
-        new_quest_id = await database.execute(query)
-        new_quest = await self.get_by_id(new_quest_id)
+        query = (
+            quest_table.insert()
+            .values(**data.model_dump())
+            .returning(quest_table)
+        )
+        new_quest = await database.fetch_one(query)
 
-        return Quest(**dict(new_quest)) if new_quest else None
+        return Quest.from_record(new_quest) if new_quest else None
+
+    async def add_many(self, data: List[QuestIn]) -> List[Any]:
+        """
+        The method adding many quests to the database with multi-row inserts, in batches inside one transaction.
+
+        Args:
+            data (List[QuestIn]): The details of the new quests.
+
+        Returns:
+            List[Any]: The newly added quests.
+        """
+
+        if not data:
+            return []
+
+        new_quests = []
+        async with database.transaction():
+            for start in range(0, len(data), BULK_BATCH_SIZE):
+                query = (
+                    quest_table.insert()
+                    .values([quest.model_dump() for quest in data[start:start + BULK_BATCH_SIZE]])
+                    .returning(quest_table)
+                )
+                new_quests += await database.fetch_all(query)
+
+        return [Quest.from_record(quest) for quest in new_quests]
 
     async def update_quest(
             self,
@@ -117,19 +200,61 @@ class QuestRepository(IQuestRepository):
             Any | None: The updated quest details.
         """
 
-        if self.get_by_id(quest_id):
-            query = (
-                quest_table.update()
-                .where(quest_table.c.id == quest_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+        query = (
+            quest_table.update()
+            .where(quest_table.c.id == quest_id)
+            .values(**data.model_dump())
+            .returning(quest_table)
+        )
+        quest = await database.fetch_one(query)
+
+        return Quest.from_record(quest) if quest else None
+
+    async def add_progress(self, profile_id: int, amount: int) -> int:
+        """
+        The method increasing cards collected of all quests of a given profile with one update.
+            Only the number of completed quests is sent back, so the caller skips the delete when it is 0.
 
-            quest = await self.get_by_id(quest_id)
+        Args:
+            profile_id (int): The id of the profile.
+            amount (int): The number of collected cards.
 
-            return Quest(**dict(quest)) if quest else None
+        Returns:
+            int: The number of quests of the profile completed after the update.
+        """
 
-        return None
+        updated = (
+            quest_table.update()
+            .where(quest_table.c.profile_id == profile_id)
+            .values(cards_collected=quest_table.c.cards_collected + amount)
+            .returning((quest_table.c.cards_collected >= quest_table.c.cards_needed).label("completed"))
+            .cte("updated")
+        )
+        query = select(func.count()).select_from(updated).where(updated.c.completed)
+
+        return await database.fetch_val(query)
+
+    async def delete_completed_by_profile(self, profile_id: int) -> List[int]:
+        """
+        The method removing completed quests of a given profile with one delete.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[int]: The rewards of the removed quests.
+        """
+
+        query = (
+            quest_table.delete()
+            .where(
+                quest_table.c.profile_id == profile_id,
+                quest_table.c.cards_collected >= quest_table.c.cards_needed)
+            .returning(quest_table.c.reward)
+        )
+        rewards = await database.fetch_all(query)
+
+        return [reward["reward"] for reward in rewards]
 
     async def delete_quest(self, quest_id: int) -> bool:
         """
@@ -142,12 +267,53 @@ class QuestRepository(IQuestRepository):
             bool: Success of the operation.
         """
 
-        if await self.get_by_id(quest_id):
-            query = quest_table \
-                .delete() \
-                .where(quest_table.c.id == quest_id)
-            await database.execute(query)
+        query = (
+            quest_table.delete()
+            .where(quest_table.c.id == quest_id)
+            .returning(quest_table.c.id)
+        )
+
+        return await database.fetch_one(query) is not None
+
+    async def delete_many(self, quest_ids: List[int]) -> List[Any]:
+        """
+        The method removing quests with given ids from the database with one delete.
+
+        Args:
+            quest_ids (List[int]): The ids of the quests.
+
+        Returns:
+            List[Any]: The removed quests.
+        """
+
+        if not quest_ids:
+            return []
 
-            return True
+        query = (
+            quest_table.delete()
+            .where(any_of(quest_table.c.id, quest_ids))
+            .returning(quest_table)
+        )
+        quests = await database.fetch_all(query)
 
-        return False
+        return [Quest.from_record(quest) for quest in quests]
+
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The method removing quests with given column values from the database with one delete.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Any]: The removed quests.
+        """
+
+        query = (
+            quest_table.delete()
+            .where(*equal_to(quest_table, filters))
+            .returning(quest_table)
+        )
+        quests = await database.fetch_all(query)
+
+        return [Quest.from_record(quest) for quest in quests]
@@ -0,0 +1,125 @@
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import ColumnElement, Integer, Table, and_, bindparam, exists, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from card_collector.core.domains.reference import Reference, ReferenceKind
+from card_collector.core.repositories.i_reference_repository import IReferenceRepository
+from card_collector.db import (
+    card_table,
+    profile_card_table,
+    profile_table,
+    quest_table,
+    trade_offer_table,
+)
+from card_collector.infrastructure.repositories.statement_registry import RegisteredStatement, statements
+
+# The EXISTS condition of each kind of reference, with the bind parameters suffixed by the position
+# of the reference. Ownership is read from profile_card, which has a row only while a copy is owned.
+EXISTS_BY_KIND: Dict[ReferenceKind, Callable[[int], ColumnElement]] = {
+    ReferenceKind.PROFILE: lambda i: exists().where(profile_table.c.id == bindparam(f"id_{i}")),
+    ReferenceKind.CARD: lambda i: exists().where(card_table.c.id == bindparam(f"id_{i}")),
+    ReferenceKind.OWNED_CARD: lambda i: exists().where(
+        and_(
+            profile_card_table.c.profile_id == bindparam(f"profile_id_{i}"),
+            profile_card_table.c.card_id == bindparam(f"id_{i}"),
+        )
+    ),
+    ReferenceKind.TRADE_OFFER: lambda i: exists().where(trade_offer_table.c.id == bindparam(f"id_{i}")),
+    ReferenceKind.QUEST: lambda i: exists().where(quest_table.c.id == bindparam(f"id_{i}")),
+}
+
+# The table of each kind of reference with an id of its own.
+TABLES_BY_KIND: Dict[ReferenceKind, Table] = {
+    ReferenceKind.PROFILE: profile_table,
+    ReferenceKind.CARD: card_table,
+    ReferenceKind.TRADE_OFFER: trade_offer_table,
+    ReferenceKind.QUEST: quest_table,
+}
+
+requested = func.unnest(bindparam("ids", type_=ARRAY(Integer))).table_valued("id").render_derived().alias("requested")
+
+# The ids of a bulk write missing from the table of their kind, found with one anti-join on its primary key.
+MISSING_BY_KIND: Dict[ReferenceKind, RegisteredStatement] = {
+    kind: statements.register(
+        f"reference.missing:{kind.value}",
+        (
+            select(requested.c.id)
+            .distinct()
+            .where(~exists().where(table.c.id == requested.c.id))
+            .order_by(requested.c.id)
+        ),
+    )
+    for kind, table in TABLES_BY_KIND.items()
+}
+
+# One statement per sequence of kinds, registered on first use. The routers check a few fixed sequences.
+EXIST_STATEMENTS: Dict[Tuple[ReferenceKind, ...], RegisteredStatement] = {}
+
+
+def exist_statement(kinds: Tuple[ReferenceKind, ...]) -> RegisteredStatement:
+    """Function getting the statement selecting one EXISTS per reference, registering it on first use.
+
+    Args:
+        kinds (Tuple[ReferenceKind, ...]): The kinds of the references.
+
+    Returns:
+        RegisteredStatement: The statement.
+    """
+    if kinds not in EXIST_STATEMENTS:
+        EXIST_STATEMENTS[kinds] = statements.register(
+            f"reference.exist:{','.join(kind.value for kind in kinds)}",
+            select(*(EXISTS_BY_KIND[kind](i).label(f"exists_{i}") for i, kind in enumerate(kinds))),
+        )
+
+    return EXIST_STATEMENTS[kinds]
+
+
+class ReferenceRepository(IReferenceRepository):
+
+    async def exist(self, references: List[Reference]) -> List[bool]:
+        """
+        The method checking whether the referenced rows exist with a single SELECT EXISTS(...), EXISTS(...), ...
+
+        Args:
+            references (List[Reference]): The references.
+
+        Returns:
+            List[bool]: Whether each reference exists, in the order of the references.
+        """
+
+        if not references:
+            return []
+
+        values = {}
+        for i, reference in enumerate(references):
+            values[f"id_{i}"] = reference.id
+            if reference.kind is ReferenceKind.OWNED_CARD:
+                values[f"profile_id_{i}"] = reference.profile_id
+        row = await statements.fetch_one(exist_statement(tuple(reference.kind for reference in references)), **values)
+
+        return list(row.values())
+
+    async def missing(self, kind: ReferenceKind, ids: List[int]) -> List[int]:
+        """
+        The method finding which of many rows of a kind do not exist with one anti-join of the ids on the primary key.
+
+        Args:
+            kind (ReferenceKind): The kind of the rows, any but an owned card.
+            ids (List[int]): The ids of the rows.
+
+        Returns:
+            List[int]: The missing ids, ascending and without duplicates.
+
+        Raises:
+            ValueError: If the kind is an owned card.
+        """
+
+        if kind is ReferenceKind.OWNED_CARD:
+            raise ValueError("Owned cards are checked by reference, with their profile")
+        if not ids:
+            return []
+
+        rows = await statements.fetch_all(MISSING_BY_KIND[kind], ids=ids)
+
+        return [row["id"] for row in rows]
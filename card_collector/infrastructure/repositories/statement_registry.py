@@ -0,0 +1,179 @@
+"""A module providing a registry of pre-compiled statements for the hot repository lookups."""
+
+import time
+from typing import Any, Dict, List, Tuple
+
+import databases
+from asyncpg import Record
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.compiler import SQLCompiler
+
+from card_collector.call_tracking import record_statement
+from card_collector.db import database
+from card_collector.db_compat import raw_connection
+
+
+class RegisteredStatement:
+    """A statement compiled once at import, with the statistics of its executions."""
+
+    name: str
+    sql: str
+    calls: int
+    total_time: float
+    max_time: float
+    _compiled: SQLCompiler
+    _positions: Tuple[str, ...]
+
+    def __init__(self, name: str, query: ClauseElement) -> None:
+        """The initializer of the statement, compiling the query to asyncpg SQL with $n placeholders.
+
+        Args:
+            name (str): The name of the statement.
+            query (ClauseElement): The query, with bindparam() for every argument.
+        """
+        self._compiled = query.compile(dialect=asyncpg_dialect())
+        self._positions = tuple(self._compiled.positiontup or ())
+        self.name = name
+        self.sql = self._compiled.string
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def arguments(self, values: Dict[str, Any]) -> List[Any]:
+        """Function ordering the values of the bind parameters, literals of the query included.
+
+        Args:
+            values (Dict[str, Any]): The values of the bind parameters by name.
+
+        Returns:
+            List[Any]: The positional arguments.
+        """
+        params = self._compiled.construct_params(values)
+
+        return [params[name] for name in self._positions]
+
+    def record(self, elapsed: float) -> None:
+        """Function recording one execution.
+
+        Args:
+            elapsed (float): The execution time in seconds.
+        """
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+    def stats(self) -> Dict[str, Any]:
+        """Function summarizing the executions.
+
+        Returns:
+            Dict[str, Any]: The call count and the total, mean and max latencies in milliseconds.
+        """
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "total_ms": self.total_time * 1000,
+            "mean_ms": self.total_time * 1000 / self.calls if self.calls else 0.0,
+            "max_ms": self.max_time * 1000,
+        }
+
+
+class StatementRegistry:
+    """A registry running pre-compiled statements straight on the asyncpg connection.
+
+    The statements skip the SQLAlchemy compilation and the row wrapping of databases,
+    and return asyncpg records. asyncpg keeps a cache of prepared statements per pool
+    connection keyed by the SQL (DB_STATEMENT_CACHE_SIZE), so the fixed SQL of a
+    registered statement is prepared once per connection and then only bound and executed.
+    """
+
+    _database: databases.Database
+    _statements: Dict[str, RegisteredStatement]
+
+    def __init__(self, db: databases.Database) -> None:
+        """The initializer of the registry.
+
+        Args:
+            db (databases.Database): The database client whose connections run the statements.
+        """
+        self._database = db
+        self._statements = {}
+
+    def register(self, name: str, query: ClauseElement) -> RegisteredStatement:
+        """Function registering a statement under a unique name.
+
+        Args:
+            name (str): The name of the statement.
+            query (ClauseElement): The query, with bindparam() for every argument.
+
+        Returns:
+            RegisteredStatement: The registered statement.
+        """
+        if name in self._statements:
+            raise ValueError(f"Statement {name} is already registered")
+
+        statement = RegisteredStatement(name, query)
+        self._statements[name] = statement
+
+        return statement
+
+    async def fetch_all(self, statement: RegisteredStatement, **values: Any) -> List[Record]:
+        """Function fetching all rows of a statement.
+
+        Args:
+            statement (RegisteredStatement): The statement.
+            **values (Any): The values of the bind parameters.
+
+        Returns:
+            List[Record]: The rows.
+        """
+        return await self._run(statement, "fetch", values)
+
+    async def fetch_one(self, statement: RegisteredStatement, **values: Any) -> Record | None:
+        """Function fetching the first row of a statement.
+
+        Args:
+            statement (RegisteredStatement): The statement.
+            **values (Any): The values of the bind parameters.
+
+        Returns:
+            Record | None: The row, None if there is none.
+        """
+        return await self._run(statement, "fetchrow", values)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Function summarizing the executions of every statement, most time consuming first.
+
+        Returns:
+            List[Dict[str, Any]]: The statistics of the statements.
+        """
+        return sorted(
+            (statement.stats() for statement in self._statements.values()),
+            key=lambda stats: stats["total_ms"],
+            reverse=True,
+        )
+
+    async def _run(self, statement: RegisteredStatement, method: str, values: Dict[str, Any]) -> Any:
+        """Function running a statement on the connection of the current task.
+
+        Args:
+            statement (RegisteredStatement): The statement.
+            method (str): The method of the asyncpg connection, fetch or fetchrow.
+            values (Dict[str, Any]): The values of the bind parameters.
+
+        Returns:
+            Any: The result of the method.
+        """
+        args = statement.arguments(values)
+
+        async with raw_connection(self._database) as connection:
+            started = time.perf_counter()
+            result = await getattr(connection, method)(statement.sql, *args)
+            elapsed = time.perf_counter() - started
+            statement.record(elapsed)
+            record_statement(elapsed)
+
+        return result
+
+
+statements = StatementRegistry(database)
@@ -1,13 +1,64 @@
-from typing import Any, List
+from typing import Any, AsyncIterator, List
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, bindparam
 
 from card_collector.core.repositories.i_trade_offer_repository import ITradeOfferRepository
 from card_collector.core.domains.trade_offer import TradeOffer, TradeOfferIn
 from card_collector.db import (
+    BULK_BATCH_SIZE,
+    any_of,
+    equal_to,
     trade_offer_table,
     database,
 )
+from card_collector.infrastructure.repositories.statement_registry import statements
+
+GET_ALL_BY_CARD_OFFERED = statements.register(
+    "trade_offer.get_all_by_card_offered",
+    (
+        select(trade_offer_table)
+        .where(trade_offer_table.c.card_offered == bindparam("card_offered"))
+    ),
+)
+
+GET_ALL_BY_CARD_WANTED = statements.register(
+    "trade_offer.get_all_by_card_wanted",
+    (
+        select(trade_offer_table)
+        .where(trade_offer_table.c.card_wanted == bindparam("card_wanted"))
+    ),
+)
+
+GET_BY_ID = statements.register(
+    "trade_offer.get_by_id",
+    (
+        trade_offer_table.select()
+        .where(trade_offer_table.c.id == bindparam("trade_offer_id"))
+    ),
+)
+
+GET_BY_OFFER = statements.register(
+    "trade_offer.get_by_offer",
+    (
+        trade_offer_table.select()
+        .where(
+            trade_offer_table.c.card_offered == bindparam("card_offered"),
+            trade_offer_table.c.card_wanted == bindparam("card_wanted"))
+    ),
+)
+
+GET_BY_PROFILE_ID_AND_CARD_OFFERED_ID = statements.register(
+    "trade_offer.get_by_profile_id_and_card_offered_id",
+    (
+        trade_offer_table.select()
+        .where(
+            and_(
+                trade_offer_table.c.profile_posted == bindparam("profile_id"),
+                trade_offer_table.c.card_offered == bindparam("card_offered_id"))
+        )
+    ),
+)
+
 
 class TradeOfferRepository(ITradeOfferRepository):
 
@@ -26,25 +77,59 @@ class TradeOfferRepository(ITradeOfferRepository):
 
         return [TradeOffer.from_record(trade_offer) for trade_offer in trade_offers]
 
-    async def get_all_by_card_offered(self, card_offered: int) -> List[Any]:
+    async def get_page(self, limit: int, after: int | None = None) -> List[Any]:
         """
-        The method getting all trade offers with a given card id from the database.
+        The method getting a page of trade offers ordered by id from the database, using the id as the cursor.
 
         Args:
-            card_offered (int): the id of card offered.
+            limit (int): The maximal number of trade offers.
+            after (int | None): The id after which the page starts. Defaults to None.
 
         Returns:
-            List[Any]: Trade Offers in the database.
+            List[Any]: Trade offers in the database.
         """
 
         query = (
             select(trade_offer_table)
-            .where(trade_offer_table.c.card_offered == card_offered) # type: ignore
+            .order_by(trade_offer_table.c.id)
+            .limit(limit)
         )
+        if after is not None:
+            query = query.where(trade_offer_table.c.id > after)
         trade_offers = await database.fetch_all(query)
 
         return [TradeOffer.from_record(trade_offer) for trade_offer in trade_offers]
 
+    async def iterate(self) -> AsyncIterator[Any]:
+        """
+        The method streaming all trade offers ordered by id from the database through a server-side cursor.
+
+        Returns:
+            AsyncIterator[Any]: Trade offers in the database.
+        """
+
+        query = (
+            select(trade_offer_table)
+            .order_by(trade_offer_table.c.id)
+        )
+        async for trade_offer in database.iterate(query):
+            yield TradeOffer.from_record(trade_offer)
+
+    async def get_all_by_card_offered(self, card_offered: int) -> List[Any]:
+        """
+        The method getting all trade offers with a given card id from the database.
+
+        Args:
+            card_offered (int): the id of card offered.
+
+        Returns:
+            List[Any]: Trade Offers in the database.
+        """
+
+        trade_offers = await statements.fetch_all(GET_ALL_BY_CARD_OFFERED, card_offered=card_offered)
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in trade_offers]
+
     async def get_all_by_card_wanted(self, card_wanted: int) -> List[Any]:
         """
         The method getting all trade offers with a given card id from the database.
@@ -56,11 +141,7 @@ class TradeOfferRepository(ITradeOfferRepository):
             List[Any]: Trade Offers in the database.
         """
 
-        query = (
-            select(trade_offer_table)
-            .where(trade_offer_table.c.card_wanted == card_wanted) # type: ignore
-        )
-        trade_offers = await database.fetch_all(query)
+        trade_offers = await statements.fetch_all(GET_ALL_BY_CARD_WANTED, card_wanted=card_wanted)
 
         return [TradeOffer.from_record(trade_offer) for trade_offer in trade_offers]
 
@@ -76,12 +157,7 @@ class TradeOfferRepository(ITradeOfferRepository):
             Any | None: The trade offer details.
         """
 
-        query = (
-            trade_offer_table.select()
-            .where(trade_offer_table.c.id == trade_offer_id)
-        )
-
-        trade_offer = await database.fetch_one(query)
+        trade_offer = await statements.fetch_one(GET_BY_ID, trade_offer_id=trade_offer_id)
 
         return TradeOffer.from_record(trade_offer) if trade_offer else None
 
@@ -96,40 +172,85 @@ class TradeOfferRepository(ITradeOfferRepository):
         Returns:
             TradeOffer | None: The trade offer details.
         """
-        query = (
-            trade_offer_table.select()
+        trade_offer = await statements.fetch_one(GET_BY_OFFER, card_offered=card_offered, card_wanted=card_wanted)
+
+        return TradeOffer.from_record(trade_offer) if trade_offer else None
+
+    async def get_by_profile_id_and_card_offered_id(self, profile_id: int, card_offered_id: int) -> Any | None:
+        """
+        The method getting trade offer with a given profile id and card offered id.
+
+        Args:
+            profile_id (int): the id of profile.
+            card_offered_id (int): the id of card offered.
+
+        Returns:
+            Any | None: The trade offer details.
+        """
+
+        trade_offers = await statements.fetch_all(GET_BY_PROFILE_ID_AND_CARD_OFFERED_ID, profile_id=profile_id, card_offered_id=card_offered_id)
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in trade_offers]
+
+    async def claim_by_offer(self, card_offered: int, card_wanted: int) -> Any | None:
+        """
+        The method removing and returning the oldest trade offer with a given offer.
+            Rows locked by concurrent transactions are skipped, so concurrent matchers never claim the same offer.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            Any | None: The claimed trade offer details.
+        """
+
+        claimed = (
+            select(trade_offer_table.c.id)
             .where(
                 trade_offer_table.c.card_offered == card_offered,
                 trade_offer_table.c.card_wanted == card_wanted)
+            .order_by(trade_offer_table.c.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        query = (
+            trade_offer_table.delete()
+            .where(trade_offer_table.c.id == claimed)
+            .returning(trade_offer_table)
         )
 
         trade_offer = await database.fetch_one(query)
 
         return TradeOffer.from_record(trade_offer) if trade_offer else None
 
-    async def get_by_profile_id_and_card_offered_id(self, profile_id: int, card_offered_id: int) -> Any | None:
+    async def claim_by_id(self, trade_offer_id: int) -> Any | None:
         """
-        The method getting trade offer with a given profile id and card offered id.
+        The method removing and returning trade offer with a given id, skipping it if it is locked.
 
         Args:
-            profile_id (int): the id of profile.
-            card_offered_id (int): the id of card offered.
+            trade_offer_id (int): The id of the trade offer.
 
         Returns:
-            Any | None: The trade offer details.
+            Any | None: The claimed trade offer details.
         """
 
+        claimed = (
+            select(trade_offer_table.c.id)
+            .where(trade_offer_table.c.id == trade_offer_id)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
         query = (
-            trade_offer_table.select()
-            .where(
-                and_(
-                    trade_offer_table.c.profile_posted == profile_id,
-                    trade_offer_table.c.card_offered == card_offered_id)
-            )
+            trade_offer_table.delete()
+            .where(trade_offer_table.c.id == claimed)
+            .returning(trade_offer_table)
         )
-        trade_offers = await database.fetch_all(query)
 
-        return [TradeOffer.from_record(trade_offer) for trade_offer in trade_offers]
+        trade_offer = await database.fetch_one(query)
+
+        return TradeOffer.from_record(trade_offer) if trade_offer else None
 
     async def add_trade_offer(self, data: TradeOfferIn) -> Any | None:
         """
@@ -142,11 +263,40 @@ class TradeOfferRepository(ITradeOfferRepository):
             Any | None: The newly added trade offer.
         """
 
-        query = trade_offer_table.insert().values(**data.model_dump())
-        new_trade_offer_id = await database.execute(query)
-        new_trade_offer = await self.get_by_id(new_trade_offer_id)
+        query = (
+            trade_offer_table.insert()
+            .values(**data.model_dump())
+            .returning(trade_offer_table)
+        )
+        new_trade_offer = await database.fetch_one(query)
 
-        return TradeOffer(**dict(new_trade_offer)) if new_trade_offer else None
+        return TradeOffer.from_record(new_trade_offer) if new_trade_offer else None
+
+    async def add_many(self, data: List[TradeOfferIn]) -> List[Any]:
+        """
+        The method adding many trade offers to the database with multi-row inserts, in batches inside one transaction.
+
+        Args:
+            data (List[TradeOfferIn]): The details of the new trade offers.
+
+        Returns:
+            List[Any]: The newly added trade offers.
+        """
+
+        if not data:
+            return []
+
+        new_trade_offers = []
+        async with database.transaction():
+            for start in range(0, len(data), BULK_BATCH_SIZE):
+                query = (
+                    trade_offer_table.insert()
+                    .values([trade_offer.model_dump() for trade_offer in data[start:start + BULK_BATCH_SIZE]])
+                    .returning(trade_offer_table)
+                )
+                new_trade_offers += await database.fetch_all(query)
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in new_trade_offers]
 
     async def update_trade_offer(
             self,
@@ -164,19 +314,15 @@ class TradeOfferRepository(ITradeOfferRepository):
             Any | None: The updated trade offer details.
         """
 
-        if self.get_by_id(trade_offer_id):
-            query = (
-                trade_offer_table.update()
-                .where(trade_offer_table.c.id == trade_offer_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-
-            trade_offer = await self.get_by_id(trade_offer_id)
-
-            return TradeOffer(**dict(trade_offer)) if trade_offer else None
+        query = (
+            trade_offer_table.update()
+            .where(trade_offer_table.c.id == trade_offer_id)
+            .values(**data.model_dump())
+            .returning(trade_offer_table)
+        )
+        trade_offer = await database.fetch_one(query)
 
-        return None
+        return TradeOffer.from_record(trade_offer) if trade_offer else None
 
     async def delete_trade_offer(self, trade_offer_id: int) -> bool:
         """
@@ -189,12 +335,53 @@ class TradeOfferRepository(ITradeOfferRepository):
             bool: Success of the operation.
         """
 
-        if await self.get_by_id(trade_offer_id):
-            query = trade_offer_table \
-                .delete() \
-                .where(trade_offer_table.c.id == trade_offer_id)
-            await database.execute(query)
+        query = (
+            trade_offer_table.delete()
+            .where(trade_offer_table.c.id == trade_offer_id)
+            .returning(trade_offer_table.c.id)
+        )
+
+        return await database.fetch_one(query) is not None
+
+    async def delete_many(self, trade_offer_ids: List[int]) -> List[Any]:
+        """
+        The method removing trade offers with given ids from the database with one delete.
+
+        Args:
+            trade_offer_ids (List[int]): The ids of the trade offers.
+
+        Returns:
+            List[Any]: The removed trade offers.
+        """
+
+        if not trade_offer_ids:
+            return []
 
-            return True
+        query = (
+            trade_offer_table.delete()
+            .where(any_of(trade_offer_table.c.id, trade_offer_ids))
+            .returning(trade_offer_table)
+        )
+        trade_offers = await database.fetch_all(query)
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in trade_offers]
+
+    async def delete_where(self, **filters: Any) -> List[Any]:
+        """
+        The method removing trade offers with given column values from the database with one delete.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
 
-        return False
+        Returns:
+            List[Any]: The removed trade offers.
+        """
+
+        query = (
+            trade_offer_table.delete()
+            .where(*equal_to(trade_offer_table, filters))
+            .returning(trade_offer_table)
+        )
+        trade_offers = await database.fetch_all(query)
+
+        return [TradeOffer.from_record(trade_offer) for trade_offer in trade_offers]
@@ -0,0 +1,175 @@
+import asyncio
+from typing import Any, Callable, Dict, List, Tuple
+
+Hook = Callable[[], None]
+
+
+class TransactionHooks:
+    """
+    The callbacks of the transactions open in each task, innermost last.
+        In-memory state mirroring the storage (caches, the order book) registers here how to publish
+        a write once it is committed and how to undo a write it applied early if it is rolled back.
+        A committed savepoint hands its callbacks to the enclosing transaction, so they follow its outcome.
+    """
+
+    _frames: Dict[asyncio.Task | None, List[Tuple[List[Hook], List[Hook]]]]
+
+    def __init__(self) -> None:
+        """
+        The initializer of the transaction hooks.
+        """
+        self._frames = {}
+
+    def begin(self) -> None:
+        """
+        The method opening the callbacks of a transaction started in the current task.
+        """
+        self._frames.setdefault(self._task(), []).append(([], []))
+
+    def commit(self) -> None:
+        """
+        The method closing a committed transaction, running its after-commit callbacks if it is the outermost one.
+        """
+        frames = self._frames[self._task()]
+        after_commit, on_rollback = frames.pop()
+        if frames:
+            frames[-1][0].extend(after_commit)
+            frames[-1][1].extend(on_rollback)
+            return
+
+        self._release()
+        for hook in after_commit:
+            hook()
+
+    def rollback(self) -> None:
+        """
+        The method closing a rolled back transaction, running its rollback callbacks in reverse order.
+        """
+        frames = self._frames[self._task()]
+        _, on_rollback = frames.pop()
+        if not frames:
+            self._release()
+        for hook in reversed(on_rollback):
+            hook()
+
+    def after_commit(self, hook: Hook) -> None:
+        """
+        The method running a callback once the transactions open in the current task commit, or at once if none is.
+
+        Args:
+            hook (Hook): The callback.
+        """
+        if frames := self._frames.get(self._task()):
+            frames[-1][0].append(hook)
+        else:
+            hook()
+
+    def on_rollback(self, hook: Hook) -> None:
+        """
+        The method running a callback if the innermost transaction open in the current task rolls back.
+            Without an open transaction the write is already committed and the callback is dropped.
+
+        Args:
+            hook (Hook): The callback.
+        """
+        if frames := self._frames.get(self._task()):
+            frames[-1][1].append(hook)
+
+    def _release(self) -> None:
+        """
+        The method forgetting the current task once it has no open transaction.
+        """
+        self._frames.pop(self._task(), None)
+
+    @staticmethod
+    def _task() -> asyncio.Task | None:
+        """
+        The method getting the current task, which owns the transactions like it owns a connection.
+
+        Returns:
+            asyncio.Task | None: The task.
+        """
+        try:
+            return asyncio.current_task()
+        except RuntimeError:
+            return None
+
+
+class HookedTransaction:
+    """
+    A transaction of a storage backend running the callbacks registered in the transaction hooks.
+        It is used like a databases transaction: as an async context manager or awaited and finished by hand.
+    """
+
+    _transaction: Any
+    _hooks: TransactionHooks
+
+    def __init__(self, transaction: Any, hooks: TransactionHooks) -> None:
+        """
+        The initializer of the hooked transaction.
+
+        Args:
+            transaction (Any): The transaction of the backend, with start(), commit() and rollback().
+            hooks (TransactionHooks): The transaction hooks.
+        """
+        self._transaction = transaction
+        self._hooks = hooks
+
+    async def __aenter__(self) -> "HookedTransaction":
+        """
+        The method starting the transaction when entering the context.
+
+        Returns:
+            HookedTransaction: The transaction.
+        """
+        return await self.start()
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """
+        The method committing the transaction, or rolling it back on an exception, when leaving the context.
+        """
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    def __await__(self):
+        """
+        The method starting the transaction when awaited.
+
+        Returns:
+            Generator: The awaitable of start().
+        """
+        return self.start().__await__()
+
+    async def start(self) -> "HookedTransaction":
+        """
+        The method starting the transaction, as a savepoint if another one is open in the task.
+
+        Returns:
+            HookedTransaction: The transaction.
+        """
+        await self._transaction.start()
+        self._hooks.begin()
+
+        return self
+
+    async def commit(self) -> None:
+        """
+        The method committing the transaction, then publishing its writes, or undoing them if the commit fails.
+        """
+        try:
+            await self._transaction.commit()
+        except BaseException:
+            self._hooks.rollback()
+            raise
+        self._hooks.commit()
+
+    async def rollback(self) -> None:
+        """
+        The method rolling back the transaction and undoing the writes applied early to in-memory state.
+        """
+        try:
+            await self._transaction.rollback()
+        finally:
+            self._hooks.rollback()
@@ -0,0 +1,69 @@
+import time
+from contextlib import AsyncExitStack
+from typing import Any
+
+from card_collector.core.repositories.i_transaction_manager import ITransactionManager
+from card_collector.metrics import DB_POOL_CHECKOUT_WAIT
+
+class UnitOfWork:
+    """
+    A unit of work holding one connection, and for atomic work one transaction, for its whole scope.
+        Repositories reach the held connection through the current task, so every statement of the scope
+        shares a single pool checkout and transactions opened by services inside it become savepoints.
+        Any exception, HTTP errors included, rolls the transaction back.
+    """
+
+    _transactions: ITransactionManager
+    _atomic: bool
+    _stack: AsyncExitStack | None
+
+    def __init__(
+            self,
+            transactions: ITransactionManager,
+            atomic: bool = True,
+    ) -> None:
+        """
+        The initializer of the unit of work.
+
+        Args:
+            transactions (ITransactionManager): The reference to the transaction manager.
+            atomic (bool): Whether the work runs in one transaction. Defaults to True.
+        """
+        self._transactions = transactions
+        self._atomic = atomic
+        self._stack = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        """
+        The method holding the connection and opening the transaction of the unit of work.
+            The wait for the connection is recorded as the pool checkout wait.
+
+        Returns:
+            UnitOfWork: The unit of work.
+        """
+        stack = AsyncExitStack()
+        started = time.perf_counter()
+        await stack.enter_async_context(self._transactions.connection())
+        DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+        if self._atomic:
+            try:
+                await stack.enter_async_context(self._transactions.transaction())
+            except BaseException:
+                await stack.aclose()
+                raise
+        self._stack = stack
+
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """
+        The method committing the transaction, or rolling it back on error, and releasing the connection.
+
+        Args:
+            exc_type (Any): The type of the raised exception, if any.
+            exc_value (Any): The raised exception, if any.
+            traceback (Any): The traceback of the raised exception, if any.
+        """
+        stack, self._stack = self._stack, None
+
+        await stack.__aexit__(exc_type, exc_value, traceback)
@@ -0,0 +1,171 @@
+import random
+from typing import Dict, List, Tuple
+
+from card_collector.core.domains.card import Card
+from card_collector.infrastructure.repositories.cached_card_repository import CachedCardRepository, CardCatalog
+
+class AliasTable:
+    """
+    A Walker/Vose alias table drawing indexes with given weights in constant time.
+    """
+
+    _probabilities: List[float]
+    _aliases: List[int]
+
+    def __init__(self, weights: List[float]) -> None:
+        """
+        The initializer of the alias table.
+
+        Args:
+            weights (List[float]): Non-negative weights, at least one of them positive.
+        """
+        size = len(weights)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+
+        self._probabilities = [1.0] * size
+        self._aliases = list(range(size))
+
+        small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._probabilities[less] = scaled[less]
+            self._aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+
+    def draw(self, rng: random.Random) -> int:
+        """
+        The method drawing a single index.
+
+        Args:
+            rng (random.Random): The random number generator.
+
+        Returns:
+            int: The drawn index.
+        """
+        i = rng.randrange(len(self._probabilities))
+
+        return i if rng.random() < self._probabilities[i] else self._aliases[i]
+
+
+class CardSampler:
+    """
+    An engine drawing random cards from the cached card catalog.
+        Cards are indexed per rarity and rarities are drawn through an alias table,
+        so drawing N cards is O(N) and does not touch the database.
+        Without rarity weights every card is equally likely.
+    """
+
+    _repository: CachedCardRepository
+    _rarity_weights: Dict[int, float]
+    _rng: random.Random
+    _catalog: CardCatalog | None
+    _by_rarity: Dict[int, Tuple[Card, ...]]
+    _rarities: List[int]
+    _table: AliasTable | None
+
+    def __init__(
+            self,
+            repository: CachedCardRepository,
+            rarity_weights: Dict[int, float] | None = None,
+            seed: int | None = None
+    ) -> None:
+        """
+        The initializer of the card sampler.
+
+        Args:
+            repository (CachedCardRepository): The reference to the cached card repository.
+            rarity_weights (Dict[int, float] | None): The drop weight of each rarity,
+                rarities not listed have weight 1. Defaults to None (uniform over cards).
+            seed (int | None): The seed of the random number generator. Defaults to None.
+        """
+        self._repository = repository
+        self._rarity_weights = rarity_weights or {}
+        self._rng = random.Random(seed)
+        self._catalog = None
+        self._by_rarity = {}
+        self._rarities = []
+        self._table = None
+
+    def seed(self, seed: int | None) -> None:
+        """
+        The method reseeding the random number generator, e.g. for reproducible benchmarks.
+
+        Args:
+            seed (int | None): The new seed.
+        """
+        self._rng.seed(seed)
+
+    async def _refresh(self) -> None:
+        """
+        The method rebuilding the tables if the catalog has changed.
+            The catalog is read first, so an expired cache is reloaded and cards removed by other
+            workers are noticed. Only rarities whose cards changed are re-indexed.
+        """
+        catalog = await self._repository.catalog()
+        if catalog is self._catalog:
+            return
+
+        by_rarity = catalog.by_rarity
+        self._catalog = catalog
+
+        changed = by_rarity.keys() != self._by_rarity.keys()
+        for rarity_id, cards in by_rarity.items():
+            cards = tuple(cards)
+            if self._by_rarity.get(rarity_id) != cards:
+                self._by_rarity[rarity_id] = cards
+                changed = True
+        for rarity_id in self._by_rarity.keys() - by_rarity.keys():
+            del self._by_rarity[rarity_id]
+
+        if changed:
+            self._rarities = list(self._by_rarity)
+            weights = [
+                self._rarity_weights.get(rarity_id, 1.0) if self._rarity_weights else len(self._by_rarity[rarity_id])
+                for rarity_id in self._rarities
+            ]
+            self._table = AliasTable(weights) if sum(weights) > 0 else None
+
+    async def sample(self, amount: int) -> List[Card]:
+        """
+        The method drawing random cards of any rarity.
+
+        Args:
+            amount (int): The number of cards to draw.
+
+        Returns:
+            List[Card]: Drawn cards, empty if there are no cards to draw from.
+        """
+        await self._refresh()
+
+        if self._table is None:
+            return []
+
+        cards = []
+        for _ in range(amount):
+            bucket = self._by_rarity[self._rarities[self._table.draw(self._rng)]]
+            cards.append(bucket[self._rng.randrange(len(bucket))])
+
+        return cards
+
+    async def sample_by_rarity(self, amount: int, rarity_id: int) -> List[Card]:
+        """
+        The method drawing random cards of a given rarity.
+
+        Args:
+            amount (int): The number of cards to draw.
+            rarity_id (int): The id of the rarity.
+
+        Returns:
+            List[Card]: Drawn cards, empty if there are no cards with the rarity.
+        """
+        await self._refresh()
+
+        bucket = self._by_rarity.get(rarity_id)
+        if not bucket:
+            return []
+
+        return [bucket[self._rng.randrange(len(bucket))] for _ in range(amount)]
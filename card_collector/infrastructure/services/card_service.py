@@ -1,27 +1,35 @@
-import random
 import string
-from typing import List
+from typing import Any, AsyncIterator, List
 
-from card_collector.core.domains.card import Card, CardIn
+from card_collector.core.domains.card import Card, CardIn, CardReferences
 from card_collector.core.repositories.i_card_repository import ICardRepository
 from card_collector.core.services.i_card_service import ICardService
 from card_collector.core.services.i_profile_collection_service import IProfileCollectionService
+from card_collector.infrastructure.services.card_sampler import CardSampler
 
 class CardService(ICardService):
 
     _repository: ICardRepository
     _profile_collection_service: IProfileCollectionService
+    _sampler: CardSampler
 
-    def __init__(self, repository: ICardRepository, profile_collection_service: IProfileCollectionService) -> None:
+    def __init__(
+            self,
+            repository: ICardRepository,
+            profile_collection_service: IProfileCollectionService,
+            sampler: CardSampler
+    ) -> None:
         """
         The initializer of the card service.
 
         Args:
             repository (ICardRepository): The reference to the repository.
             profile_collection_service (IProfileCollectionService): The reference to the profile collection service.
+            sampler (CardSampler): The reference to the card sampler.
         """
         self._repository = repository
         self._profile_collection_service = profile_collection_service
+        self._sampler = sampler
 
     async def get_all(self) -> List[Card]:
         """
@@ -33,6 +41,30 @@ class CardService(ICardService):
 
         return await self._repository.get_all_cards()
 
+    async def get_page(self, limit: int, after: int | None = None) -> List[Card]:
+        """
+        The method getting a page of cards ordered by id from the repository.
+
+        Args:
+            limit (int): The maximal number of cards.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Card]: Cards.
+        """
+
+        return await self._repository.get_page(limit, after)
+
+    def iterate(self) -> AsyncIterator[Card]:
+        """
+        The method streaming all cards ordered by id from the repository.
+
+        Returns:
+            AsyncIterator[Card]: Cards.
+        """
+
+        return self._repository.iterate()
+
     async def get_all_by_rarity(self, rarity_id: int) -> List[Card]:
         """
         The method getting all cards with a given rarity id from the repository.
@@ -69,6 +101,19 @@ class CardService(ICardService):
 
         return await self._repository.get_by_name(name)
 
+    async def get_by_names(self, names: List[str]) -> List[Card]:
+        """
+        The method getting the cards with given names.
+
+        Args:
+            names (List[str]): The names of the cards.
+
+        Returns:
+            List[Card]: The cards found, in the order of their names.
+        """
+
+        return await self._repository.get_by_names(names)
+
     async def get_random_cards_by_rarity(self, amount: int, rarity_id: int) -> List[Card]:
         """
         The method for generating a given amount of random cards with a given rarity.
@@ -80,12 +125,7 @@ class CardService(ICardService):
         Returns:
             Card: generated card.
         """
-        cards = []
-
-        for _ in range(amount):
-            cards.append(random.choice(list(await self.get_all_by_rarity(rarity_id))))
-
-        return cards
+        return await self._sampler.sample_by_rarity(amount, rarity_id)
 
     async def get_random_cards(self, amount: int) -> List[Card]:
         """
@@ -97,12 +137,7 @@ class CardService(ICardService):
         Returns:
             List[Card]: Generated cards.
         """
-        cards = []
-
-        for _ in range(amount):
-            cards.append(random.choice(list(await self._repository.get_all_cards())))
-
-        return cards
+        return await self._sampler.sample(amount)
 
 
     async def add_card(self, data: CardIn) -> Card | None:
@@ -118,6 +153,19 @@ class CardService(ICardService):
 
         return await self._repository.add_card(data)
 
+    async def add_many(self, data: List[CardIn]) -> List[Card]:
+        """
+        The method adding many cards to the database in a single transaction.
+
+        Args:
+            data (List[CardIn]): The details of the new cards.
+
+        Returns:
+            List[Card]: Full details of the newly added cards.
+        """
+
+        return await self._repository.add_many(data)
+
     async def update_card(
             self,
             card_id: int,
@@ -139,6 +187,19 @@ class CardService(ICardService):
             data=data,
         )
 
+    async def has_references(self, card_id: int) -> CardReferences:
+        """
+        The method checking whether profile collections, trade offers or quests refer to a card.
+
+        Args:
+            card_id (int): The id of the card.
+
+        Returns:
+            CardReferences: The tables referring to the card.
+        """
+
+        return await self._repository.has_references(card_id)
+
     async def delete_card(self, card_id: int) -> bool:
         """
         The method removing card from the database.
@@ -151,3 +212,29 @@ class CardService(ICardService):
         """
 
         return await self._repository.delete_card(card_id)
+
+    async def delete_many(self, card_ids: List[int]) -> List[Card]:
+        """
+        The method removing cards with given ids from the database.
+
+        Args:
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            List[Card]: The removed cards.
+        """
+
+        return await self._repository.delete_many(card_ids)
+
+    async def delete_where(self, **filters: Any) -> List[Card]:
+        """
+        The method removing cards with given column values from the database.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Card]: The removed cards.
+        """
+
+        return await self._repository.delete_where(**filters)
@@ -1,18 +1,23 @@
 from card_collector.core.domains.trade_offer import TradeOffer, TradeOfferIn
-from card_collector.core.domains.profile_collection import ProfileCollectionIn
 from card_collector.core.services.i_collection_integration_service import ICollectionIntegrationService
 from card_collector.core.services.i_profile_collection_service import IProfileCollectionService
 from card_collector.core.services.i_trade_offer_service import ITradeOfferService
+from card_collector.core.services.i_trade_cycle_service import ITradeCycleService
+from card_collector.core.repositories.i_transaction_manager import ITransactionManager
 
 class CollectionIntegrationService(ICollectionIntegrationService):
 
     _profile_collection_service: IProfileCollectionService
     _trade_offer_service: ITradeOfferService
+    _trade_cycle_service: ITradeCycleService
+    _transactions: ITransactionManager
 
     def __init__(
             self,
             profile_collection_service: IProfileCollectionService,
-            trade_offer_service: ITradeOfferService
+            trade_offer_service: ITradeOfferService,
+            trade_cycle_service: ITradeCycleService,
+            transactions: ITransactionManager
     ) -> None:
         """
         The initializer of the profile_collection service.
@@ -20,43 +25,57 @@ class CollectionIntegrationService(ICollectionIntegrationService):
         Args:
             profile_collection_service (IProfileCollectionService): The reference to the profile collection service.
             trade_offer_service (ITradeOfferService): The reference to the trade offer service.
+            trade_cycle_service (ITradeCycleService): The reference to the trade cycle service.
+            transactions (ITransactionManager): The reference to the transaction manager.
         """
         self._profile_collection_service = profile_collection_service
         self._trade_offer_service =  trade_offer_service
+        self._trade_cycle_service = trade_cycle_service
+        self._transactions = transactions
 
     async def add_trade_offer(self, data: TradeOfferIn) -> TradeOffer | None:
         """
         The method adding new trade offer to the data storage, and completing it if its required.
+            A matching offer is claimed and both cards change owners in a single transaction.
+            Without a direct match, the new offer is posted and cleared as part of a trade cycle if possible.
+            A failed trade rolls back, which puts the claimed offer back in the order book.
 
         Args:
             data (TradeOfferIn): The details of the new trade offer.
 
         Returns:
-            TradeOffer | None: Full details of the newly added trade offer.
+            TradeOffer | None: Full details of the newly added or completed trade offer,
+                None if the trade could not be executed.
         """
-        trade_offer = await self._trade_offer_service.get_by_offer(data.card_wanted, data.card_offered)
-
-        if trade_offer:
-            profile_collection_original_poster =\
-                await self._profile_collection_service.get_all_profile_collections_by_profile_id_and_card_id(
-                    trade_offer.profile_posted,
-                    trade_offer.card_offered)
-            profile_collection_new_poster =\
-                await self._profile_collection_service.get_all_profile_collections_by_profile_id_and_card_id(
-                    data.profile_posted,
-                    data.card_offered)
-
-            await self._trade_offer_service.delete_trade_offer(trade_offer.id)
-
-            await self._profile_collection_service.delete_profile_collection(profile_collection_original_poster[0].id)
-            await self._profile_collection_service.delete_profile_collection(profile_collection_new_poster[0].id)
-
-            await self._profile_collection_service.add_profile_collection(ProfileCollectionIn(
-                profile_id=data.profile_posted,
-                card_id=trade_offer.card_offered))
-            await self._profile_collection_service.add_profile_collection(ProfileCollectionIn(
-                profile_id=trade_offer.profile_posted,
-                card_id=data.card_offered))
-            return trade_offer
-        else:
-            return await self._trade_offer_service.add_trade_offer(data)
+        transaction = await self._transactions.transaction()
+
+        try:
+            trade_offer = await self._trade_offer_service.claim_by_offer(data.card_wanted, data.card_offered)
+
+            if not trade_offer:
+                await transaction.rollback()
+                new_trade_offer = await self._trade_offer_service.add_trade_offer(data)
+
+                if new_trade_offer:
+                    await self._trade_cycle_service.clear_offer(new_trade_offer)
+
+                return new_trade_offer
+
+            received = await self._profile_collection_service.transfer_profile_collection(
+                trade_offer.profile_posted,
+                data.profile_posted,
+                trade_offer.card_offered)
+            given = await self._profile_collection_service.transfer_profile_collection(
+                data.profile_posted,
+                trade_offer.profile_posted,
+                data.card_offered)
+
+            if not received or not given:
+                await transaction.rollback()
+                return None
+        except BaseException:
+            await transaction.rollback()
+            raise
+
+        await transaction.commit()
+        return trade_offer
@@ -1,23 +1,27 @@
-from typing import List
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, List, Set
 
-from card_collector.core.domains.profile_collection import ProfileCollection, ProfileCollectionIn
-from card_collector.core.domains.quest import QuestIn
+from card_collector.core.domains.profile_collection import ProfileCardCount, ProfileCollection, ProfileCollectionIn
 from card_collector.core.repositories.i_profile_collection_repository import IProfileCollectionRepository
 from card_collector.core.services.i_profile_collection_service import IProfileCollectionService
 from card_collector.core.services.i_trade_offer_service import ITradeOfferService
 from card_collector.core.services.i_quest_service import IQuestService
+from card_collector.core.repositories.i_transaction_manager import ITransactionManager
+from card_collector.config import config
 
 class ProfileCollectionService(IProfileCollectionService):
 
     _repository: IProfileCollectionRepository
     _trade_offer_service: ITradeOfferService
     _quest_service: IQuestService
+    _transactions: ITransactionManager
 
     def __init__(
             self,
             repository: IProfileCollectionRepository,
             trade_offer_service: ITradeOfferService,
-            quest_service: IQuestService
+            quest_service: IQuestService,
+            transactions: ITransactionManager
     ) -> None:
         """
         The initializer of the profile_collection service.
@@ -26,10 +30,12 @@ class ProfileCollectionService(IProfileCollectionService):
             repository (IProfileCollectionRepository): The reference to the repository.
             trade_offer_service (ITradeOfferService): The reference to the trade offer service.
             quest_service (IQuestService): The reference to the quest service.
+            transactions (ITransactionManager): The reference to the transaction manager.
         """
         self._repository = repository
         self._trade_offer_service = trade_offer_service
         self._quest_service = quest_service
+        self._transactions = transactions
 
     async def get_all(self) -> List[ProfileCollection]:
         """
@@ -41,6 +47,30 @@ class ProfileCollectionService(IProfileCollectionService):
 
         return await self._repository.get_all_profile_collections()
 
+    async def get_page(self, limit: int, after: int | None = None) -> List[ProfileCollection]:
+        """
+        The method getting a page of profile collections ordered by id from the repository.
+
+        Args:
+            limit (int): The maximal number of profile collections.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[ProfileCollection]: Profile collections.
+        """
+
+        return await self._repository.get_page(limit, after)
+
+    def iterate(self) -> AsyncIterator[ProfileCollection]:
+        """
+        The method streaming all profile collections ordered by id from the repository.
+
+        Returns:
+            AsyncIterator[ProfileCollection]: Profile collections.
+        """
+
+        return self._repository.iterate()
+
     async def get_all_by_card_id(self, card_id: int) -> List[ProfileCollection]:
         """
         The method getting all profile collections with a given card id from the repository.
@@ -96,6 +126,61 @@ class ProfileCollectionService(IProfileCollectionService):
 
         return await self._repository.get_all_profile_collections_by_profile_id_and_card_id(card_id, profile_collection_id)
 
+    async def get_counts_by_profile_id(self, profile_id: int) -> List[ProfileCardCount]:
+        """
+        The method getting the number of copies of each card owned by a given profile from the repository.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[ProfileCardCount]: Card counts of the profile.
+        """
+
+        return await self._repository.get_counts_by_profile_id(profile_id)
+
+    async def owns(self, profile_id: int, card_id: int) -> bool:
+        """
+        The method checking whether a profile owns at least one copy of a card in the repository.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            bool: Whether the profile owns the card.
+        """
+
+        return await self._repository.owns(profile_id, card_id)
+
+    async def count_owned(self, profile_id: int, card_id: int) -> int:
+        """
+        The method getting the number of copies of a card owned by a profile from the repository.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+
+        Returns:
+            int: The number of copies.
+        """
+
+        return await self._repository.count_owned(profile_id, card_id)
+
+    async def owned_counts(self, profile_id: int, card_ids: List[int]) -> Dict[int, int]:
+        """
+        The method getting the number of copies of given cards owned by a profile from the repository.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            Dict[int, int]: The number of copies by card id, cards without a copy left out.
+        """
+
+        return await self._repository.owned_counts(profile_id, card_ids)
+
     async def get_by_id(self, profile_collection_id: int) -> ProfileCollection | None:
         """
         The method getting profile collection with a given id from the repository.
@@ -120,26 +205,104 @@ class ProfileCollectionService(IProfileCollectionService):
             ProfileCollection | None: Details of the newly added profile collection.
         """
 
-        associated_quests = await self._quest_service.get_all_by_profile(data.profile_id)
+        profile_collections = await self.add_profile_collections(data.profile_id, [data.card_id])
+
+        return profile_collections[0] if profile_collections else None
+
+    async def add_profile_collections(self, profile_id: int, card_ids: List[int]) -> List[ProfileCollection]:
+        """
+        The method adding many cards to a profile collection in a single transaction.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_ids (List[int]): The ids of the cards.
+
+        Returns:
+            List[ProfileCollection]: Full details of the newly added profile collections.
+        """
+
+        return await self.add_many([
+            ProfileCollectionIn(profile_id=profile_id, card_id=card_id) for card_id in card_ids
+        ])
+
+    async def add_many(self, data: List[ProfileCollectionIn]) -> List[ProfileCollection]:
+        """
+        The method adding many profile collections to the database in a single transaction.
+            All cards are inserted at once and the quests of each receiving profile are advanced with one update.
+
+        Args:
+            data (List[ProfileCollectionIn]): The details of the new profile collections.
+
+        Returns:
+            List[ProfileCollection]: Full details of the newly added profile collections.
+        """
+
+        if not data:
+            return []
+
+        async with self._transactions.transaction():
+            profile_collections = await self._repository.add_many(data)
+            for profile_id, amount in Counter(item.profile_id for item in data).items():
+                await self._progress_quests(profile_id, amount)
+
+        return profile_collections
+
+    async def transfer_profile_collection(
+            self,
+            profile_from: int,
+            profile_to: int,
+            card_id: int
+    ) -> ProfileCollection | None:
+        """
+        The method moving a single copy of a card from one profile to another.
+            The quests of the receiving profile are advanced, and in case of moving the last copy,
+            trade offers of the giving profile for the card are removed. Must be called inside a transaction.
+
+        Args:
+            profile_from (int): The id of the profile giving the card.
+            profile_to (int): The id of the profile receiving the card.
+            card_id (int): The id of the card.
+
+        Returns:
+            ProfileCollection | None: The moved profile collection, None if the giving profile has no copy.
+        """
+
+        profile_collection = await self._repository.transfer(profile_from, profile_to, card_id)
+
+        if profile_collection:
+            await self._progress_quests(profile_to, 1)
 
-        for quest in associated_quests:
-            await self._quest_service.update_quest(quest.id, QuestIn(
-                profile_id=quest.profile_id,
-                cards_collected=quest.cards_collected+1,
-                cards_needed=quest.cards_needed,
-                reward=quest.reward
-            ))
+            if not await self._repository.owns(profile_from, card_id):
+                await self._trade_offer_service.delete_trade_offer_by_profile_id_and_card_offered_id(
+                    profile_from,
+                    card_id)
 
-            if quest.cards_collected+1 == quest.cards_needed:
-                reward_id = quest.reward
-                await self._quest_service.delete_quest(quest.id)
-                await self.add_profile_collection(ProfileCollectionIn(
-                    profile_id=data.profile_id,
-                    card_id=reward_id
-                ))
+        return profile_collection
+
+    async def _progress_quests(self, profile_id: int, amount: int) -> None:
+        """
+        The method advancing all quests of a profile by a given amount of cards.
+            Completed quests are removed and their rewards granted level by level, each level costing
+            one update, one delete and one insert, up to a maximal depth of rewards granting rewards.
+            The update counts the completed quests, so when none is completed it is the only statement.
+
+        Args:
+            profile_id (int): The id of the profile.
+            amount (int): The number of collected cards.
+        """
 
+        for _ in range(config.QUEST_REWARD_MAX_DEPTH):
+            if not await self._quest_service.add_progress(profile_id, amount):
+                return
 
-        return await self._repository.add_profile_collection(data)
+            rewards = await self._quest_service.delete_completed_by_profile(profile_id)
+            if not rewards:
+                return
+
+            await self._repository.add_many([
+                ProfileCollectionIn(profile_id=profile_id, card_id=reward) for reward in rewards
+            ])
+            amount = len(rewards)
 
     async def update_profile_collection(
             self,
@@ -155,6 +318,9 @@ class ProfileCollectionService(IProfileCollectionService):
 
         Returns:
             ProfileCollection | None: The updated profile collection details.
+
+        Raises:
+            NotLastCopyError: If the copy is not the last copy of its card.
         """
 
         return await self._repository.update_profile_collection(
@@ -172,18 +338,68 @@ class ProfileCollectionService(IProfileCollectionService):
 
         Returns:
             bool: Success of the operation.
+
+        Raises:
+            NotLastCopyError: If the copy is not the last copy of its card.
+        """
+
+        return bool(await self.delete_many([profile_collection_id]))
+
+    async def delete_many(self, profile_collection_ids: List[int]) -> List[ProfileCollection]:
+        """
+        The method removing profile collections with given ids from the database.
+            Trade offers of cards whose last copy was removed are removed as well.
+
+        Args:
+            profile_collection_ids (List[int]): The ids of the profile collections.
+
+        Returns:
+            List[ProfileCollection]: The removed profile collections.
+
+        Raises:
+            NotLastCopyError: If a removed copy is not among the last copies of its card.
         """
-        profile_collection = await self.get_by_id(profile_collection_id)
-        removed_profile_collection_card_id = profile_collection.card_id
-        removed_profile_collection_profile_id = profile_collection.profile_id
 
-        removed_profile_collection = await self._repository.delete_profile_collection(profile_collection_id)
+        async with self._transactions.transaction():
+            profile_collections = await self._repository.delete_many(profile_collection_ids)
+            await self._delete_unbacked_trade_offers(profile_collections)
+
+        return profile_collections
+
+    async def delete_where(self, **filters: Any) -> List[ProfileCollection]:
+        """
+        The method removing profile collections with given column values from the database.
+            Trade offers of cards whose last copy was removed are removed as well.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[ProfileCollection]: The removed profile collections.
+        """
+
+        async with self._transactions.transaction():
+            profile_collections = await self._repository.delete_where(**filters)
+            await self._delete_unbacked_trade_offers(profile_collections)
+
+        return profile_collections
+
+    async def _delete_unbacked_trade_offers(self, profile_collections: List[ProfileCollection]) -> None:
+        """
+        The method removing trade offers of cards their posters no longer own after removing given copies.
+            Remaining copies of the removed cards are read from the per-profile card counts, once per profile.
+
+        Args:
+            profile_collections (List[ProfileCollection]): The removed profile collections.
+        """
 
-        if not await self.get_all_profile_collections_by_profile_id_and_card_id(
-                removed_profile_collection_profile_id,
-                removed_profile_collection_card_id):
-            await self._trade_offer_service.delete_trade_offer_by_profile_id_and_card_offered_id(
-                removed_profile_collection_profile_id,
-                removed_profile_collection_card_id)
+        removed: Dict[int, Set[int]] = {}
+        for profile_collection in profile_collections:
+            removed.setdefault(profile_collection.profile_id, set()).add(profile_collection.card_id)
 
-        return removed_profile_collection
+        for profile_id, card_ids in removed.items():
+            owned = await self._repository.owned_counts(profile_id, sorted(card_ids))
+            for card_id in sorted(card_ids - owned.keys()):
+                await self._trade_offer_service.delete_trade_offer_by_profile_id_and_card_offered_id(
+                    profile_id,
+                    card_id)
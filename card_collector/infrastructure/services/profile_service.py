@@ -1,13 +1,14 @@
-from typing import List
+from typing import AsyncIterator, List
 
-from card_collector.core.domains.profile_collection import ProfileCollectionIn
-from card_collector.core.domains.profile import Profile, ProfileIn
+from card_collector.core.domains.profile import Profile, ProfileDeletion, ProfileIn
 from card_collector.core.domains.card import Card
 from card_collector.core.repositories.i_profile_repository import IProfileRepository
 from card_collector.core.services.i_profile_service import IProfileService
 from card_collector.core.services.i_card_service import ICardService
 from card_collector.core.services.i_profile_collection_service import IProfileCollectionService
 from card_collector.core.services.i_quest_service import IQuestService
+from card_collector.core.services.i_trade_offer_service import ITradeOfferService
+from card_collector.core.repositories.i_transaction_manager import ITransactionManager
 
 class ProfileService(IProfileService):
 
@@ -15,13 +16,17 @@ class ProfileService(IProfileService):
     _card_service: ICardService
     _profile_collection_service: IProfileCollectionService
     _quest_service: IQuestService
+    _trade_offer_service: ITradeOfferService
+    _transactions: ITransactionManager
 
     def __init__(
             self,
             repository: IProfileRepository,
             card_service: ICardService,
             profile_collection_service: IProfileCollectionService,
-            quest_service: IQuestService
+            quest_service: IQuestService,
+            trade_offer_service: ITradeOfferService,
+            transactions: ITransactionManager
     ) -> None:
         """
         The initializer of the profile service.
@@ -31,11 +36,15 @@ class ProfileService(IProfileService):
             card_service (ICardService): The reference to the card service.
             profile_collection_service (IProfileCollectionService): The reference to the profile collection service.
             quest_service (IQuestService): The reference to the profile collection service.
+            trade_offer_service (ITradeOfferService): The reference to the trade offer service.
+            transactions (ITransactionManager): The reference to the transaction manager.
         """
         self._repository = repository
         self._card_service = card_service
         self._profile_collection_service = profile_collection_service
         self._quest_service = quest_service
+        self._trade_offer_service = trade_offer_service
+        self._transactions = transactions
 
     async def get_all(self) -> List[Profile]:
         """
@@ -47,6 +56,30 @@ class ProfileService(IProfileService):
 
         return await self._repository.get_all_profiles()
 
+    async def get_page(self, limit: int, after: int | None = None) -> List[Profile]:
+        """
+        The method getting a page of profiles ordered by id from the repository.
+
+        Args:
+            limit (int): The maximal number of profiles.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Profile]: Profiles.
+        """
+
+        return await self._repository.get_page(limit, after)
+
+    def iterate(self) -> AsyncIterator[Profile]:
+        """
+        The method streaming all profiles ordered by id from the repository.
+
+        Returns:
+            AsyncIterator[Profile]: Profiles.
+        """
+
+        return self._repository.iterate()
+
     async def get_by_id(self, profile_id: int) -> Profile | None:
         """
         The method getting profile with a given id from the repository.
@@ -74,11 +107,10 @@ class ProfileService(IProfileService):
 
         cards = await self._card_service.get_random_cards(amount_of_cards)
 
-        for i in range(amount_of_cards):
-            await self._profile_collection_service.add_profile_collection(ProfileCollectionIn(
-                profile_id = profile_id,
-                card_id = cards[i].id
-            ))
+        await self._profile_collection_service.add_profile_collections(
+            profile_id,
+            [card.id for card in cards]
+        )
         return cards
 
     async def add_profile(self, data: ProfileIn) -> Profile | None:
@@ -115,18 +147,27 @@ class ProfileService(IProfileService):
             data=data,
         )
 
-    async def delete_profile(self, profile_id: int) -> bool:
+    async def delete_profile(self, profile_id: int) -> ProfileDeletion | None:
         """
-        The method removing profile from the database.
+        The method removing profile together with its profile collections, trade offers and quests.
+            Everything is removed in one transaction with set-based deletes instead of row by row,
+            after checking the profile exists so a missing profile writes nothing.
 
         Args:
             profile_id (int): The id of the profile.
 
         Returns:
-            bool: Success of the operation.
+            ProfileDeletion | None: The number of removed rows per table, None if the profile does not exist.
         """
-        [await self._profile_collection_service.delete_profile_collection(profile_collection.id)
-         for profile_collection in await self._profile_collection_service.get_all_by_profile_id(profile_id)]
-        [await self._quest_service.delete_quest(quest.id)
-         for quest in await self._quest_service.get_all_by_profile(profile_id)]
-        return await self._repository.delete_profile(profile_id)
+
+        if not await self._repository.get_by_id(profile_id):
+            return None
+
+        async with self._transactions.transaction():
+            trade_offers = await self._trade_offer_service.delete_where(profile_posted=profile_id)
+            counts = await self._repository.delete_cascade(profile_id)
+
+        if not counts["profile"]:
+            return None
+
+        return ProfileDeletion(trade_offer=len(trade_offers), **counts)
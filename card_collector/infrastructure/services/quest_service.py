@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, AsyncIterator, List
 
 from card_collector.core.domains.quest import Quest, QuestIn
 from card_collector.core.repositories.i_quest_repository import IQuestRepository
@@ -27,6 +27,30 @@ class QuestService(IQuestService):
 
         return await self._repository.get_all_quests()
 
+    async def get_page(self, limit: int, after: int | None = None) -> List[Quest]:
+        """
+        The method getting a page of quests ordered by id from the repository.
+
+        Args:
+            limit (int): The maximal number of quests.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[Quest]: Quests.
+        """
+
+        return await self._repository.get_page(limit, after)
+
+    def iterate(self) -> AsyncIterator[Quest]:
+        """
+        The method streaming all quests ordered by id from the repository.
+
+        Returns:
+            AsyncIterator[Quest]: Quests.
+        """
+
+        return self._repository.iterate()
+
     async def get_all_by_profile(self, profile_id: int) -> List[Quest]:
         """
         The method getting all quests with a given profile id from the repository.
@@ -73,6 +97,19 @@ class QuestService(IQuestService):
 
         return await self._repository.add_quest(data)
 
+    async def add_many(self, data: List[QuestIn]) -> List[Quest]:
+        """
+        The method adding many quests to the database in a single transaction.
+
+        Args:
+            data (List[QuestIn]): The details of the new quests.
+
+        Returns:
+            List[Quest]: Full details of the newly added quests.
+        """
+
+        return await self._repository.add_many(data)
+
     async def update_quest(
             self,
             quest_id: int,
@@ -94,6 +131,33 @@ class QuestService(IQuestService):
             data=data,
         )
 
+    async def add_progress(self, profile_id: int, amount: int) -> int:
+        """
+        The method increasing cards collected of all quests of a given profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+            amount (int): The number of collected cards.
+
+        Returns:
+            int: The number of quests of the profile completed after the update.
+        """
+
+        return await self._repository.add_progress(profile_id, amount)
+
+    async def delete_completed_by_profile(self, profile_id: int) -> List[int]:
+        """
+        The method removing completed quests of a given profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            List[int]: The rewards of the removed quests.
+        """
+
+        return await self._repository.delete_completed_by_profile(profile_id)
+
     async def delete_quest(self, quest_id: int) -> bool:
         """
         The method removing quest from the database.
@@ -105,3 +169,29 @@ class QuestService(IQuestService):
             bool: Success of the operation.
         """
         return await self._repository.delete_quest(quest_id)
+
+    async def delete_many(self, quest_ids: List[int]) -> List[Quest]:
+        """
+        The method removing quests with given ids from the database.
+
+        Args:
+            quest_ids (List[int]): The ids of the quests.
+
+        Returns:
+            List[Quest]: The removed quests.
+        """
+
+        return await self._repository.delete_many(quest_ids)
+
+    async def delete_where(self, **filters: Any) -> List[Quest]:
+        """
+        The method removing quests with given column values from the database.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[Quest]: The removed quests.
+        """
+
+        return await self._repository.delete_where(**filters)
@@ -0,0 +1,152 @@
+from collections import deque
+from typing import Dict, List, Set, Tuple
+
+from card_collector.infrastructure.services.trade_order_book import TradeOrderBook
+
+Pair = Tuple[int, int]
+
+class TradeCycleFinder:
+    """
+    A finder of executable trade cycles in the graph card offered -> card wanted of open offers.
+        A cycle X1 -> X2 -> ... -> Xn -> X1 clears n offers at once: the poster of each offer
+        receives the card offered by the poster of the next one.
+    """
+
+    _max_length: int
+
+    def __init__(self, max_length: int = 4) -> None:
+        """
+        The initializer of the trade cycle finder.
+
+        Args:
+            max_length (int): The maximal number of offers in a cycle. Defaults to 4.
+        """
+        self._max_length = max_length
+
+    def find_cycle(self, book: TradeOrderBook, card_offered: int, card_wanted: int) -> List[Pair]:
+        """
+        The method finding the shortest cycle going through a given offer, used on every new offer.
+
+        Args:
+            book (TradeOrderBook): The order book of open offers.
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            List[Pair]: The (card offered, card wanted) pairs of the cycle, starting with the given offer,
+                empty if there is none.
+        """
+        if card_offered == card_wanted:
+            return []
+
+        parents: Dict[int, int] = {card_wanted: card_wanted}
+        queue = deque([(card_wanted, 1)])
+
+        while queue:
+            card, length = queue.popleft()
+            if length >= self._max_length:
+                continue
+
+            for wanted in book.wanted_for(card):
+                if wanted == card_offered:
+                    cards = [card]
+                    while card != card_wanted:
+                        card = parents[card]
+                        cards.append(card)
+
+                    return self._pairs([card_offered] + cards[::-1])
+                if wanted not in parents:
+                    parents[wanted] = card
+                    queue.append((wanted, length + 1))
+
+        return []
+
+    def plan_clearing(self, book: TradeOrderBook) -> List[Tuple[List[Pair], int]]:
+        """
+        The method planning the clearing of the whole book with bounded depth-first searches.
+            Cycles through the smallest card are exhausted before the card is dropped from the graph,
+            so every cycle is found once and the plan never uses more offers than the book holds.
+
+        Args:
+            book (TradeOrderBook): The order book of open offers.
+
+        Returns:
+            List[Tuple[List[Pair], int]]: The cycles with the number of times each can be executed.
+        """
+        depths: Dict[Pair, int] = {pair: book.depth(*pair) for pair in book.pairs()}
+        graph: Dict[int, Set[int]] = {}
+        offering: Dict[int, Set[int]] = {}
+        for card_offered, card_wanted in depths:
+            if card_offered != card_wanted:
+                graph.setdefault(card_offered, set()).add(card_wanted)
+                graph.setdefault(card_wanted, set())
+                offering.setdefault(card_wanted, set()).add(card_offered)
+
+        plan = []
+        for start in sorted(graph):
+            while cycle := self._search(graph, offering.get(start, set()), start):
+                pairs = self._pairs(cycle)
+                times = min(depths[pair] for pair in pairs)
+                plan.append((pairs, times))
+
+                for pair in pairs:
+                    depths[pair] -= times
+                    if not depths[pair]:
+                        graph[pair[0]].discard(pair[1])
+                        offering[pair[1]].discard(pair[0])
+
+            graph.pop(start)
+
+        return plan
+
+    def _search(self, graph: Dict[int, Set[int]], closing: Set[int], start: int) -> List[int]:
+        """
+        The method searching a cycle through a given card, visiting only cards still in the graph.
+            The search stops at the first card offered for the start card, so the last two levels of
+            the bounded search are set operations instead of scans.
+
+        Args:
+            graph (Dict[int, Set[int]]): The adjacency of cards offered to cards wanted.
+            closing (Set[int]): The cards offered in exchange for the start card.
+            start (int): The id of the card.
+
+        Returns:
+            List[int]: The cards of the cycle, starting with the given card, empty if there is none.
+        """
+        path = [start]
+        on_path = {start}
+        stack = [iter(graph.get(start, ()))]
+
+        while stack:
+            card = next(stack[-1], None)
+
+            if card is None:
+                stack.pop()
+                on_path.discard(path.pop())
+            elif card in on_path or card not in graph:
+                continue
+            elif card in closing:
+                return path + [card]
+            elif len(path) == self._max_length - 2:
+                for last in graph[card] & closing:
+                    if last not in on_path and last in graph:
+                        return path + [card, last]
+            elif len(path) < self._max_length - 2:
+                path.append(card)
+                on_path.add(card)
+                stack.append(iter(graph[card]))
+
+        return []
+
+    @staticmethod
+    def _pairs(cards: List[int]) -> List[Pair]:
+        """
+        The method turning the cards of a cycle into its (card offered, card wanted) pairs.
+
+        Args:
+            cards (List[int]): The cards of the cycle.
+
+        Returns:
+            List[Pair]: The pairs.
+        """
+        return list(zip(cards, cards[1:] + cards[:1]))
@@ -0,0 +1,125 @@
+from typing import List, Tuple
+
+from card_collector.core.domains.trade_offer import TradeClearing, TradeOffer
+from card_collector.core.services.i_profile_collection_service import IProfileCollectionService
+from card_collector.core.services.i_trade_cycle_service import ITradeCycleService
+from card_collector.core.services.i_trade_offer_service import ITradeOfferService
+from card_collector.core.repositories.i_transaction_manager import ITransactionManager
+from card_collector.infrastructure.services.trade_cycle_finder import TradeCycleFinder
+from card_collector.infrastructure.services.trade_order_book import TradeOrderBook
+
+class TradeCycleService(ITradeCycleService):
+
+    _order_book: TradeOrderBook
+    _finder: TradeCycleFinder
+    _trade_offer_service: ITradeOfferService
+    _profile_collection_service: IProfileCollectionService
+    _transactions: ITransactionManager
+
+    def __init__(
+            self,
+            order_book: TradeOrderBook,
+            finder: TradeCycleFinder,
+            trade_offer_service: ITradeOfferService,
+            profile_collection_service: IProfileCollectionService,
+            transactions: ITransactionManager
+    ) -> None:
+        """
+        The initializer of the trade cycle service.
+
+        Args:
+            order_book (TradeOrderBook): The reference to the in-memory order book.
+            finder (TradeCycleFinder): The reference to the trade cycle finder.
+            trade_offer_service (ITradeOfferService): The reference to the trade offer service.
+            profile_collection_service (IProfileCollectionService): The reference to the profile collection service.
+            transactions (ITransactionManager): The reference to the transaction manager.
+        """
+        self._order_book = order_book
+        self._finder = finder
+        self._trade_offer_service = trade_offer_service
+        self._profile_collection_service = profile_collection_service
+        self._transactions = transactions
+
+    async def clear_offer(self, trade_offer: TradeOffer) -> List[TradeOffer]:
+        """
+        The method executing the shortest trade cycle going through a given trade offer, if there is one.
+
+        Args:
+            trade_offer (TradeOffer): The trade offer.
+
+        Returns:
+            List[TradeOffer]: The completed trade offers, empty if no cycle was executed.
+        """
+
+        if not self._order_book.hydrated:
+            return []
+
+        pairs = self._finder.find_cycle(self._order_book, trade_offer.card_offered, trade_offer.card_wanted)
+
+        return await self._execute(pairs, trade_offer) if pairs else []
+
+    async def clear_all(self) -> TradeClearing:
+        """
+        The method executing all trade cycles found among open trade offers.
+            Cycles are planned in memory first, then each one is executed in its own transaction.
+
+        Returns:
+            TradeClearing: The number of executed cycles and completed trade offers.
+        """
+
+        cycles = 0
+        trade_offers = 0
+
+        if not self._order_book.hydrated:
+            await self._trade_offer_service.load_order_book()
+
+        for pairs, times in self._finder.plan_clearing(self._order_book):
+            for _ in range(times):
+                if completed := await self._execute(pairs):
+                    cycles += 1
+                    trade_offers += len(completed)
+
+        return TradeClearing(cycles=cycles, trade_offers=trade_offers)
+
+    async def _execute(self, pairs: List[Tuple[int, int]], first: TradeOffer | None = None) -> List[TradeOffer]:
+        """
+        The method executing a single trade cycle atomically, using the oldest offer of each pair.
+            The poster of each offer receives the card offered by the poster of the next offer.
+            A failed cycle rolls back, which puts the claimed offers back in the order book.
+
+        Args:
+            pairs (List[Tuple[int, int]]): The (card offered, card wanted) pairs of the cycle.
+            first (TradeOffer | None): The offer of the first pair, e.g. a new offer not yet published
+                to the order book. Defaults to None (the oldest offer of the pair).
+
+        Returns:
+            List[TradeOffer]: The completed trade offers, empty if the cycle could not be executed.
+        """
+
+        trade_offers = [self._order_book.peek(*pair) for pair in pairs]
+        if first:
+            trade_offers[0] = first
+        if not all(trade_offers):
+            return []
+
+        transaction = await self._transactions.transaction()
+
+        try:
+            claimed = [await self._trade_offer_service.claim_by_id(trade_offer.id) for trade_offer in trade_offers]
+
+            if all(claimed):
+                for i, trade_offer in enumerate(claimed):
+                    if not await self._profile_collection_service.transfer_profile_collection(
+                            trade_offer.profile_posted,
+                            claimed[i - 1].profile_posted,
+                            trade_offer.card_offered):
+                        break
+                else:
+                    await transaction.commit()
+                    return claimed
+        except BaseException:
+            await transaction.rollback()
+            raise
+
+        await transaction.rollback()
+        return []
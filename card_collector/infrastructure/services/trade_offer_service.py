@@ -1,21 +1,94 @@
-from typing import List
+from typing import Any, AsyncIterator, Iterable, List
 
 from card_collector.core.domains.trade_offer import TradeOffer, TradeOfferIn
 from card_collector.core.repositories.i_trade_offer_repository import ITradeOfferRepository
+from card_collector.core.repositories.i_transaction_manager import ITransactionManager
 from card_collector.core.services.i_trade_offer_service import ITradeOfferService
+from card_collector.infrastructure.services.trade_order_book import TradeOrderBook
 
 class TradeOfferService(ITradeOfferService):
+    """
+    The trade offer service keeping the in-memory order book in step with the committed offers.
+        New and updated offers are published to the book once their transaction commits, so other
+        requests never match an uncommitted offer. Offers this transaction deleted or claimed, whose rows
+        it holds locked, leave the book at once and are put back exactly if it rolls back.
+    """
 
     _repository: ITradeOfferRepository
+    _order_book: TradeOrderBook
+    _transactions: ITransactionManager
 
-    def __init__(self, repository: ITradeOfferRepository) -> None:
+    def __init__(
+            self,
+            repository: ITradeOfferRepository,
+            order_book: TradeOrderBook,
+            transactions: ITransactionManager
+    ) -> None:
         """
         The initializer of the trade offer service.
 
         Args:
             repository (ITradeOfferRepository): The reference to the repository.
+            order_book (TradeOrderBook): The reference to the in-memory order book.
+            transactions (ITransactionManager): The reference to the transaction manager.
         """
         self._repository = repository
+        self._order_book = order_book
+        self._transactions = transactions
+
+    def _publish(self, trade_offers: List[TradeOffer]) -> None:
+        """
+        The method adding written offers to the order book once their transaction commits.
+
+        Args:
+            trade_offers (List[TradeOffer]): The added or updated trade offers.
+        """
+        def publish() -> None:
+            for trade_offer in trade_offers:
+                self._order_book.add(trade_offer)
+
+        if trade_offers:
+            self._transactions.after_commit(publish)
+
+    def _withdraw(self, trade_offer_ids: Iterable[int]) -> None:
+        """
+        The method removing deleted or claimed offers from the order book, putting them back on rollback.
+            They are removed again after commit, in case the same transaction published them.
+
+        Args:
+            trade_offer_ids (Iterable[int]): The ids of the trade offers.
+        """
+        for trade_offer_id in trade_offer_ids:
+            if removed := self._order_book.remove(trade_offer_id):
+                self._transactions.on_rollback(lambda removed=removed: self._order_book.restore(removed))
+            self._transactions.after_commit(lambda trade_offer_id=trade_offer_id: self._order_book.remove(trade_offer_id))
+
+    async def load_order_book(self) -> None:
+        """
+        The method hydrating the order book with all open trade offers from the repository.
+        """
+
+        self._order_book.hydrate(await self._repository.get_all_trade_offers())
+
+    async def get_depth(self, card_offered: int, card_wanted: int) -> int:
+        """
+        The method counting open trade offers with a given offer.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            int: The number of open trade offers.
+        """
+
+        if self._order_book.hydrated:
+            return self._order_book.depth(card_offered, card_wanted)
+
+        return len([
+            trade_offer for trade_offer in await self._repository.get_all_by_card_offered(card_offered)
+            if trade_offer.card_wanted == card_wanted
+        ])
 
     async def get_all(self) -> List[TradeOffer]:
         """
@@ -27,6 +100,30 @@ class TradeOfferService(ITradeOfferService):
 
         return await self._repository.get_all_trade_offers()
 
+    async def get_page(self, limit: int, after: int | None = None) -> List[TradeOffer]:
+        """
+        The method getting a page of trade offers ordered by id from the repository.
+
+        Args:
+            limit (int): The maximal number of trade offers.
+            after (int | None): The id after which the page starts. Defaults to None.
+
+        Returns:
+            List[TradeOffer]: Trade offers.
+        """
+
+        return await self._repository.get_page(limit, after)
+
+    def iterate(self) -> AsyncIterator[TradeOffer]:
+        """
+        The method streaming all trade offers ordered by id from the repository.
+
+        Returns:
+            AsyncIterator[TradeOffer]: Trade offers.
+        """
+
+        return self._repository.iterate()
+
     async def get_all_by_card_offered(self, card_offered: int) -> List[TradeOffer]:
         """
         The method getting all trade offers with a given card offered id from the repository.
@@ -98,6 +195,52 @@ class TradeOfferService(ITradeOfferService):
 
         return await self._repository.get_by_offer(card_offered, card_wanted)
 
+    async def claim_by_offer(self, card_offered: int, card_wanted: int) -> TradeOffer | None:
+        """
+        The method removing and returning the oldest trade offer with a given offer that is not locked.
+            Once the book is hydrated it is trusted: its offers are tried oldest first, each claim one
+            round trip, and a pair without offers in the book costs none. Until then the repository is asked.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            TradeOffer | None: The claimed trade offer details.
+        """
+
+        if self._order_book.hydrated:
+            for trade_offer in self._order_book.offers(card_offered, card_wanted):
+                if claimed := await self.claim_by_id(trade_offer.id):
+                    return claimed
+
+            return None
+
+        if claimed := await self._repository.claim_by_offer(card_offered, card_wanted):
+            self._withdraw([claimed.id])
+
+        return claimed
+
+    async def claim_by_id(self, trade_offer_id: int) -> TradeOffer | None:
+        """
+        The method removing and returning trade offer with a given id, unless it is locked.
+            An offer of the book that cannot be claimed stays in it while its row exists, as another
+            transaction may still roll back, and is dropped once the row is gone.
+
+        Args:
+            trade_offer_id (int): The id of the trade offer.
+
+        Returns:
+            TradeOffer | None: The claimed trade offer details.
+        """
+
+        if claimed := await self._repository.claim_by_id(trade_offer_id):
+            self._withdraw([claimed.id])
+        elif trade_offer_id in self._order_book and not await self._repository.get_by_id(trade_offer_id):
+            self._withdraw([trade_offer_id])
+
+        return claimed
+
     async def add_trade_offer(self, data: TradeOfferIn) -> TradeOffer | None:
         """
         The method adding new trade offer to the database.
@@ -109,7 +252,28 @@ class TradeOfferService(ITradeOfferService):
             Profile | None: Full details of the newly added trade offer.
         """
 
-        return await self._repository.add_trade_offer(data)
+        trade_offer = await self._repository.add_trade_offer(data)
+
+        if trade_offer:
+            self._publish([trade_offer])
+
+        return trade_offer
+
+    async def add_many(self, data: List[TradeOfferIn]) -> List[TradeOffer]:
+        """
+        The method adding many trade offers to the database in a single transaction.
+
+        Args:
+            data (List[TradeOfferIn]): The details of the new trade offers.
+
+        Returns:
+            List[TradeOffer]: Full details of the newly added trade offers.
+        """
+
+        trade_offers = await self._repository.add_many(data)
+        self._publish(trade_offers)
+
+        return trade_offers
 
     async def update_trade_offer(
             self,
@@ -127,11 +291,16 @@ class TradeOfferService(ITradeOfferService):
             TradeOffer | None: The updated trade offer details.
         """
 
-        return await self._repository.update_trade_offer(
+        trade_offer = await self._repository.update_trade_offer(
             trade_offer_id=trade_offer_id,
             data=data,
         )
 
+        if trade_offer:
+            self._publish([trade_offer])
+
+        return trade_offer
+
     async def delete_trade_offer(self, trade_offer_id: int) -> bool:
         """
         The method removing trade offer from the database.
@@ -143,7 +312,43 @@ class TradeOfferService(ITradeOfferService):
             bool: Success of the operation.
         """
 
-        return await self._repository.delete_trade_offer(trade_offer_id)
+        deleted = await self._repository.delete_trade_offer(trade_offer_id)
+        if deleted:
+            self._withdraw([trade_offer_id])
+
+        return deleted
+
+    async def delete_many(self, trade_offer_ids: List[int]) -> List[TradeOffer]:
+        """
+        The method removing trade offers with given ids from the database.
+
+        Args:
+            trade_offer_ids (List[int]): The ids of the trade offers.
+
+        Returns:
+            List[TradeOffer]: The removed trade offers.
+        """
+
+        trade_offers = await self._repository.delete_many(trade_offer_ids)
+        self._withdraw(trade_offer.id for trade_offer in trade_offers)
+
+        return trade_offers
+
+    async def delete_where(self, **filters: Any) -> List[TradeOffer]:
+        """
+        The method removing trade offers with given column values from the database.
+
+        Args:
+            **filters (Any): The values of the filtered columns.
+
+        Returns:
+            List[TradeOffer]: The removed trade offers.
+        """
+
+        trade_offers = await self._repository.delete_where(**filters)
+        self._withdraw(trade_offer.id for trade_offer in trade_offers)
+
+        return trade_offers
 
     async def delete_trade_offer_by_profile_id_and_card_offered_id(
             self,
@@ -151,7 +356,7 @@ class TradeOfferService(ITradeOfferService):
             card_offered_id: int
     ) -> List[bool]:
         """
-        The method removing trade offer with a given profile id and card id from the database.
+        The method removing trade offers with a given profile id and card id from the database with one delete.
 
         Args:
             profile_id (int): the id of profile.
@@ -160,5 +365,6 @@ class TradeOfferService(ITradeOfferService):
         Returns:
             bool: Success of the operation.
         """
-        trade_offers = await self.get_all_by_profile_id_and_card_offered_id(profile_id, card_offered_id)
-        return [await self._repository.delete_trade_offer(trade_offer.id) for trade_offer in trade_offers]
+        trade_offers = await self.delete_where(profile_posted=profile_id, card_offered=card_offered_id)
+
+        return [True for _ in trade_offers]
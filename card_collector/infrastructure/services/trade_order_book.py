@@ -0,0 +1,190 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Set, Tuple
+
+from card_collector.core.domains.trade_offer import TradeOffer
+
+class TradeOrderBook:
+    """
+    An in-memory order book of open trade offers.
+        Offers are kept in FIFO queues keyed by (card offered, card wanted),
+        so finding the oldest matching offer and the depth of a pair is O(1).
+        The database stays the durable store, the book only mirrors the writes made by this process,
+        so a miss in the book is not proof that no matching offer exists.
+    """
+
+    _queues: Dict[Tuple[int, int], "OrderedDict[int, TradeOffer]"]
+    _pairs: Dict[int, Tuple[int, int]]
+    _wanted: Dict[int, Set[int]]
+
+    hydrated: bool
+
+    def __init__(self) -> None:
+        """
+        The initializer of the trade order book.
+        """
+        self._queues = {}
+        self._pairs = {}
+        self._wanted = {}
+        self.hydrated = False
+
+    def __len__(self) -> int:
+        """
+        The number of open offers in the book.
+
+        Returns:
+            int: The number of offers.
+        """
+        return len(self._pairs)
+
+    def __contains__(self, trade_offer_id: int) -> bool:
+        """
+        Whether an offer is in the book.
+
+        Args:
+            trade_offer_id (int): The id of the trade offer.
+
+        Returns:
+            bool: True if the offer is in the book.
+        """
+        return trade_offer_id in self._pairs
+
+    def hydrate(self, trade_offers: Iterable[TradeOffer]) -> None:
+        """
+        The method replacing the content of the book with given offers, oldest first.
+
+        Args:
+            trade_offers (Iterable[TradeOffer]): The open trade offers.
+        """
+        self._queues = {}
+        self._pairs = {}
+        self._wanted = {}
+        for trade_offer in sorted(trade_offers, key=lambda offer: offer.id):
+            self.add(trade_offer)
+        self.hydrated = True
+
+    def add(self, trade_offer: TradeOffer) -> None:
+        """
+        The method appending an offer to the end of its queue.
+
+        Args:
+            trade_offer (TradeOffer): The trade offer.
+        """
+        self.remove(trade_offer.id)
+
+        pair = (trade_offer.card_offered, trade_offer.card_wanted)
+        self._queues.setdefault(pair, OrderedDict())[trade_offer.id] = trade_offer
+        self._pairs[trade_offer.id] = pair
+        self._wanted.setdefault(trade_offer.card_offered, set()).add(trade_offer.card_wanted)
+
+    def restore(self, trade_offer: TradeOffer) -> None:
+        """
+        The method putting back a removed offer at its place in its queue, ordered by id like the offers were posted.
+
+        Args:
+            trade_offer (TradeOffer): The trade offer.
+        """
+        self.add(trade_offer)
+
+        pair = (trade_offer.card_offered, trade_offer.card_wanted)
+        ids = list(self._queues[pair])
+        if len(ids) > 1 and ids[-2] > trade_offer.id:
+            self._queues[pair] = OrderedDict(sorted(self._queues[pair].items()))
+
+    def remove(self, trade_offer_id: int) -> TradeOffer | None:
+        """
+        The method removing an offer from the book.
+
+        Args:
+            trade_offer_id (int): The id of the trade offer.
+
+        Returns:
+            TradeOffer | None: The removed trade offer.
+        """
+        pair = self._pairs.pop(trade_offer_id, None)
+        if pair is None:
+            return None
+
+        queue = self._queues[pair]
+        trade_offer = queue.pop(trade_offer_id)
+        if not queue:
+            del self._queues[pair]
+            self._wanted[pair[0]].discard(pair[1])
+
+        return trade_offer
+
+    def pop(self, card_offered: int, card_wanted: int) -> TradeOffer | None:
+        """
+        The method removing and returning the oldest offer with a given offer.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            TradeOffer | None: The oldest trade offer.
+        """
+        queue = self._queues.get((card_offered, card_wanted))
+
+        return self.remove(next(iter(queue))) if queue else None
+
+    def peek(self, card_offered: int, card_wanted: int) -> TradeOffer | None:
+        """
+        The method returning the oldest offer with a given offer.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            TradeOffer | None: The oldest trade offer.
+        """
+        queue = self._queues.get((card_offered, card_wanted))
+
+        return next(iter(queue.values())) if queue else None
+
+    def depth(self, card_offered: int, card_wanted: int) -> int:
+        """
+        The method counting open offers with a given offer.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            int: The number of offers.
+        """
+        return len(self._queues.get((card_offered, card_wanted), ()))
+
+    def offers(self, card_offered: int, card_wanted: int) -> List[TradeOffer]:
+        """
+        The method listing open offers with a given offer, oldest first.
+
+        Args:
+            card_offered (int): the id of card offered.
+            card_wanted (int): the id of card wanted.
+
+        Returns:
+            List[TradeOffer]: The trade offers.
+        """
+        return list(self._queues.get((card_offered, card_wanted), {}).values())
+
+    def pairs(self) -> List[Tuple[int, int]]:
+        """
+        The method listing all (card offered, card wanted) pairs with open offers.
+
+        Returns:
+            List[Tuple[int, int]]: The pairs.
+        """
+        return list(self._queues)
+
+    def wanted_for(self, card_offered: int) -> Set[int]:
+        """
+        The method listing cards wanted in exchange for a given card in open offers.
+
+        Args:
+            card_offered (int): the id of card offered.
+
+        Returns:
+            Set[int]: The ids of cards wanted.
+        """
+        return set(self._wanted.get(card_offered, ()))
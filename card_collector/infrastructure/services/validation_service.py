@@ -0,0 +1,54 @@
+from typing import Dict, List
+
+from card_collector.core.domains.reference import Reference, ReferenceKind
+from card_collector.core.repositories.i_reference_repository import IReferenceRepository
+from card_collector.core.services.i_validation_service import IValidationService
+
+class ValidationService(IValidationService):
+
+    _repository: IReferenceRepository
+
+    def __init__(self, repository: IReferenceRepository) -> None:
+        """
+        The initializer of the validation service.
+
+        Args:
+            repository (IReferenceRepository): The reference to the repository.
+        """
+        self._repository = repository
+
+    async def first_missing(self, references: List[Reference]) -> Reference | None:
+        """
+        The method checking all references of a write with one statement of the repository.
+
+        Args:
+            references (List[Reference]): The references, in the order their errors take precedence.
+
+        Returns:
+            Reference | None: The first missing reference, whose kind is the error code, None if all exist.
+        """
+
+        if not references:
+            return None
+
+        exist = await self._repository.exist(references)
+
+        return next((reference for reference, found in zip(references, exist) if not found), None)
+
+    async def first_missing_of(self, ids_by_kind: Dict[ReferenceKind, List[int]]) -> Reference | None:
+        """
+        The method checking the many references of a bulk write with one statement of the repository per kind,
+            stopping at the first kind with a missing row.
+
+        Args:
+            ids_by_kind (Dict[ReferenceKind, List[int]]): The referenced ids by kind, in the order their errors take precedence.
+
+        Returns:
+            Reference | None: The missing reference of the smallest id of the first kind with one, None if all exist.
+        """
+
+        for kind, ids in ids_by_kind.items():
+            if ids and (missing := await self._repository.missing(kind, ids)):
+                return Reference(kind=kind, id=missing[0])
+
+        return None
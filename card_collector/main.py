@@ -1,40 +1,57 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
+from card_collector.api.middleware import MetricsMiddleware, CallTrackingMiddleware
+from card_collector.api.responses import FastJSONResponse
 from card_collector.api.routers.card import router as card_router
 from card_collector.api.routers.profile import router as profile_router
 from card_collector.api.routers.profile_collection import router as profile_collection_router
 from card_collector.api.routers.trade_offer import router as trade_offer_router
 from card_collector.api.routers.quest import router as quest_router
+from card_collector.api.routers.metrics import router as metrics_router
+from card_collector.config import config
 from card_collector.container import Container
 from card_collector.db import database
 from card_collector.db import init_db
-from card_collector.utils import setup
+from card_collector.db import check_indexes
+from card_collector.utils.fixtures import SEED_FIXTURES
 
 container = Container()
 container.wire(modules=[
+    "card_collector.api.dependencies",
     "card_collector.api.routers.card",
     "card_collector.api.routers.profile",
     "card_collector.api.routers.profile_collection",
     "card_collector.api.routers.trade_offer",
     "card_collector.api.routers.quest",
-    "card_collector.utils.setup"
+    "card_collector.api.routers.metrics",
 ])
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
-    await init_db()
-    await database.connect()
-    await setup.main()
+    if config.DB_BACKEND == "postgres":
+        await init_db()
+        await check_indexes()
+    if config.LOAD_FIXTURES:
+        await container.fixture_loader().load(SEED_FIXTURES)
+    await container.trade_offer_service().load_order_book()
     yield
-    await database.disconnect()
+    if config.DB_BACKEND == "postgres":
+        await database.disconnect()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse if config.FAST_JSON_RESPONSES else JSONResponse,
+)
+app.add_middleware(CallTrackingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(card_router, prefix="/card")
 app.include_router(profile_router, prefix="/profile")
 app.include_router(profile_collection_router, prefix="/profile_collection")
 app.include_router(trade_offer_router, prefix="/trade_offer")
 app.include_router(quest_router, prefix="/quest")
+app.include_router(metrics_router)
@@ -0,0 +1,360 @@
+"""A module providing in-process metrics exposed in the Prometheus text format.
+
+The metrics live in the memory of the worker process, so every worker is scraped on its
+own and no metrics service or client library is needed.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Tuple, TypeVar
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+Labels = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+AnyMetric = TypeVar("AnyMetric", bound="Metric")
+
+
+def _escape(value: str) -> str:
+    """Function escaping a label value.
+
+    Args:
+        value (str): The label value.
+
+    Returns:
+        str: The escaped value.
+    """
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Function formatting a sample value.
+
+    Args:
+        value (float): The value.
+
+    Returns:
+        str: The formatted value.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(float(value))
+
+
+class Metric:
+    """A metric family with a fixed set of label names and one series per combination of label values."""
+
+    name: str
+    description: str
+    type: str
+    label_names: Labels
+
+    def __init__(self, name: str, description: str, label_names: Labels = ()) -> None:
+        """The initializer of the metric.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The description of the metric.
+            label_names (Labels): The names of the labels. Defaults to no labels.
+        """
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+
+    def _key(self, labels: Dict[str, str]) -> Labels:
+        """Function ordering label values by the label names.
+
+        Args:
+            labels (Dict[str, str]): The label values by name.
+
+        Returns:
+            Labels: The label values.
+
+        Raises:
+            ValueError: If the labels do not match the label names.
+        """
+        if labels.keys() != set(self.label_names):
+            raise ValueError(f"Labels of {self.name} must be {', '.join(self.label_names)}")
+
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def samples(self) -> Iterator[Sample]:
+        """Function listing the samples of every series.
+
+        Returns:
+            Iterator[Sample]: The name suffix, labels and value of each sample.
+        """
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Function rendering the metric in the Prometheus text format.
+
+        Returns:
+            List[str]: The lines of the metric.
+        """
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.type}"]
+        for suffix, labels, value in self.samples():
+            rendered = ",".join(f"{name}=\"{_escape(label)}\"" for name, label in labels.items())
+            lines.append(f"{self.name}{suffix}{{{rendered}}} {_format_value(value)}" if rendered
+                         else f"{self.name}{suffix} {_format_value(value)}")
+
+        return lines
+
+
+class Counter(Metric):
+    """A counter of events, by label values."""
+
+    type = "counter"
+    _values: Dict[Labels, float]
+
+    def __init__(self, name: str, description: str, label_names: Labels = ()) -> None:
+        """The initializer of the counter.
+
+        Args:
+            name (str): The name of the metric, ending with _total.
+            description (str): The description of the metric.
+            label_names (Labels): The names of the labels. Defaults to no labels.
+        """
+        super().__init__(name, description, label_names)
+        self._values = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Function counting events.
+
+        Args:
+            amount (float): The number of events. Defaults to 1.
+            **labels (str): The label values.
+        """
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, total: float, **labels: str) -> None:
+        """Function copying a total counted elsewhere, at scrape time.
+
+        Args:
+            total (float): The total.
+            **labels (str): The label values.
+        """
+        self._values[self._key(labels)] = total
+
+    def samples(self) -> Iterator[Sample]:
+        """Function listing the value of every series.
+
+        Returns:
+            Iterator[Sample]: The samples.
+        """
+        for key, value in self._values.items():
+            yield "", dict(zip(self.label_names, key)), value
+
+
+class Gauge(Metric):
+    """A value going up and down, by label values."""
+
+    type = "gauge"
+    _values: Dict[Labels, float]
+
+    def __init__(self, name: str, description: str, label_names: Labels = ()) -> None:
+        """The initializer of the gauge.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The description of the metric.
+            label_names (Labels): The names of the labels. Defaults to no labels.
+        """
+        super().__init__(name, description, label_names)
+        self._values = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Function setting the value.
+
+        Args:
+            value (float): The value.
+            **labels (str): The label values.
+        """
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Function raising the value.
+
+        Args:
+            amount (float): The amount, negative to lower the value. Defaults to 1.
+            **labels (str): The label values.
+        """
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterator[Sample]:
+        """Function listing the value of every series.
+
+        Returns:
+            Iterator[Sample]: The samples.
+        """
+        for key, value in self._values.items():
+            yield "", dict(zip(self.label_names, key)), value
+
+
+class Histogram(Metric):
+    """A distribution of observed values in cumulative buckets, by label values."""
+
+    type = "histogram"
+    buckets: Tuple[float, ...]
+    _series: Dict[Labels, Tuple[List[int], List[float]]]
+
+    def __init__(self, name: str, description: str, label_names: Labels = (), buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """The initializer of the histogram.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The description of the metric.
+            label_names (Labels): The names of the labels. Defaults to no labels.
+            buckets (Tuple[float, ...]): The sorted upper bounds of the buckets, without +Inf.
+                Defaults to LATENCY_BUCKETS.
+        """
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(buckets)
+        self._series = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Function recording an observed value.
+
+        Args:
+            value (float): The value.
+            **labels (str): The label values.
+        """
+        key = self._key(labels)
+        if key not in self._series:
+            # One count per bucket plus the +Inf bucket, and the sum of the values.
+            self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = self._series[key]
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def samples(self) -> Iterator[Sample]:
+        """Function listing the cumulative buckets, sum and count of every series.
+
+        Returns:
+            Iterator[Sample]: The samples.
+        """
+        for key, (counts, total) in self._series.items():
+            labels = dict(zip(self.label_names, key))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                yield "_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield "_sum", labels, total[0]
+            yield "_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """A registry of the metrics of the process, rendered together on scrape."""
+
+    _metrics: Dict[str, Metric]
+
+    def __init__(self) -> None:
+        """The initializer of the registry."""
+        self._metrics = {}
+
+    def register(self, metric: AnyMetric) -> AnyMetric:
+        """Function registering a metric under a unique name.
+
+        Args:
+            metric (AnyMetric): The metric.
+
+        Returns:
+            AnyMetric: The registered metric.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+        return metric
+
+    def render(self) -> str:
+        """Function rendering every metric in the Prometheus text format.
+
+        Returns:
+            str: The exposition.
+        """
+        lines = [line for metric in self._metrics.values() for line in metric.render()]
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = metrics.register(Histogram(
+    "http_request_duration_seconds",
+    "Latency of HTTP requests by router, route template, method and status.",
+    ("router", "route", "method", "status"),
+))
+HTTP_REQUEST_REPOSITORY_CALLS = metrics.register(Histogram(
+    "http_request_repository_calls",
+    "Repository calls made per HTTP request, by router and route template.",
+    ("router", "route"),
+    buckets=COUNT_BUCKETS,
+))
+HTTP_REQUEST_DB_STATEMENTS = metrics.register(Histogram(
+    "http_request_db_statements",
+    "SQL statements sent per HTTP request, by router and route template.",
+    ("router", "route"),
+    buckets=COUNT_BUCKETS,
+))
+HTTP_REQUEST_DB_DURATION = metrics.register(Histogram(
+    "http_request_db_duration_seconds",
+    "Time HTTP requests waited for their SQL statements, by router and route template.",
+    ("router", "route"),
+))
+N_PLUS_ONE_REQUESTS = metrics.register(Counter(
+    "n_plus_one_requests_total",
+    "HTTP requests repeating a repository call shape at least N_PLUS_ONE_THRESHOLD times.",
+    ("route", "shape"),
+))
+HTTP_REQUESTS_IN_FLIGHT = metrics.register(Gauge(
+    "http_requests_in_flight",
+    "HTTP requests being served.",
+))
+DB_POOL_CHECKOUT_WAIT = metrics.register(Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time requests waited for a connection of the pool.",
+    buckets=QUERY_BUCKETS,
+))
+DB_POOL_CONNECTIONS = metrics.register(Gauge(
+    "db_pool_connections",
+    "Connections of the pool by state.",
+    ("state",),
+))
+REPOSITORY_CALL_DURATION = metrics.register(Histogram(
+    "repository_call_duration_seconds",
+    "Latency of repository methods, whose _count is the number of calls.",
+    ("repository", "method"),
+    buckets=QUERY_BUCKETS,
+))
+REPOSITORY_CALL_ERRORS = metrics.register(Counter(
+    "repository_call_errors_total",
+    "Repository method calls which raised.",
+    ("repository", "method"),
+))
+DB_STATEMENT_CALLS = metrics.register(Counter(
+    "db_statement_calls_total",
+    "Executions of the registered statements.",
+    ("statement",),
+))
+DB_STATEMENT_SECONDS = metrics.register(Counter(
+    "db_statement_seconds_total",
+    "Time spent executing the registered statements.",
+    ("statement",),
+))
+CARD_CACHE_READS = metrics.register(Counter(
+    "card_cache_reads_total",
+    "Card catalog reads by whether the cache served them.",
+    ("result",),
+))
+CARD_CACHE_HIT_RATIO = metrics.register(Gauge(
+    "card_cache_hit_ratio",
+    "Share of card catalog reads served by the cache.",
+))
@@ -0,0 +1,60 @@
+"""A test helper failing when endpoints make more repository calls than their budget.
+
+Wrap the requests of a test, made with any client of the app, in ``call_budget``::
+
+    with call_budget(3):
+        client.delete("/profile/1")
+
+    with call_budget({"GET /card/{card_id}": 1, "DELETE /profile/{profile_id}": 4}, default=10):
+        ...
+
+The calls are those counted by CallTrackingMiddleware, not SQL statements, so the budgets
+do not depend on the backend and are best checked against the fast memory backend in CI.
+The statements sent to postgres are in the yielded RequestCalls and in the error messages.
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from card_collector.call_tracking import RequestCalls, add_observer, remove_observer
+
+
+class CallBudgetExceeded(AssertionError):
+    """An error raised when requests made more repository calls than their budget."""
+
+
+@contextmanager
+def call_budget(budget: int | Dict[str, int], default: int | None = None) -> Iterator[List[Tuple[str, RequestCalls]]]:
+    """Function asserting that every request finished inside the block stays within its repository call budget.
+
+    Args:
+        budget (int | Dict[str, int]): The maximal repository calls of any request, or by method and route
+            template, e.g. GET /card/{card_id}.
+        default (int | None): The budget of the routes missing from a budget by route.
+            Defaults to None (unchecked).
+
+    Returns:
+        Iterator[List[Tuple[str, RequestCalls]]]: The route and the repository calls of each request,
+            filled as the requests finish.
+
+    Raises:
+        CallBudgetExceeded: If a request made more repository calls than its budget.
+    """
+    requests: List[Tuple[str, RequestCalls]] = []
+
+    def observe(route: str, calls: RequestCalls) -> None:
+        requests.append((route, calls))
+
+    add_observer(observe)
+    try:
+        yield requests
+    finally:
+        remove_observer(observe)
+
+    over = []
+    for route, calls in requests:
+        limit = budget if isinstance(budget, int) else budget.get(route, default)
+        if limit is not None and calls.count > limit:
+            over.append(f"{route} made {calls.summary()}, over the budget of {limit}")
+    if over:
+        raise CallBudgetExceeded("\n".join(over))
@@ -0,0 +1,288 @@
+"""Fixtures of the app, and a command line loader for them.
+
+The seed fixtures are the small catalog and community the app used to insert through
+its services on every startup. Large synthetic datasets for load tests are generated
+lazily and streamed to the storage. Loading is skipped when the storage already has rows.
+
+Run with ``python -m card_collector.utils.fixtures``, optionally with ``--file`` to load a
+JSON file of rows per table, or ``--synthetic`` to generate a dataset.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Tuple
+
+from card_collector.config import config
+from card_collector.container import Container
+from card_collector.core.domains.fixture import Fixture
+from card_collector.db import (
+    card_table,
+    database,
+    init_db,
+    metadata,
+    profile_card_table,
+    profile_table,
+    quest_table,
+    trade_offer_table,
+)
+
+CARD_COLUMNS = ("id", "name", "rarity_id")
+PROFILE_COLUMNS = ("id", "name")
+PROFILE_CARD_COLUMNS = ("id", "profile_id", "card_id", "count")
+TRADE_OFFER_COLUMNS = ("id", "profile_posted", "card_offered", "card_wanted")
+QUEST_COLUMNS = ("id", "profile_id", "cards_collected", "cards_needed", "reward")
+
+SEED_FIXTURES: Tuple[Fixture, ...] = (
+    Fixture(card_table.name, CARD_COLUMNS, (
+        (1, "Strike", 1),
+        (2, "Hit", 1),
+        (3, "Defend", 1),
+        (4, "Attack", 1),
+        (5, "Shield", 1),
+        (6, "Swarm", 1),
+        (7, "Thunder", 1),
+        (8, "Fire", 1),
+        (9, "Water", 1),
+        (10, "Fairy", 1),
+        (11, "Dragon", 1),
+        (12, "Fight", 1),
+        (13, "Superheat", 2),
+        (14, "Waterfall", 2),
+        (15, "Firestorm", 2),
+        (16, "Earthquake", 2),
+        (17, "Blizzard", 2),
+        (18, "Heaven", 3),
+        (19, "Hell", 3),
+        (20, "God", 3),
+    )),
+    Fixture(profile_table.name, PROFILE_COLUMNS, (
+        (1, "Stephan"),
+        (2, "Jake"),
+        (3, "Gretchen"),
+        (4, "Mary"),
+        (5, "Richard"),
+        (6, "Gregory"),
+    )),
+    Fixture(profile_card_table.name, PROFILE_CARD_COLUMNS, (
+        (1, 1, 1, 1),
+        (2, 1, 2, 1),
+        (3, 1, 6, 1),
+        (4, 1, 16, 1),
+        (5, 2, 2, 3),
+        (6, 2, 7, 1),
+        (7, 2, 13, 1),
+        (8, 2, 14, 1),
+        (9, 3, 4, 1),
+        (10, 3, 5, 1),
+        (11, 3, 6, 1),
+        (12, 4, 10, 1),
+        (13, 4, 11, 1),
+        (14, 4, 18, 2),
+        (15, 4, 20, 1),
+        (16, 4, 3, 1),
+        (17, 4, 4, 1),
+        (18, 5, 18, 1),
+        (19, 5, 19, 1),
+        (20, 5, 20, 1),
+    )),
+    Fixture(trade_offer_table.name, TRADE_OFFER_COLUMNS, (
+        (1, 1, 1, 18),
+        (2, 3, 5, 18),
+        (3, 3, 6, 18),
+        (4, 3, 6, 17),
+        (5, 3, 6, 16),
+        (6, 4, 10, 2),
+        (7, 4, 3, 4),
+        (8, 5, 20, 6),
+        (9, 5, 20, 6),
+    )),
+    Fixture(quest_table.name, QUEST_COLUMNS, (
+        (1, 3, 2, 8, 19),
+        (2, 3, 13, 15, 16),
+        (3, 4, 0, 11, 19),
+        (4, 6, 7, 9, 14),
+    )),
+)
+
+# The share of each rarity in a synthetic catalog, and how often a card of that rarity drops.
+SYNTHETIC_RARITIES = {1: (0.70, 1.0), 2: (0.25, 0.2), 3: (0.05, 0.02)}
+
+# Profile activity follows random() ** skew, so a few profiles own and trade much more than most.
+SYNTHETIC_ACTIVITY_SKEW = 2.0
+
+SYNTHETIC_BATCH_SIZE = 10_000
+
+
+def read_fixtures(path: str) -> List[Fixture]:
+    """Function reading fixtures from a JSON object of rows per table, every row with its id.
+
+    Args:
+        path (str): The path of the JSON file.
+
+    Returns:
+        List[Fixture]: The fixtures, referenced tables first.
+
+    Raises:
+        ValueError: If a table or a column does not exist, or a row has no id.
+    """
+    with open(path, encoding="utf-8") as file:
+        rows_by_table: Dict[str, List[Dict[str, Any]]] = json.load(file)
+
+    if unknown := rows_by_table.keys() - metadata.tables.keys():
+        raise ValueError(f"Unknown tables: {', '.join(sorted(unknown))}")
+
+    fixtures = []
+    for table in metadata.sorted_tables:
+        rows = rows_by_table.get(table.name)
+        if not rows:
+            continue
+        columns = tuple(table.c.keys())
+        for row in rows:
+            if unknown := row.keys() - set(columns):
+                raise ValueError(f"Unknown columns of {table.name}: {', '.join(sorted(unknown))}")
+            if row.get("id") is None:
+                raise ValueError(f"A row of {table.name} has no id")
+        fixtures.append(Fixture(table.name, columns, [tuple(row.get(name) for name in columns) for row in rows]))
+
+    return fixtures
+
+
+def synthetic_fixtures(
+        profiles: int = 1_000_000,
+        collections: int = 50_000_000,
+        offers: int = 5_000_000,
+        cards: int = 1_000,
+        quests: int = 100_000,
+        seed: int = 0,
+) -> Tuple[Fixture, ...]:
+    """Function generating a synthetic dataset for load tests, streamed row by row.
+
+    Common cards make up most of the catalog and drop far more often than rare ones,
+    and a minority of profiles owns most of the collection. The copies of each profile
+    are aggregated into its profile_card rows. Offers mostly give away commons for cards
+    of any rarity. Ownership of offered cards is not enforced.
+
+    Args:
+        profiles (int): The number of profiles. Defaults to 1_000_000.
+        collections (int): The number of owned copies, about. Defaults to 50_000_000.
+        offers (int): The number of trade offers. Defaults to 5_000_000.
+        cards (int): The number of cards. Defaults to 1_000.
+        quests (int): The number of quests. Defaults to 100_000.
+        seed (int): The seed of the random number generators. Defaults to 0.
+
+    Returns:
+        Tuple[Fixture, ...]: The fixtures, referenced tables first.
+    """
+    rarity_rng = random.Random(f"{seed}:rarity")
+    rarities = rarity_rng.choices(
+        list(SYNTHETIC_RARITIES),
+        weights=[share for share, _ in SYNTHETIC_RARITIES.values()],
+        k=cards,
+    )
+    card_ids = range(1, cards + 1)
+    drop_weights = list(accumulate(SYNTHETIC_RARITIES[rarity][1] for rarity in rarities))
+    rewards = [card_id for card_id, rarity in zip(card_ids, rarities) if rarity > 1] or list(card_ids)
+
+    def active_profile(rng: random.Random) -> int:
+        return int(profiles * rng.random() ** SYNTHETIC_ACTIVITY_SKEW) + 1
+
+    def card_rows() -> Iterator[Tuple[Any, ...]]:
+        for card_id, rarity in zip(card_ids, rarities):
+            yield card_id, f"Card {card_id}", rarity
+
+    def profile_rows() -> Iterator[Tuple[Any, ...]]:
+        for profile_id in range(1, profiles + 1):
+            yield profile_id, f"Profile {profile_id}"
+
+    def profile_card_rows() -> Iterator[Tuple[Any, ...]]:
+        rng = random.Random(f"{seed}:{profile_card_table.name}")
+        row_id = 1
+        for profile_id in range(1, profiles + 1):
+            # The share of the copies active_profile would draw for this profile.
+            share = ((profile_id / profiles) ** (1 / SYNTHETIC_ACTIVITY_SKEW)
+                     - ((profile_id - 1) / profiles) ** (1 / SYNTHETIC_ACTIVITY_SKEW))
+            drops = rng.choices(card_ids, cum_weights=drop_weights, k=int(collections * share + rng.random()))
+            for card_id, count in sorted(Counter(drops).items()):
+                yield row_id, profile_id, card_id, count
+                row_id += 1
+
+    def trade_offer_rows() -> Iterator[Tuple[Any, ...]]:
+        rng = random.Random(f"{seed}:{trade_offer_table.name}")
+        for start in range(1, offers + 1, SYNTHETIC_BATCH_SIZE):
+            size = min(SYNTHETIC_BATCH_SIZE, offers + 1 - start)
+            offered = rng.choices(card_ids, cum_weights=drop_weights, k=size)
+            for offset, card_offered in enumerate(offered):
+                card_wanted = rng.randint(1, cards)
+                if card_wanted == card_offered:
+                    card_wanted = card_wanted % cards + 1
+                yield start + offset, active_profile(rng), card_offered, card_wanted
+
+    def quest_rows() -> Iterator[Tuple[Any, ...]]:
+        rng = random.Random(f"{seed}:{quest_table.name}")
+        for quest_id in range(1, quests + 1):
+            cards_needed = rng.randint(5, 50)
+            yield quest_id, rng.randint(1, profiles), rng.randrange(cards_needed), cards_needed, rng.choice(rewards)
+
+    return (
+        Fixture(card_table.name, CARD_COLUMNS, card_rows()),
+        Fixture(profile_table.name, PROFILE_COLUMNS, profile_rows()),
+        Fixture(profile_card_table.name, PROFILE_CARD_COLUMNS, profile_card_rows()),
+        Fixture(trade_offer_table.name, TRADE_OFFER_COLUMNS, trade_offer_rows()),
+        Fixture(quest_table.name, QUEST_COLUMNS, quest_rows()),
+    )
+
+
+async def load(fixtures: Tuple[Fixture, ...] | List[Fixture]) -> None:
+    """Function connecting to the storage, loading fixtures and printing the loaded row counts.
+
+    Args:
+        fixtures (Tuple[Fixture, ...] | List[Fixture]): The fixtures.
+    """
+    container = Container()
+    if config.DB_BACKEND == "postgres":
+        await init_db()
+    try:
+        started = time.perf_counter()
+        loaded = await container.fixture_loader().load(fixtures)
+        if loaded is None:
+            print("The storage is already seeded, nothing was loaded")
+            return
+        for table, count in loaded.items():
+            print(f"{table:<20}{count:>12} rows")
+        print(f"Loaded in {time.perf_counter() - started:.1f}s")
+    finally:
+        if config.DB_BACKEND == "postgres":
+            await database.disconnect()
+
+
+def main() -> None:
+    """Function parsing the arguments and loading the fixtures."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--file", help="a JSON object of rows per table")
+    source.add_argument("--synthetic", action="store_true", help="generate a dataset for load tests")
+    parser.add_argument("--profiles", type=int, default=1_000_000)
+    parser.add_argument("--collections", type=int, default=50_000_000)
+    parser.add_argument("--offers", type=int, default=5_000_000)
+    parser.add_argument("--cards", type=int, default=1_000)
+    parser.add_argument("--quests", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.file:
+        fixtures = read_fixtures(args.file)
+    elif args.synthetic:
+        fixtures = synthetic_fixtures(args.profiles, args.collections, args.offers, args.cards, args.quests, args.seed)
+    else:
+        fixtures = SEED_FIXTURES
+
+    asyncio.run(load(fixtures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""A one-time migration of the per-copy profile_collection table to the profile_card ownership store.
+
+Earlier versions kept one profile_collection row per copy. This migration creates profile_card,
+fills it with the counts of the copies, drops profile_collection and creates the
+profile_collection view in its place, all in one transaction. Copies get new ids, so clients
+holding ids of copies read them again. The app refuses to start on a database that still
+has the table.
+
+Run with ``python -m card_collector.utils.migrate_profile_card`` while the app is stopped.
+"""
+
+import asyncio
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from card_collector.db import database, profile_card_table, profile_collection_view
+
+# Counts the copies of every profile and card, ordered so that rows of a profile get adjacent ids.
+PROFILE_CARD_MIGRATION = """
+    INSERT INTO profile_card (profile_id, card_id, count)
+    SELECT profile_id, card_id, count(*) FROM profile_collection
+    WHERE profile_id IS NOT NULL AND card_id IS NOT NULL
+    GROUP BY profile_id, card_id
+    ORDER BY profile_id, card_id
+"""
+
+
+async def migrate() -> int | None:
+    """Function replacing the profile_collection table with profile_card rows and the view, in one transaction.
+
+    Returns:
+        int | None: The number of profile_card rows, None if there was no profile_collection table.
+    """
+    query = "SELECT tablename FROM pg_tables WHERE schemaname = current_schema()"
+
+    async with database.transaction():
+        if "profile_collection" not in {row["tablename"] for row in await database.fetch_all(query)}:
+            return None
+
+        await database.execute(CreateTable(profile_card_table))
+        for index in sorted(profile_card_table.indexes, key=lambda ix: ix.name):
+            await database.execute(CreateIndex(index))
+        await database.execute(PROFILE_CARD_MIGRATION)
+        await database.execute("DROP TABLE profile_collection")
+        await database.execute(profile_collection_view)
+        rows = await database.fetch_val(select(func.count()).select_from(profile_card_table))
+
+    await database.execute(f"ANALYZE {profile_card_table.name}")
+
+    return rows
+
+
+async def main_async() -> None:
+    """Function connecting to the database, migrating and printing the outcome."""
+    await database.connect()
+    try:
+        started = time.perf_counter()
+        rows = await migrate()
+        if rows is None:
+            print("There is no profile_collection table, nothing to migrate")
+            return
+        print(f"Migrated to {rows} profile_card rows in {time.perf_counter() - started:.1f}s")
+    finally:
+        await database.disconnect()
+
+
+def main() -> None:
+    """Function running the migration."""
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Fixtures running the app on every storage backend.
+
+Each test using the app runs once per backend. The memory backend always runs. The
+postgres backend runs when DB_HOST points to a database, with DB_FORCE_ROLLBACK on so
+that disconnecting after each test rolls back all of its writes, schema included, e.g. with
+the database of docker-compose.yml::
+
+    docker compose up -d db
+    DB_HOST=localhost DB_NAME=app DB_USER=postgres DB_PASSWORD=pass python -m pytest
+"""
+
+import os
+from typing import Any, AsyncIterator, Dict, Iterator
+
+os.environ.setdefault("DB_FORCE_ROLLBACK", "true")
+
+import httpx
+import pytest
+from dependency_injector.providers import Object
+
+from card_collector.config import config
+from card_collector.main import app, container, lifespan
+
+BACKENDS = ("memory", "postgres")
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Fixture running the async tests on asyncio, the event loop of the app."""
+    return "asyncio"
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Fixture selecting the storage backend of the container, with fresh singletons.
+
+    Returns:
+        Iterator[str]: The name of the backend.
+    """
+    if request.param == "postgres" and not os.environ.get("DB_HOST"):
+        pytest.skip("DB_HOST is not set, the postgres backend needs a database")
+
+    monkeypatch.setattr(config, "DB_BACKEND", request.param)
+    container.backend.override(Object(request.param))
+    container.reset_singletons()
+    try:
+        yield request.param
+    finally:
+        container.backend.reset_override()
+        container.reset_singletons()
+
+
+class Api:
+    """A client of the app with shortcuts for the data most tests need."""
+
+    client: httpx.AsyncClient
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        """The initializer of the client.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client of the app.
+        """
+        self.client = client
+
+    async def card(self, name: str, rarity_id: int = 1) -> int:
+        """Function creating a card.
+
+        Args:
+            name (str): The name of the card.
+            rarity_id (int): The rarity of the card. Defaults to 1.
+
+        Returns:
+            int: The id of the card.
+        """
+        response = await self.client.post("/card/create", json={"name": name, "rarity_id": rarity_id})
+        assert response.status_code == 201, response.text
+
+        return response.json()["id"]
+
+    async def profile(self, name: str) -> int:
+        """Function creating a profile.
+
+        Args:
+            name (str): The name of the profile.
+
+        Returns:
+            int: The id of the profile.
+        """
+        response = await self.client.post("/profile/create", json={"name": name})
+        assert response.status_code == 201, response.text
+
+        return response.json()["id"]
+
+    async def give(self, profile_id: int, card_id: int, copies: int = 1) -> None:
+        """Function adding copies of a card to a profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+            card_id (int): The id of the card.
+            copies (int): The number of copies. Defaults to 1.
+        """
+        response = await self.client.post(
+            "/profile_collection/bulk",
+            json=[{"profile_id": profile_id, "card_id": card_id}] * copies,
+        )
+        assert response.status_code == 201, response.text
+
+    async def quest(self, profile_id: int, cards_needed: int, reward: int) -> Dict[str, Any]:
+        """Function creating a quest.
+
+        Args:
+            profile_id (int): The id of the profile.
+            cards_needed (int): The number of cards to collect.
+            reward (int): The id of the reward card.
+
+        Returns:
+            Dict[str, Any]: The quest.
+        """
+        response = await self.client.post("/quest/create", json={
+            "profile_id": profile_id,
+            "cards_collected": 0,
+            "cards_needed": cards_needed,
+            "reward": reward,
+        })
+        assert response.status_code == 201, response.text
+
+        return response.json()
+
+    async def offer(self, profile_id: int, card_offered: int, card_wanted: int) -> httpx.Response:
+        """Function posting a trade offer.
+
+        Args:
+            profile_id (int): The id of the posting profile.
+            card_offered (int): The id of the card offered.
+            card_wanted (int): The id of the card wanted.
+
+        Returns:
+            httpx.Response: The response.
+        """
+        return await self.client.post("/trade_offer/create", json={
+            "profile_posted": profile_id,
+            "card_offered": card_offered,
+            "card_wanted": card_wanted,
+        })
+
+    async def counts(self, profile_id: int) -> Dict[int, int]:
+        """Function getting the copies of each card owned by a profile.
+
+        Args:
+            profile_id (int): The id of the profile.
+
+        Returns:
+            Dict[int, int]: The number of copies by card id.
+        """
+        response = await self.client.get("/profile_collection/counts_by_profile_id", params={"profile_id": profile_id})
+        assert response.status_code == 200, response.text
+
+        return {row["card_id"]: row["count"] for row in response.json()}
+
+    async def depth(self, card_offered: int, card_wanted: int) -> int:
+        """Function getting the number of open trade offers with a given offer.
+
+        Args:
+            card_offered (int): The id of the card offered.
+            card_wanted (int): The id of the card wanted.
+
+        Returns:
+            int: The number of open trade offers.
+        """
+        response = await self.client.get(
+            "/trade_offer/depth",
+            params={"card_offered": card_offered, "card_wanted": card_wanted},
+        )
+        assert response.status_code == 200, response.text
+
+        return response.json()["depth"]
+
+
+@pytest.fixture
+async def api(backend: str, monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[Api]:
+    """Fixture starting the app on the selected backend, without seed fixtures.
+
+    Returns:
+        AsyncIterator[Api]: The client of the app.
+    """
+    monkeypatch.setattr(config, "LOAD_FIXTURES", False)
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield Api(client)
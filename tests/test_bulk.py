@@ -0,0 +1,88 @@
+"""Tests of the bulk endpoints adding many cards and profile collections at once."""
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_bulk_cards_are_created_in_order(api):
+    cards = [{"name": name, "rarity_id": rarity_id} for name, rarity_id in (("Strike", 1), ("Bash", 2), ("Anger", 1))]
+
+    response = await api.client.post("/card/bulk", json=cards)
+
+    assert response.status_code == 201
+    created = response.json()
+    assert [{"name": card["name"], "rarity_id": card["rarity_id"]} for card in created] == cards
+    assert len({card["id"] for card in created}) == 3
+    for card in created:
+        assert (await api.client.get(f"/card/{card['id']}")).json() == card
+
+
+async def test_bulk_cards_with_a_repeated_name_are_rejected(api):
+    response = await api.client.post("/card/bulk", json=[
+        {"name": "Strike", "rarity_id": 1},
+        {"name": "Strike", "rarity_id": 2},
+    ])
+
+    assert response.status_code == 409
+    assert response.json() == {"detail": "Cards with the same name in the request"}
+
+
+async def test_bulk_cards_with_an_existing_name_create_nothing(api):
+    await api.card("Bash")
+
+    response = await api.client.post("/card/bulk", json=[
+        {"name": "Strike", "rarity_id": 1},
+        {"name": "Bash", "rarity_id": 1},
+    ])
+
+    assert response.status_code == 409
+    assert response.json() == {"detail": "Card with name Bash already exists"}
+    assert await api.card("Strike")
+
+
+async def test_bulk_profile_collections_are_created(api):
+    alice, bob = await api.profile("Alice"), await api.profile("Bob")
+    strike, bash = await api.card("Strike"), await api.card("Bash")
+    items = [
+        {"profile_id": alice, "card_id": strike},
+        {"profile_id": bob, "card_id": bash},
+        {"profile_id": alice, "card_id": strike},
+        {"profile_id": alice, "card_id": bash},
+    ]
+
+    response = await api.client.post("/profile_collection/bulk", json=items)
+
+    assert response.status_code == 201
+    created = response.json()
+    assert [{"profile_id": item["profile_id"], "card_id": item["card_id"]} for item in created] == items
+    assert len({item["id"] for item in created}) == 4
+    assert await api.counts(alice) == {strike: 2, bash: 1}
+    assert await api.counts(bob) == {bash: 1}
+    for item in created:
+        assert (await api.client.get(f"/profile_collection/{item['id']}")).json() == item
+
+
+@pytest.mark.parametrize("missing, detail", [("card", "Card {} not found"), ("profile", "Profile {} not found")])
+async def test_bulk_profile_collections_with_a_missing_reference_create_nothing(api, missing, detail):
+    profile_id = await api.profile("Alice")
+    card_id = await api.card("Strike")
+    # Sequences are not rolled back between tests, so the absent id follows the created ones.
+    absent = max(profile_id, card_id) + 1000
+    item = {"profile_id": profile_id, "card_id": card_id}
+
+    response = await api.client.post("/profile_collection/bulk", json=[item, {**item, f"{missing}_id": absent}])
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": detail.format(absent)}
+    assert await api.counts(profile_id) == {}
+
+
+async def test_bulk_profile_collections_advance_quests_once_per_profile(api):
+    profile_id = await api.profile("Collector")
+    card_id, reward = await api.card("Strike"), await api.card("Reward")
+    await api.quest(profile_id, cards_needed=3, reward=reward)
+
+    await api.give(profile_id, card_id, copies=3)
+
+    assert await api.counts(profile_id) == {card_id: 3, reward: 1}
@@ -0,0 +1,48 @@
+"""Tests of the repository calls and SQL statements counted per request."""
+
+import logging
+import re
+
+import pytest
+
+from card_collector.config import config
+from card_collector.utils.call_budget import CallBudgetExceeded, call_budget
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_request_over_its_call_budget_fails(api):
+    profile_id = await api.profile("Alice")
+
+    with call_budget(10) as requests:
+        assert (await api.client.get(f"/profile/{profile_id}")).status_code == 200
+
+    route, calls = requests[0]
+    assert route == "GET /profile/{profile_id}"
+    with pytest.raises(CallBudgetExceeded, match=re.escape(f"{route} made {calls.count} repository calls")):
+        with call_budget({route: calls.count - 1}):
+            await api.client.get(f"/profile/{profile_id}")
+
+
+async def test_statements_are_sent_in_server_timing(api, backend):
+    profile_id = await api.profile("Alice")
+
+    with call_budget(10) as requests:
+        response = await api.client.get(f"/profile/{profile_id}")
+
+    calls = requests[0][1]
+    assert (calls.statements > 0) == (backend == "postgres")
+    assert response.headers.get_list("server-timing")[1] == (
+        f"db;dur={calls.statement_seconds * 1000:.1f};desc=\"{calls.statements} statements\""
+    )
+
+
+async def test_repeated_calls_are_logged_as_n_plus_one(api, monkeypatch, caplog):
+    profile_id = await api.profile("Alice")
+    monkeypatch.setattr(config, "N_PLUS_ONE_THRESHOLD", 1)
+    caplog.set_level(logging.WARNING, logger="card_collector.api.middleware")
+
+    await api.client.get(f"/profile/{profile_id}")
+
+    assert [record.levelno for record in caplog.records] == [logging.WARNING]
+    assert caplog.messages[0].startswith("N+1 repository calls in GET /profile/{profile_id}: ")
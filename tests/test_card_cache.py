@@ -0,0 +1,55 @@
+"""Tests of the card catalog cache staying consistent with committed cards."""
+
+import asyncio
+
+import pytest
+
+from card_collector.core.domains.card import CardIn
+from card_collector.main import container
+
+pytestmark = pytest.mark.anyio
+
+
+class Failure(Exception):
+    """An error failing the work of a test."""
+
+
+async def test_catalog_is_served_from_the_cache(api):
+    cache = container.card_repository()
+    card_id = await api.card("Strike")
+
+    await cache.get_all_cards()
+    hits = cache.hits
+    assert (await cache.get_by_id(card_id)).name == "Strike"
+
+    assert cache.hits == hits + 1
+
+
+async def test_writing_task_reads_its_own_cards(api):
+    service = container.card_service()
+
+    async with container.unit_of_work():
+        card = await service.add_card(CardIn(name="Pending", rarity_id=1))
+
+        assert await service.get_by_name("Pending") == card
+        assert card in await service.get_all_by_rarity(1)
+
+    assert await service.get_by_name("Pending") == card
+
+
+async def test_catalog_is_not_published_while_a_card_write_is_uncommitted(api):
+    cache = container.card_repository()
+    await api.card("Committed")
+
+    with pytest.raises(Failure):
+        async with container.unit_of_work():
+            await container.card_service().add_card(CardIn(name="Pending", rarity_id=1))
+            misses = cache.misses
+            for _ in range(2):
+                await asyncio.create_task(cache.get_all_cards())
+            assert cache.misses == misses + 2
+            raise Failure
+
+    assert [card.name for card in await cache.get_all_cards()] == ["Committed"]
+    assert await cache.get_by_name("Pending") is None
+    assert (await api.client.get("/card/all")).json()[0]["name"] == "Committed"
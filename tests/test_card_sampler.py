@@ -0,0 +1,37 @@
+"""Tests of the card sampler drawing from the current card catalog."""
+
+import asyncio
+
+import pytest
+
+from card_collector.main import container
+from card_collector.infrastructure.repositories.cached_card_repository import CachedCardRepository
+from card_collector.infrastructure.repositories.card_repository import CardRepository
+from card_collector.infrastructure.repositories.memory_card_repository import MemoryCardRepository
+from card_collector.infrastructure.services.card_sampler import CardSampler
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_sampler_draws_new_cards(api):
+    sampler = container.card_sampler()
+    strike = await api.card("Strike")
+    assert {card.id for card in await sampler.sample(20)} == {strike}
+
+    bash = await api.card("Bash", rarity_id=2)
+
+    assert {card.id for card in await sampler.sample(50)} == {strike, bash}
+    assert {card.id for card in await sampler.sample_by_rarity(20, 2)} == {bash}
+
+
+async def test_sampler_drops_cards_deleted_by_another_worker(api, backend):
+    # The catalog of another worker is the storage itself, written past this worker's cache.
+    storage = MemoryCardRepository(container.memory_store()) if backend == "memory" else CardRepository()
+    sampler = CardSampler(CachedCardRepository(storage, container.transactions(), ttl=0.01), seed=0)
+    kept, deleted = await api.card("Kept"), await api.card("Deleted")
+    assert {card.id for card in await sampler.sample(50)} == {kept, deleted}
+
+    await storage.delete_card(deleted)
+    await asyncio.sleep(0.02)
+
+    assert {card.id for card in await sampler.sample(50)} == {kept}
@@ -0,0 +1,27 @@
+"""Tests of hydrating domain models from trusted DB records."""
+
+import pytest
+
+from card_collector.core.domains.card import Card
+from card_collector.core.domains.hydration import hydrate
+from card_collector.core.domains.profile_collection import ProfileCollection
+
+
+def test_hydrated_model_equals_the_validated_one():
+    record = {"id": 7, "profile_id": 1, "card_id": 2}
+
+    profile_collection = hydrate(ProfileCollection, record)
+
+    assert profile_collection == ProfileCollection(**record)
+    assert profile_collection.model_fields_set == set(record)
+
+
+def test_columns_which_are_not_fields_are_ignored():
+    card = Card.from_record({**Card(id=1, name="Strike", rarity_id=1).model_dump(), "count": 3})
+
+    assert card.model_dump() == {"id": 1, "name": "Strike", "rarity_id": 1}
+
+
+def test_missing_column_raises():
+    with pytest.raises(KeyError):
+        hydrate(ProfileCollection, {"id": 7, "profile_id": 1})
@@ -0,0 +1,32 @@
+"""Tests of deleting profiles together with everything they own."""
+
+import logging
+
+import pytest
+
+from card_collector.core.domains.trade_offer import TradeOfferIn
+from card_collector.main import container
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_deleted_profile_logs_the_removed_rows(api, caplog):
+    alice, bob = await api.profile("Alice"), await api.profile("Bob")
+    sword, shield = await api.card("Sword"), await api.card("Shield")
+    await api.give(alice, sword, copies=2)
+    await api.give(alice, shield)
+    await api.give(bob, shield)
+    await api.quest(alice, cards_needed=10, reward=shield)
+    await container.trade_offer_service().add_trade_offer(
+        TradeOfferIn(profile_posted=alice, card_offered=sword, card_wanted=shield))
+    caplog.set_level(logging.INFO, logger="card_collector.api.routers.profile")
+
+    response = await api.client.delete(f"/profile/{alice}")
+
+    assert response.status_code == 204
+    assert caplog.messages == [
+        f"Deleted profile {alice} with 3 profile collections, 1 trade offers and 1 quests",
+    ]
+    assert await api.depth(sword, shield) == 0
+    assert await api.counts(bob) == {shield: 1}
+    assert (await api.client.delete(f"/profile/{alice}")).status_code == 404
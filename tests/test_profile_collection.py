@@ -0,0 +1,71 @@
+"""Tests of the ids of copies, which only the last copy of a card gives up."""
+
+import pytest
+
+from card_collector.core.domains.profile_collection import NotLastCopyError, ProfileCollectionIn
+from card_collector.main import container
+
+pytestmark = pytest.mark.anyio
+
+
+async def copies(api, profile_id, card_id, count):
+    response = await api.client.post("/profile_collection/bulk", json=[{"profile_id": profile_id, "card_id": card_id}] * count)
+    assert response.status_code == 201, response.text
+
+    return [item["id"] for item in response.json()]
+
+
+async def test_deleted_last_copy_is_gone(api):
+    alice = await api.profile("Alice")
+    strike = await api.card("Strike")
+    first, second = await copies(api, alice, strike, 2)
+
+    assert (await api.client.delete(f"/profile_collection/{second}")).status_code == 204
+
+    assert (await api.client.get(f"/profile_collection/{second}")).status_code == 404
+    assert (await api.client.get(f"/profile_collection/{first}")).status_code == 200
+    assert await api.counts(alice) == {strike: 1}
+
+
+async def test_deleting_a_copy_other_than_the_last_is_rejected(api):
+    alice = await api.profile("Alice")
+    strike = await api.card("Strike")
+    first, second = await copies(api, alice, strike, 2)
+
+    response = await api.client.delete(f"/profile_collection/{first}")
+
+    assert response.status_code == 409
+    assert response.json() == {"detail": "Only the last copy of a card can be removed"}
+    assert (await api.client.get(f"/profile_collection/{second}")).status_code == 200
+    assert await api.counts(alice) == {strike: 2}
+
+
+async def test_last_copies_are_deleted_together_in_any_order(api):
+    alice = await api.profile("Alice")
+    strike = await api.card("Strike")
+    first, second, third = await copies(api, alice, strike, 3)
+    service = container.profile_collection_service()
+
+    with pytest.raises(NotLastCopyError):
+        await service.delete_many([first, third])
+
+    removed = await service.delete_many([third, second])
+
+    assert [profile_collection.id for profile_collection in removed] == [third, second]
+    assert await api.counts(alice) == {strike: 1}
+
+
+async def test_moving_a_copy_other_than_the_last_is_rejected(api):
+    alice, bob = await api.profile("Alice"), await api.profile("Bob")
+    strike = await api.card("Strike")
+    first, second = await copies(api, alice, strike, 2)
+    service = container.profile_collection_service()
+
+    with pytest.raises(NotLastCopyError):
+        await service.update_profile_collection(first, ProfileCollectionIn(profile_id=bob, card_id=strike))
+
+    moved = await service.update_profile_collection(second, ProfileCollectionIn(profile_id=bob, card_id=strike))
+
+    assert (moved.profile_id, moved.card_id) == (bob, strike)
+    assert await api.counts(alice) == {strike: 1}
+    assert await api.counts(bob) == {strike: 1}
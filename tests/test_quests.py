@@ -0,0 +1,73 @@
+"""Tests of quests progressing as cards are collected and their rewards cascading."""
+
+import pytest
+
+from card_collector.config import config
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_collecting_a_card_advances_the_quests(api):
+    profile_id = await api.profile("Collector")
+    card_id = await api.card("Strike")
+    quest = await api.quest(profile_id, cards_needed=3, reward=card_id)
+
+    await api.give(profile_id, card_id, copies=2)
+
+    response = await api.client.get(f"/quest/{quest['id']}")
+    assert response.json()["cards_collected"] == 2
+    assert await api.counts(profile_id) == {card_id: 2}
+
+
+async def test_completed_quest_grants_its_reward(api):
+    profile_id = await api.profile("Collector")
+    card_id, reward = await api.card("Strike"), await api.card("Reward")
+    quest = await api.quest(profile_id, cards_needed=2, reward=reward)
+
+    await api.give(profile_id, card_id, copies=2)
+
+    assert await api.counts(profile_id) == {card_id: 2, reward: 1}
+    assert (await api.client.get(f"/quest/{quest['id']}")).status_code == 404
+
+
+async def test_rewards_complete_further_quests(api):
+    profile_id = await api.profile("Collector")
+    card_id = await api.card("Strike")
+    first, second, third = await api.card("First"), await api.card("Second"), await api.card("Third")
+    await api.quest(profile_id, cards_needed=1, reward=first)
+    await api.quest(profile_id, cards_needed=2, reward=second)
+    await api.quest(profile_id, cards_needed=3, reward=third)
+
+    response = await api.client.post("/profile_collection/create", json={"profile_id": profile_id, "card_id": card_id})
+
+    assert response.status_code == 201
+    assert await api.counts(profile_id) == {card_id: 1, first: 1, second: 1, third: 1}
+    assert (await api.client.get(f"/quest/all/{profile_id}")).status_code == 404
+
+
+async def test_cascade_stops_at_the_maximal_depth(api, monkeypatch):
+    monkeypatch.setattr(config, "QUEST_REWARD_MAX_DEPTH", 1)
+    profile_id = await api.profile("Collector")
+    card_id = await api.card("Strike")
+    first, second = await api.card("First"), await api.card("Second")
+    await api.quest(profile_id, cards_needed=1, reward=first)
+    pending = await api.quest(profile_id, cards_needed=2, reward=second)
+
+    await api.give(profile_id, card_id)
+
+    assert await api.counts(profile_id) == {card_id: 1, first: 1}
+    assert (await api.client.get(f"/quest/{pending['id']}")).json()["cards_collected"] == 1
+
+
+async def test_traded_card_advances_the_quests_of_the_receiver(api):
+    alice, bob = await api.profile("Alice"), await api.profile("Bob")
+    sword, shield, reward = await api.card("Sword"), await api.card("Shield"), await api.card("Reward")
+    await api.give(alice, sword)
+    await api.give(bob, shield)
+    await api.quest(bob, cards_needed=1, reward=reward)
+
+    await api.offer(alice, sword, shield)
+    await api.offer(bob, shield, sword)
+
+    assert await api.counts(bob) == {sword: 1, reward: 1}
+    assert await api.counts(alice) == {shield: 1}
@@ -0,0 +1,30 @@
+"""Tests of the round trip counter of the benchmarks."""
+
+import pytest
+
+from card_collector.benchmarks.round_trips import RoundTripCounter
+from card_collector.core.domains.card import CardIn
+from card_collector.db import database
+from card_collector.infrastructure.repositories.card_repository import CardRepository
+from card_collector.infrastructure.repositories.profile_collection_repository import OWNS
+from card_collector.infrastructure.repositories.statement_registry import statements
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_every_statement_on_the_connection_is_counted(api, backend):
+    if backend != "postgres":
+        pytest.skip("Round trips are only counted on postgres")
+
+    async with database.connection() as connection:
+        counter = RoundTripCounter()
+        with connection.raw_connection.query_logger(counter):
+            await statements.fetch_one(OWNS, profile_id=1, card_id=1)
+            assert await counter.settled() == 1
+
+            async with database.transaction():
+                await CardRepository().add_card(CardIn(name="Strike", rarity_id=1))
+            assert await counter.settled() == 4
+
+        await database.fetch_val("SELECT 1")
+        assert await counter.settled() == 4
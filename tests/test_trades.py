@@ -0,0 +1,198 @@
+"""Tests of trade offers matching directly and clearing in cycles."""
+
+import pytest
+
+from card_collector.core.domains.trade_offer import TradeOfferIn
+from card_collector.infrastructure.services.profile_collection_service import ProfileCollectionService
+from card_collector.infrastructure.services.trade_offer_service import TradeOfferService
+from card_collector.infrastructure.services.trade_order_book import TradeOrderBook
+from card_collector.main import container
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_offer_without_a_match_is_posted(api):
+    profile_id = await api.profile("Alice")
+    offered, wanted = await api.card("Offered"), await api.card("Wanted")
+    await api.give(profile_id, offered)
+
+    response = await api.offer(profile_id, offered, wanted)
+
+    assert response.status_code == 201
+    assert response.json()["profile_posted"] == profile_id
+    assert await api.depth(offered, wanted) == 1
+    assert await api.counts(profile_id) == {offered: 1}
+
+
+async def test_offer_of_an_unowned_card_is_rejected(api):
+    profile_id = await api.profile("Alice")
+    offered, wanted = await api.card("Offered"), await api.card("Wanted")
+
+    response = await api.offer(profile_id, offered, wanted)
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Card offered not found"}
+
+
+async def test_matching_offers_swap_cards(api):
+    alice, bob = await api.profile("Alice"), await api.profile("Bob")
+    sword, shield = await api.card("Sword"), await api.card("Shield")
+    await api.give(alice, sword, copies=2)
+    await api.give(bob, shield)
+
+    posted = await api.offer(alice, sword, shield)
+    matched = await api.offer(bob, shield, sword)
+
+    assert matched.status_code == 201
+    assert matched.json() == posted.json()
+    assert await api.counts(alice) == {sword: 1, shield: 1}
+    assert await api.counts(bob) == {sword: 1}
+    assert await api.depth(sword, shield) == 0
+    assert await api.depth(shield, sword) == 0
+
+
+async def test_oldest_matching_offer_is_completed_first(api):
+    alice, bob, carol = await api.profile("Alice"), await api.profile("Bob"), await api.profile("Carol")
+    sword, shield = await api.card("Sword"), await api.card("Shield")
+    await api.give(alice, sword)
+    await api.give(bob, sword)
+    await api.give(carol, shield)
+
+    first = await api.offer(alice, sword, shield)
+    await api.offer(bob, sword, shield)
+    matched = await api.offer(carol, shield, sword)
+
+    assert matched.json()["id"] == first.json()["id"]
+    assert await api.counts(alice) == {shield: 1}
+    assert await api.counts(bob) == {sword: 1}
+    assert await api.depth(sword, shield) == 1
+
+
+async def test_trading_the_last_copy_removes_other_offers_of_it(api):
+    alice, bob = await api.profile("Alice"), await api.profile("Bob")
+    sword, shield, bow = await api.card("Sword"), await api.card("Shield"), await api.card("Bow")
+    await api.give(alice, sword)
+    await api.give(bob, shield)
+
+    await api.offer(alice, sword, bow)
+    await api.offer(alice, sword, shield)
+    await api.offer(bob, shield, sword)
+
+    assert await api.counts(alice) == {shield: 1}
+    assert await api.depth(sword, bow) == 0
+
+
+async def test_offer_closing_a_cycle_clears_it(api):
+    alice, bob, carol = await api.profile("Alice"), await api.profile("Bob"), await api.profile("Carol")
+    sword, shield, bow = await api.card("Sword"), await api.card("Shield"), await api.card("Bow")
+    await api.give(alice, sword)
+    await api.give(bob, shield)
+    await api.give(carol, bow)
+
+    await api.offer(alice, sword, shield)
+    await api.offer(bob, shield, bow)
+    closing = await api.offer(carol, bow, sword)
+
+    assert closing.status_code == 201
+    assert await api.counts(alice) == {shield: 1}
+    assert await api.counts(bob) == {bow: 1}
+    assert await api.counts(carol) == {sword: 1}
+    for pair in ((sword, shield), (shield, bow), (bow, sword)):
+        assert await api.depth(*pair) == 0
+
+
+async def test_clear_executes_the_cycles_of_the_order_book(api):
+    alice, bob, carol = await api.profile("Alice"), await api.profile("Bob"), await api.profile("Carol")
+    sword, shield, bow = await api.card("Sword"), await api.card("Shield"), await api.card("Bow")
+    await api.give(alice, sword)
+    await api.give(bob, shield)
+    await api.give(carol, bow)
+
+    # Posted past the collection integration service, so the cycle is left for /clear.
+    service = container.trade_offer_service()
+    await service.add_trade_offer(TradeOfferIn(profile_posted=alice, card_offered=sword, card_wanted=shield))
+    await service.add_trade_offer(TradeOfferIn(profile_posted=bob, card_offered=shield, card_wanted=bow))
+    await service.add_trade_offer(TradeOfferIn(profile_posted=carol, card_offered=bow, card_wanted=sword))
+
+    response = await api.client.post("/trade_offer/clear")
+
+    assert response.status_code == 200
+    assert response.json() == {"cycles": 1, "trade_offers": 3}
+    assert await api.counts(alice) == {shield: 1}
+    assert await api.counts(bob) == {bow: 1}
+    assert await api.counts(carol) == {sword: 1}
+    assert (await api.client.post("/trade_offer/clear")).json() == {"cycles": 0, "trade_offers": 0}
+
+
+async def test_cycle_with_a_missing_card_rolls_back(api):
+    alice, bob, carol = await api.profile("Alice"), await api.profile("Bob"), await api.profile("Carol")
+    sword, shield, bow = await api.card("Sword"), await api.card("Shield"), await api.card("Bow")
+    await api.give(alice, sword)
+    await api.give(carol, bow)
+
+    # Bob offers a shield he does not own, so his copy is missing when the cycle runs.
+    service = container.trade_offer_service()
+    await service.add_trade_offer(TradeOfferIn(profile_posted=alice, card_offered=sword, card_wanted=shield))
+    await service.add_trade_offer(TradeOfferIn(profile_posted=bob, card_offered=shield, card_wanted=bow))
+    await service.add_trade_offer(TradeOfferIn(profile_posted=carol, card_offered=bow, card_wanted=sword))
+
+    response = await api.client.post("/trade_offer/clear")
+
+    assert response.json() == {"cycles": 0, "trade_offers": 0}
+    assert await api.counts(alice) == {sword: 1}
+    assert await api.counts(bob) == {}
+    assert await api.counts(carol) == {bow: 1}
+    for pair in ((sword, shield), (shield, bow), (bow, sword)):
+        assert await api.depth(*pair) == 1
+
+
+async def test_failing_cycle_leaves_earlier_cycles_committed(api, monkeypatch):
+    alice, bob = await api.profile("Alice"), await api.profile("Bob")
+    dave, erin = await api.profile("Dave"), await api.profile("Erin")
+    sword, shield = await api.card("Sword"), await api.card("Shield")
+    axe, helm = await api.card("Axe"), await api.card("Helm")
+    await api.give(alice, sword)
+    await api.give(bob, shield)
+    await api.give(dave, axe)
+    await api.give(erin, helm)
+
+    service = container.trade_offer_service()
+    await service.add_trade_offer(TradeOfferIn(profile_posted=alice, card_offered=sword, card_wanted=shield))
+    await service.add_trade_offer(TradeOfferIn(profile_posted=bob, card_offered=shield, card_wanted=sword))
+    await service.add_trade_offer(TradeOfferIn(profile_posted=dave, card_offered=axe, card_wanted=helm))
+    await service.add_trade_offer(TradeOfferIn(profile_posted=erin, card_offered=helm, card_wanted=axe))
+
+    # Cycles run from the lowest card id up, so the sword cycle commits before the axe cycle fails.
+    transfer = ProfileCollectionService.transfer_profile_collection
+
+    async def failing_transfer(self, profile_from, profile_to, card_id):
+        if card_id == axe:
+            raise RuntimeError("transfer failed")
+        return await transfer(self, profile_from, profile_to, card_id)
+
+    monkeypatch.setattr(ProfileCollectionService, "transfer_profile_collection", failing_transfer)
+
+    with pytest.raises(RuntimeError):
+        await api.client.post("/trade_offer/clear")
+
+    monkeypatch.setattr(ProfileCollectionService, "transfer_profile_collection", transfer)
+    assert await api.counts(alice) == {shield: 1}
+    assert await api.counts(bob) == {sword: 1}
+    assert await api.counts(dave) == {axe: 1}
+    assert await api.counts(erin) == {helm: 1}
+    assert await api.depth(axe, helm) == 1
+
+
+async def test_hydrated_order_book_is_trusted_for_claims(api):
+    alice = await api.profile("Alice")
+    sword, shield = await api.card("Sword"), await api.card("Shield")
+    await api.give(alice, sword)
+
+    # Written past the order book, like an offer whose commit this process has not published yet.
+    repository = container.trade_offer_repository()
+    hidden = await repository.add_trade_offer(TradeOfferIn(profile_posted=alice, card_offered=sword, card_wanted=shield))
+
+    assert await container.trade_offer_service().claim_by_offer(sword, shield) is None
+
+    unhydrated = TradeOfferService(repository, TradeOrderBook(), container.transactions())
+    assert await unhydrated.claim_by_offer(sword, shield) == hidden
@@ -0,0 +1,79 @@
+"""Tests of the unit of work rolling back storage and the in-memory state mirroring it."""
+
+import pytest
+
+from card_collector.core.domains.card import CardIn
+from card_collector.core.domains.profile_collection import ProfileCollectionIn
+from card_collector.core.domains.trade_offer import TradeOfferIn
+from card_collector.main import container
+
+pytestmark = pytest.mark.anyio
+
+
+class Failure(Exception):
+    """An error failing the work of a test."""
+
+
+async def test_commit_keeps_the_writes(api):
+    async with container.unit_of_work():
+        card = await container.card_service().add_card(CardIn(name="Kept", rarity_id=1))
+
+    response = await api.client.get(f"/card/{card.id}")
+
+    assert response.status_code == 200
+    assert response.json() == {"id": card.id, "name": "Kept", "rarity_id": 1}
+
+
+async def test_rollback_discards_the_writes_and_the_cached_card(api):
+    service = container.card_service()
+
+    with pytest.raises(Failure):
+        async with container.unit_of_work():
+            card = await service.add_card(CardIn(name="Discarded", rarity_id=1))
+            assert await service.get_by_name("Discarded") == card
+            raise Failure
+
+    assert await service.get_by_name("Discarded") is None
+    assert (await api.client.get(f"/card/{card.id}")).status_code == 404
+    assert await api.card("Discarded")
+
+
+async def test_rollback_undoes_transactions_committed_inside_the_work(api):
+    profile_id = await api.profile("Collector")
+    card_id = await api.card("Strike")
+    quest = await api.quest(profile_id, cards_needed=5, reward=card_id)
+
+    with pytest.raises(Failure):
+        async with container.unit_of_work():
+            await container.profile_collection_service().add_many([
+                ProfileCollectionIn(profile_id=profile_id, card_id=card_id) for _ in range(3)
+            ])
+            raise Failure
+
+    assert await api.counts(profile_id) == {}
+    response = await api.client.get(f"/quest/{quest['id']}")
+    assert response.json()["cards_collected"] == 0
+
+
+async def test_rollback_withdraws_trade_offers_from_the_order_book(api):
+    profile_id = await api.profile("Trader")
+    offered, wanted = await api.card("Offered"), await api.card("Wanted")
+    await api.give(profile_id, offered)
+
+    with pytest.raises(Failure):
+        async with container.unit_of_work():
+            await container.trade_offer_service().add_trade_offer(
+                TradeOfferIn(profile_posted=profile_id, card_offered=offered, card_wanted=wanted)
+            )
+            raise Failure
+
+    assert await api.depth(offered, wanted) == 0
+
+    other = await api.profile("Other")
+    await api.give(other, wanted)
+    response = await api.offer(other, wanted, offered)
+
+    assert response.status_code == 201
+    assert response.json()["profile_posted"] == other
+    assert await api.counts(profile_id) == {offered: 1}
+    assert await api.counts(other) == {wanted: 1}